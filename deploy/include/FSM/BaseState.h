@@ -10,6 +10,8 @@
 
 inline boost::bimap<int, std::string> FSMStringMap;
 
+inline constexpr double CONTROL_DT = 0.001; // [s] period of the FSM control loop
+
 class BaseState
 {
 public:
@@ -7,6 +7,7 @@
 #include "BaseState.h"
 #include <spdlog/spdlog.h>
 #include <yaml-cpp/yaml.h>
+#include "isaaclab/utils/rt_stats.h"
 
 class CtrlFSM
 {
@@ -77,13 +78,16 @@ public:
 
     std::vector<std::shared_ptr<BaseState>> states;
 private:
-    const double dt = 0.001;
+    const double dt = CONTROL_DT;
 
     void run_()
     {
+        const auto t0 = std::chrono::steady_clock::now();
         currentState->pre_run();
         currentState->run();
         currentState->post_run();
+        loop_stats.record(std::chrono::duration_cast<std::chrono::nanoseconds>(
+            std::chrono::steady_clock::now() - t0 - std::chrono::duration<double>(dt)));
         
         // Check if need to change state
         int nextStateMode = 0;
@@ -103,6 +107,8 @@ private:
                 if(state->isState(nextStateMode))
                 {
                     spdlog::info("FSM: Change state from {} to {}", currentState->getStateString(), state->getStateString());
+                    loop_stats.report("FSM: State_" + currentState->getStateString() + " control loop");
+                    loop_stats.clear();
                     currentState->exit();
                     currentState = state;
                     currentState->enter();
@@ -114,4 +120,5 @@ private:
 
     std::shared_ptr<BaseState> currentState;
     unitree::common::RecurrentThreadPtr fsm_thread_;
+    isaaclab::LoopStats loop_stats;
 };
\ No newline at end of file
@@ -6,6 +6,71 @@
 #include "FSMState.h"
 #include "isaaclab/envs/mdp/actions/joint_actions.h"
 #include "isaaclab/envs/mdp/terminations.h"
+#include "isaaclab/utils/rt_stats.h"
+#include "unitree_replay.h"
+#include "LinearInterpolator.h"
+#include <ctime>
+
+/**
+ * Optional `timing` section of a policy state in config.yaml:
+ *   timing:
+ *     report_interval: 10.0  # [s] percentile summaries of the policy step, 0 to disable
+ *     trace: true            # dump log/timing_<state>_<date>.bin on exit
+ */
+inline void configure_timing(isaaclab::TimingRecorder & timing, const std::string & state_string)
+{
+    auto cfg = param::config["FSM"][state_string]["timing"];
+    timing.name = "State_" + state_string;
+    timing.report_interval = (cfg && cfg["report_interval"]) ? cfg["report_interval"].as<float>() : 10.0f;
+}
+
+inline std::string time_stamp()
+{
+    char stamp[32];
+    std::time_t now = std::time(nullptr);
+    std::strftime(stamp, sizeof(stamp), "%Y%m%d_%H%M%S", std::localtime(&now));
+    return stamp;
+}
+
+inline void finish_timing(isaaclab::TimingRecorder & timing, const std::string & state_string)
+{
+    timing.report();
+    auto cfg = param::config["FSM"][state_string]["timing"];
+    if (cfg && cfg["trace"] && cfg["trace"].as<bool>())
+    {
+        timing.dump(param::proj_dir / "log" / ("timing_" + state_string + "_" + time_stamp() + ".bin"));
+    }
+}
+
+/**
+ * `record: true` in a policy state of config.yaml writes the lowstate consumed by every
+ * policy step to log/lowstate_<state>_<date>.csv, see `unitree::LowStateRecorder`.
+ * Must be called right after `env->reset()`.
+ * The file can be replayed offline with deploy/tools/replay.
+ */
+inline std::unique_ptr<unitree::LowStateRecorder> make_lowstate_recorder(isaaclab::ManagerBasedRLEnv* env, const std::string & state_string)
+{
+    auto cfg = param::config["FSM"][state_string]["record"];
+    if (!cfg || !cfg.as<bool>()) return nullptr;
+
+    using Robot = unitree::BaseArticulation<LowState_t::SharedPtr>;
+    auto robot = dynamic_cast<Robot*>(env->robot.get());
+    if (robot == nullptr) return nullptr;
+    auto recorder = std::make_unique<unitree::LowStateRecorder>(
+        param::proj_dir / "log" / ("lowstate_" + state_string + "_" + time_stamp() + ".csv"),
+        robot->snapshot().q.size(), env->action_manager->total_action_dim()
+    );
+    recorder->write(robot->snapshot(), robot->lowstate->joystick, env->action_manager->action()); // reset state
+    return recorder;
+}
+
+inline void record_lowstate(unitree::LowStateRecorder* recorder, isaaclab::ManagerBasedRLEnv* env)
+{
+    if (recorder == nullptr) return;
+    using Robot = unitree::BaseArticulation<LowState_t::SharedPtr>;
+    auto robot = static_cast<Robot*>(env->robot.get());
+    recorder->write(robot->snapshot(), robot->lowstate->joystick, env->action_manager->action());
+}
 
 class State_RLBase : public FSMState
 {
@@ -23,7 +88,10 @@ public:
             lowcmd->msg_.motor_cmd()[i].tau() = 0;
         }
 
+        env->robot->sample();
         env->robot->update();
+        configure_timing(env->timing, getStateString());
+        action_interpolator.reset(env->action_manager->processed_actions(), std::lround(env->step_dt / CONTROL_DT));
         // Start policy thread
         policy_thread_running = true;
         policy_thread = std::thread([this]{
@@ -34,10 +102,13 @@ public:
             // Initialize timing
             auto sleepTill = clock::now() + dt;
             env->reset();
+            auto recorder = make_lowstate_recorder(env.get(), getStateString());
 
             while (policy_thread_running)
             {
                 env->step();
+                record_lowstate(recorder.get(), env.get());
+                policy_loop_stats.record(clock::now() - sleepTill);
 
                 // Sleep
                 std::this_thread::sleep_until(sleepTill);
@@ -46,7 +117,22 @@ public:
         });
     }
 
+    void pre_run()
+    {
+        FSMState::pre_run();
+        env->robot->sample();
+    }
+
     void run();
+
+    // Latest policy target, ramped at the control rate if `action_interpolation` is set in deploy.yaml.
+    const std::vector<float> & policy_action()
+    {
+        bool updated = false;
+        const auto & target = env->action_manager->processed_actions(&updated);
+        if (!env->action_interpolation) return target;
+        return action_interpolator.step(target, updated);
+    }
     
     void exit()
     {
@@ -54,13 +140,20 @@ public:
         if (policy_thread.joinable()) {
             policy_thread.join();
         }
+        env->robot->lock_stats.report("State_" + getStateString() + " lowstate");
+        env->robot->lock_stats.clear();
+        policy_loop_stats.report("State_" + getStateString() + " policy loop");
+        policy_loop_stats.clear();
+        finish_timing(env->timing, getStateString());
     }
 
 private:
     std::unique_ptr<isaaclab::ManagerBasedRLEnv> env;
 
     std::thread policy_thread;
-    bool policy_thread_running = false;
+    std::atomic<bool> policy_thread_running = false;
+    isaaclab::LoopStats policy_loop_stats;
+    ActionInterpolator action_interpolator;
 };
 
 REGISTER_FSM(State_RLBase)
@@ -5,6 +5,7 @@
 
 #include <vector>
 #include <cassert>
+#include <algorithm>
 
 inline std::vector<float> linear_interpolate(float t, const std::vector<float>& ts, const std::vector<std::vector<float>>& ys)
 {
@@ -29,3 +30,70 @@ inline std::vector<float> linear_interpolate(float t, const std::vector<float>&
     
     return std::vector<float>(ys[0].size(), 0.0f); // Fallback, should not reach here
 }
+
+
+/**
+ * Upsamples policy targets to the control rate.
+ *
+ * Every time a new target arrives, the output ramps linearly from where it currently is
+ * to the new target over `steps` control ticks, then holds it. The first target after
+ * `reset` is output as is: the target `reset` is seeded with (the zeros or the stale
+ * target of a previous run) is not a pose to ramp from. This relies on the first target
+ * being the one of the first policy step, `ActionManager::reset` does not publish.
+ * All buffers are sized in `reset`, `step` never allocates.
+ */
+class ActionInterpolator
+{
+public:
+    void reset(const std::vector<float>& target, int steps)
+    {
+        steps_ = std::max(steps, 1);
+        tick_ = steps_;
+        target_ = target;
+        delta_.assign(target.size(), 0.0f);
+        out_ = target;
+        started_ = false;
+    }
+
+    // `updated` marks that `target` was published since the previous tick.
+    const std::vector<float>& step(const std::vector<float>& target, bool updated)
+    {
+        assert(target.size() == out_.size());
+        if (updated && !started_)
+        {
+            // first policy target, jump to it
+            std::copy(target.begin(), target.end(), target_.begin());
+            std::copy(target.begin(), target.end(), out_.begin());
+            tick_ = steps_;
+            started_ = true;
+        }
+        else if (updated)
+        {
+            for (size_t j = 0; j < out_.size(); ++j)
+            {
+                target_[j] = target[j];
+                delta_[j] = (target[j] - out_[j]) / steps_;
+            }
+            tick_ = 0;
+        }
+
+        if (tick_ < steps_)
+        {
+            ++tick_;
+            if (tick_ == steps_) {
+                std::copy(target_.begin(), target_.end(), out_.begin()); // land exactly on the target
+            } else {
+                for (size_t j = 0; j < out_.size(); ++j) out_[j] += delta_[j];
+            }
+        }
+        return out_;
+    }
+
+private:
+    int steps_ = 1;
+    int tick_ = 1;
+    bool started_ = false;
+    std::vector<float> target_;
+    std::vector<float> delta_;
+    std::vector<float> out_;
+};
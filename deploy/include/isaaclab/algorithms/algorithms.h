@@ -5,7 +5,7 @@
 
 #include "onnxruntime_cxx_api.h"
 #include <iostream>
-#include <mutex>
+#include "isaaclab/utils/triple_buffer.h"
 
 namespace isaaclab
 {
@@ -15,15 +15,22 @@ class Algorithms
 public:
     virtual std::vector<float> act(std::unordered_map<std::string, std::vector<float>> obs) = 0;
 
+    // Latest action published by `act`, readable from one other thread without locking.
     std::vector<float> get_action()
     {
-        std::lock_guard<std::mutex> lock(act_mtx_);
-        return action;
+        action_buffer_.update();
+        return action_buffer_.read();
     }
     
     std::vector<float> action;
 protected:
-    std::mutex act_mtx_;
+    void publish_action()
+    {
+        action_buffer_.write_buffer() = action;
+        action_buffer_.publish();
+    }
+
+    TripleBuffer<std::vector<float>> action_buffer_;
 };
 
 class OrtRunner : public Algorithms
@@ -36,29 +43,17 @@ public:
         session_options.SetGraphOptimizationLevel(ORT_ENABLE_EXTENDED);
 
         session = std::make_unique<Ort::Session>(env, model_path.c_str(), session_options);
+        init_io_();
+    }
 
-        for (size_t i = 0; i < session->GetInputCount(); ++i) {
-            Ort::TypeInfo input_type = session->GetInputTypeInfo(i);
-            input_shapes.push_back(input_type.GetTensorTypeAndShapeInfo().GetShape());
-            auto input_name = session->GetInputNameAllocated(i, allocator);
-            input_names.push_back(input_name.release());
-        }
-
-        for (const auto& shape : input_shapes) {
-            size_t size = 1;
-            for (const auto& dim : shape) {
-                size *= dim;
-            }
-            input_sizes.push_back(size);
-        }
-
-        // Get output shape
-        Ort::TypeInfo output_type = session->GetOutputTypeInfo(0);
-        output_shape = output_type.GetTensorTypeAndShapeInfo().GetShape();
-        auto output_name = session->GetOutputNameAllocated(0, allocator);
-        output_names.push_back(output_name.release());
+    // Model already in memory, e.g. a section of a `PolicyBundle`. The data is only read during construction.
+    OrtRunner(const void* model_data, size_t model_size)
+    {
+        env = Ort::Env(ORT_LOGGING_LEVEL_WARNING, "onnx_model");
+        session_options.SetGraphOptimizationLevel(ORT_ENABLE_EXTENDED);
 
-        action.resize(output_shape[1]);
+        session = std::make_unique<Ort::Session>(env, model_data, model_size, session_options);
+        init_io_();
     }
 
     std::vector<float> act(std::unordered_map<std::string, std::vector<float>> obs)
@@ -87,11 +82,39 @@ public:
 
         // Copy output data
         auto floatarr = output_tensor.front().GetTensorMutableData<float>();
-        std::lock_guard<std::mutex> lock(act_mtx_);
         std::memcpy(action.data(), floatarr, output_shape[1] * sizeof(float));
+        publish_action();
         return action;
     }
 
+private:
+    void init_io_()
+    {
+        for (size_t i = 0; i < session->GetInputCount(); ++i) {
+            Ort::TypeInfo input_type = session->GetInputTypeInfo(i);
+            input_shapes.push_back(input_type.GetTensorTypeAndShapeInfo().GetShape());
+            auto input_name = session->GetInputNameAllocated(i, allocator);
+            input_names.push_back(input_name.release());
+        }
+
+        for (const auto& shape : input_shapes) {
+            size_t size = 1;
+            for (const auto& dim : shape) {
+                size *= dim;
+            }
+            input_sizes.push_back(size);
+        }
+
+        // Get output shape
+        Ort::TypeInfo output_type = session->GetOutputTypeInfo(0);
+        output_shape = output_type.GetTensorTypeAndShapeInfo().GetShape();
+        auto output_name = session->GetOutputNameAllocated(0, allocator);
+        output_names.push_back(output_name.release());
+
+        action.resize(output_shape[1]);
+        action_buffer_.reset(action);
+    }
+
 private:
     Ort::Env env;
     Ort::SessionOptions session_options;
@@ -5,6 +5,7 @@
 
 #include <eigen3/Eigen/Dense>
 #include "unitree/dds_wrapper/common/unitree_joystick.hpp"
+#include "isaaclab/utils/rt_stats.h"
 
 namespace isaaclab
 {
@@ -46,9 +47,14 @@ class Articulation
 public:
     Articulation(){}
 
+    // Copy the latest hardware state into a snapshot. Called by the control loop.
+    virtual void sample(){};
+
+    // Refresh `data` from the latest snapshot. Called by the policy loop.
     virtual void update(){};
 
     ArticulationData data;
+    LockStats lock_stats; // time `sample()` waited for the hardware state
 };
 
 };
\ No newline at end of file
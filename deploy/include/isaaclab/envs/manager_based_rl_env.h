@@ -11,6 +11,8 @@
 #include "isaaclab/algorithms/algorithms.h"
 #include <iostream>
 #include "isaaclab/utils/utils.h"
+#include "isaaclab/utils/timing_recorder.h"
+#include "isaaclab/utils/policy_bundle.h"
 
 namespace isaaclab
 {
@@ -27,6 +29,8 @@ public:
     {
         // Parse configuration
         this->step_dt = cfg["step_dt"].as<float>();
+        this->action_interpolation = cfg["action_interpolation"] && cfg["action_interpolation"].as<bool>();
+        timing.budget = step_dt;
         robot->data.joint_ids_map = cfg["joint_ids_map"].as<std::vector<float>>();
         robot->data.joint_pos.resize(robot->data.joint_ids_map.size());
         robot->data.joint_vel.resize(robot->data.joint_ids_map.size());
@@ -51,6 +55,7 @@ public:
     {
         global_phase = 0;
         episode_length = 0;
+        timing.reset();
         robot->update();
         action_manager->reset();
         observation_manager->reset();
@@ -59,13 +64,20 @@ public:
     void step()
     {
         episode_length += 1;
+        timing.begin();
         robot->update();
-        auto obs = observation_manager->compute();
+        timing.mark(TimingRecorder::UPDATE);
+        obs = observation_manager->compute();
+        timing.mark(TimingRecorder::OBSERVATION);
         auto action = alg->act(obs);
+        timing.mark(TimingRecorder::INFERENCE);
         action_manager->process_action(action);
+        timing.mark(TimingRecorder::ACTION);
+        timing.end();
     }
 
     float step_dt;
+    bool action_interpolation = false; // ramp between policy targets at the control rate
     
     YAML::Node cfg;
 
@@ -73,8 +85,60 @@ public:
     std::unique_ptr<ActionManager> action_manager;
     std::shared_ptr<Articulation> robot;
     std::unique_ptr<Algorithms> alg;
+    std::unordered_map<std::string, std::vector<float>> obs; // observations of the last step
     long episode_length = 0;
     float global_phase = 0.0f;
+
+    TimingRecorder timing; // stage timings of `step()`
+    std::shared_ptr<PolicyBundle> bundle; // set when loaded from a policy bundle, keeps its sections mapped
 };
 
+/**
+ * `exported/policy.bundle` of a policy directory, or nullptr if the policy was not bundled
+ * or if `params/deploy.yaml` or `exported/policy.onnx` was modified after the bundle was built:
+ * the policy is then loaded from the separate files, so that editing them is never silently ignored.
+ * The bundle keeps deploy config, graph and motion of one export together, see `PolicyBundle`.
+ */
+inline std::shared_ptr<PolicyBundle> load_policy_bundle(const std::filesystem::path & policy_dir)
+{
+    const auto bundle_path = policy_dir / "exported" / "policy.bundle";
+    if (!std::filesystem::exists(bundle_path)) return nullptr;
+
+    for (const auto & file : {policy_dir / "params" / "deploy.yaml", policy_dir / "exported" / "policy.onnx"})
+    {
+        if (std::filesystem::exists(file) && std::filesystem::last_write_time(file) > std::filesystem::last_write_time(bundle_path)) {
+            spdlog::warn("{} is newer than {}, ignoring the bundle. Rebuild it to deploy the bundle.", file.string(), bundle_path.string());
+            return nullptr;
+        }
+    }
+    return std::make_shared<PolicyBundle>(bundle_path);
+}
+
+/**
+ * Load a policy into a new env, from `bundle` if given, otherwise from
+ * `params/deploy.yaml` and `exported/policy.onnx` of `policy_dir`.
+ */
+inline std::unique_ptr<ManagerBasedRLEnv> make_policy_env(
+    const std::filesystem::path & policy_dir, std::shared_ptr<Articulation> robot, std::shared_ptr<PolicyBundle> bundle)
+{
+    if (!bundle)
+    {
+        auto env = std::make_unique<ManagerBasedRLEnv>(YAML::LoadFile(policy_dir / "params" / "deploy.yaml"), robot);
+        env->alg = std::make_unique<OrtRunner>(policy_dir / "exported" / "policy.onnx");
+        return env;
+    }
+
+    auto env = std::make_unique<ManagerBasedRLEnv>(YAML::Load(std::string(bundle->section("deploy.yaml"))), robot);
+    const auto model = bundle->section("policy.onnx");
+    env->alg = std::make_unique<OrtRunner>(model.data(), model.size());
+    env->bundle = std::move(bundle);
+    return env;
+}
+
+// Load the policy of `policy_dir`, preferring `exported/policy.bundle` when present.
+inline std::unique_ptr<ManagerBasedRLEnv> make_policy_env(const std::filesystem::path & policy_dir, std::shared_ptr<Articulation> robot)
+{
+    return make_policy_env(policy_dir, std::move(robot), load_policy_bundle(policy_dir));
+}
+
 };
\ No newline at end of file
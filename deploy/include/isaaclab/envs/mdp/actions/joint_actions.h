@@ -4,6 +4,7 @@
 #pragma once
 
 #include <eigen3/Eigen/Dense>
+#include <limits>
 #include <yaml-cpp/yaml.h>
 #include "isaaclab/envs/manager_based_rl_env.h"
 #include "isaaclab/manager/action_manager.h"
@@ -25,38 +26,39 @@ public:
         }
         _raw_actions.resize(_action_dim, 0.0f);
         _processed_actions.resize(_action_dim, 0.0f);
+
+        // missing entries fall back to the identity, so processing is the same expression for all joints
+        _scale = Eigen::ArrayXf::Ones(_action_dim);
+        _offset = Eigen::ArrayXf::Zero(_action_dim);
+        _clip_lo = Eigen::ArrayXf::Constant(_action_dim, -std::numeric_limits<float>::infinity());
+        _clip_hi = Eigen::ArrayXf::Constant(_action_dim, std::numeric_limits<float>::infinity());
         if(!cfg["scale"].IsNull()) {
-            _scale = cfg["scale"].as<std::vector<float>>();
+            auto scale = cfg["scale"].as<std::vector<float>>();
+            _check_size("scale", scale.size());
+            _scale = Eigen::ArrayXf::Map(scale.data(), scale.size());
         }
         if(!cfg["offset"].IsNull()) {
-            _offset = cfg["offset"].as<std::vector<float>>();
+            auto offset = cfg["offset"].as<std::vector<float>>();
+            _check_size("offset", offset.size());
+            _offset = Eigen::ArrayXf::Map(offset.data(), offset.size());
         }
         if(!cfg["clip"].IsNull()) {
-            _clip = cfg["clip"].as<std::vector<std::vector<float> >>();
+            auto clip = cfg["clip"].as<std::vector<std::vector<float> >>();
+            _check_size("clip", clip.size());
+            for(int i(0); i<_action_dim; ++i) {
+                _clip_lo[i] = clip[i][0];
+                _clip_hi[i] = clip[i][1];
+            }
         }
     }
 
-    virtual void process_actions(std::vector<float> actions)
+    virtual void process_actions(const Eigen::Ref<const Eigen::ArrayXf> & actions)
     {
         // TODO: modify action by joint_ids
-        _raw_actions = actions;
-        for(int i(0); i<_action_dim; ++i)
-        {
-            if(!_scale.empty()) {
-                _processed_actions[i] = _raw_actions[i] * _scale[i];
-            } else {
-                _processed_actions[i] = _raw_actions[i];
-            }
-            if(!_offset.empty()) {
-                _processed_actions[i] += _offset[i];
-            }
-        }
-        if(!_clip.empty())
-        {
-            for(int i(0); i<_action_dim; ++i) {
-                _processed_actions[i] = std::clamp(_processed_actions[i], _clip[i][0], _clip[i][1]);
-            }
-        }
+        Eigen::Map<Eigen::ArrayXf> raw(_raw_actions.data(), _action_dim);
+        Eigen::Map<Eigen::ArrayXf> processed(_processed_actions.data(), _action_dim);
+        raw = actions;
+        processed = (raw * _scale + _offset).max(_clip_lo).min(_clip_hi);
     }
 
 
@@ -65,12 +67,12 @@ public:
         return _action_dim;
     }
 
-    std::vector<float> raw_actions() 
+    const std::vector<float> & raw_actions() 
     {
         return _raw_actions;
     }
     
-    std::vector<float> processed_actions() 
+    const std::vector<float> & processed_actions() 
     {
         return _processed_actions;
     }
@@ -87,9 +89,19 @@ protected:
     std::vector<float> _raw_actions;
     std::vector<float> _processed_actions;
 
-    std::vector<float> _scale;
-    std::vector<float> _offset;
-    std::vector<std::vector<float> > _clip;
+    Eigen::ArrayXf _scale;
+    Eigen::ArrayXf _offset;
+    Eigen::ArrayXf _clip_lo;
+    Eigen::ArrayXf _clip_hi;
+
+private:
+    void _check_size(const std::string & name, size_t size)
+    {
+        if(size != _action_dim) {
+            throw std::runtime_error("JointAction: '" + name + "' has " + std::to_string(size) +
+                " entries, expected " + std::to_string(_action_dim) + ".");
+        }
+    }
 };
 
 
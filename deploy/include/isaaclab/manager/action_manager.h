@@ -5,7 +5,9 @@
 
 #include "isaaclab/envs/manager_based_rl_env.h"
 #include "isaaclab/manager/manager_term_cfg.h"
+#include "isaaclab/utils/triple_buffer.h"
 #include <numeric>
+#include <eigen3/Eigen/Dense>
 
 namespace isaaclab
 {
@@ -16,9 +18,9 @@ public:
     ActionTerm(YAML::Node cfg, ManagerBasedRLEnv* env): cfg(cfg), env(env) {}
 
     virtual int action_dim() = 0;
-    virtual std::vector<float> raw_actions() = 0;
-    virtual std::vector<float> processed_actions() = 0;
-    virtual void process_actions(std::vector<float> actions) = 0;
+    virtual const std::vector<float> & raw_actions() = 0;
+    virtual const std::vector<float> & processed_actions() = 0;
+    virtual void process_actions(const Eigen::Ref<const Eigen::ArrayXf> & actions) = 0;
     virtual void reset(){};
 
 protected:
@@ -48,8 +50,11 @@ public:
     {
         _prepare_terms();
         _action.resize(total_action_dim(), 0.0f);
+        _processed_actions.reset(_gather_processed_actions());
     }
 
+    // Does not publish: the processed actions are unchanged until the next `process_action`,
+    // which is the first target of the episode for the control loop.
     void reset()
     {
         _action.assign(total_action_dim(), 0.0f);
@@ -59,32 +64,34 @@ public:
         }
     }
 
-    std::vector<float> action()
+    const std::vector<float> & action()
     {
         return _action;
     }
 
-    std::vector<float> processed_actions()
+    /**
+     * Latest processed actions published by the policy thread.
+     * Lock-free; must only be called from a single consumer thread (the control loop).
+     * The reference stays valid until the next call. `updated` is set if a new step was published since.
+     */
+    const std::vector<float> & processed_actions(bool* updated = nullptr)
     {
-        std::vector<float> actions;
-        for(auto & term : _terms)
-        {
-            auto term_action = term->processed_actions();
-            actions.insert(actions.end(), term_action.begin(), term_action.end());
-        }
-        return actions;
+        bool fresh = _processed_actions.update();
+        if(updated) *updated = fresh;
+        return _processed_actions.read();
     }
 
-    void process_action(std::vector<float> action)
+    void process_action(const std::vector<float> & action)
     {
         _action = action;
+        Eigen::Map<const Eigen::ArrayXf> actions(_action.data(), _action.size());
         int idx = 0;
         for(auto & term : _terms)
         {
-            auto term_action = std::vector<float>(action.begin() + idx, action.begin() + idx + term->action_dim());
-            term->process_actions(term_action);
+            term->process_actions(actions.segment(idx, term->action_dim()));
             idx += term->action_dim();
         }
+        _publish_processed_actions();
     }
 
     int total_action_dim()
@@ -123,8 +130,32 @@ private:
         }
     }
 
+    std::vector<float> _gather_processed_actions()
+    {
+        std::vector<float> actions;
+        for(auto & term : _terms)
+        {
+            const auto & term_action = term->processed_actions();
+            actions.insert(actions.end(), term_action.begin(), term_action.end());
+        }
+        return actions;
+    }
+
+    void _publish_processed_actions()
+    {
+        auto & buffer = _processed_actions.write_buffer();
+        auto it = buffer.begin();
+        for(auto & term : _terms)
+        {
+            const auto & term_action = term->processed_actions();
+            it = std::copy(term_action.begin(), term_action.end(), it);
+        }
+        _processed_actions.publish();
+    }
+
     std::vector<float> _action;
     std::vector<std::unique_ptr<ActionTerm>> _terms;
+    TripleBuffer<std::vector<float>> _processed_actions;
 };
 
 };
\ No newline at end of file
@@ -0,0 +1,162 @@
+// Copyright (c) 2025, Unitree Robotics Co., Ltd.
+// All rights reserved.
+
+#pragma once
+
+#include <array>
+#include <cstdint>
+#include <cstring>
+#include <filesystem>
+#include <stdexcept>
+#include <string>
+#include <string_view>
+#include <unordered_map>
+#include <fcntl.h>
+#include <sys/mman.h>
+#include <sys/stat.h>
+#include <unistd.h>
+#include <spdlog/spdlog.h>
+
+namespace isaaclab
+{
+
+inline uint32_t crc32(const void* data, size_t size)
+{
+    static const auto table = [] {
+        std::array<uint32_t, 256> t{};
+        for (uint32_t i = 0; i < 256; ++i) {
+            uint32_t c = i;
+            for (int k = 0; k < 8; ++k) c = (c & 1) ? 0xEDB88320u ^ (c >> 1) : c >> 1;
+            t[i] = c;
+        }
+        return t;
+    }();
+    uint32_t crc = 0xFFFFFFFFu;
+    auto p = static_cast<const uint8_t*>(data);
+    for (size_t i = 0; i < size; ++i) crc = table[(crc ^ p[i]) & 0xFF] ^ (crc >> 8);
+    return crc ^ 0xFFFFFFFFu;
+}
+
+/**
+ * Read-only view of a policy bundle written by `unitree_rl_lab/utils/policy_bundle.py`.
+ *
+ * Layout (little endian):
+ *     header   64 bytes: char[8] "URLBNDL", uint32 version, uint32 num_sections, uint64 file_size,
+ *                        uint32 crc32 of the section table, zero padding
+ *     table    num_sections x 64 bytes: char[40] name, uint64 offset, uint64 size, uint32 crc32, uint32 reserved
+ *     sections each aligned to 64 bytes
+ *
+ * The whole file is mapped once; `section()` returns views into the mapping,
+ * valid as long as the bundle is alive. All checksums are verified on load.
+ */
+class PolicyBundle
+{
+public:
+    static constexpr uint32_t VERSION = 1;
+
+    explicit PolicyBundle(const std::filesystem::path & path)
+    : path_(path)
+    {
+        int fd = ::open(path.c_str(), O_RDONLY);
+        if (fd < 0) {
+            throw std::runtime_error("PolicyBundle: cannot open " + path.string());
+        }
+        struct stat st;
+        if (::fstat(fd, &st) != 0 || st.st_size < HEADER_SIZE) {
+            ::close(fd);
+            throw std::runtime_error("PolicyBundle: " + path.string() + " is too small");
+        }
+        size_ = st.st_size;
+        void* addr = ::mmap(nullptr, size_, PROT_READ, MAP_PRIVATE, fd, 0);
+        ::close(fd);
+        if (addr == MAP_FAILED) {
+            throw std::runtime_error("PolicyBundle: cannot map " + path.string());
+        }
+        data_ = static_cast<const char*>(addr);
+
+        try {
+            parse_();
+        } catch (...) {
+            ::munmap(const_cast<char*>(data_), size_);
+            throw;
+        }
+        spdlog::info("Loaded policy bundle {} ({} sections, {:.1f} KiB)", path.string(), sections_.size(), size_ / 1024.0);
+    }
+
+    ~PolicyBundle()
+    {
+        if (data_) ::munmap(const_cast<char*>(data_), size_);
+    }
+
+    PolicyBundle(const PolicyBundle&) = delete;
+    PolicyBundle& operator=(const PolicyBundle&) = delete;
+
+    bool has(const std::string & name) const { return sections_.count(name) > 0; }
+
+    std::string_view section(const std::string & name) const
+    {
+        auto it = sections_.find(name);
+        if (it == sections_.end()) {
+            throw std::runtime_error("PolicyBundle: " + path_.string() + " has no section '" + name + "'");
+        }
+        return it->second;
+    }
+
+    const std::filesystem::path & path() const { return path_; }
+
+private:
+    static constexpr size_t HEADER_SIZE = 64;
+    static constexpr size_t ENTRY_SIZE = 64;
+    static constexpr size_t NAME_SIZE = 40;
+
+    template <typename T>
+    T read_(size_t offset) const
+    {
+        T value;
+        std::memcpy(&value, data_ + offset, sizeof(T));
+        return value;
+    }
+
+    void parse_()
+    {
+        if (std::memcmp(data_, "URLBNDL\0", 8) != 0) {
+            throw std::runtime_error("PolicyBundle: " + path_.string() + " is not a policy bundle");
+        }
+        const auto version = read_<uint32_t>(8);
+        if (version != VERSION) {
+            throw std::runtime_error("PolicyBundle: unsupported version " + std::to_string(version));
+        }
+        const auto num_sections = read_<uint32_t>(12);
+        const auto file_size = read_<uint64_t>(16);
+        const auto table_crc = read_<uint32_t>(24);
+        if (file_size != size_ || HEADER_SIZE + num_sections * ENTRY_SIZE > size_) {
+            throw std::runtime_error("PolicyBundle: " + path_.string() + " is truncated");
+        }
+        if (crc32(data_ + HEADER_SIZE, num_sections * ENTRY_SIZE) != table_crc) {
+            throw std::runtime_error("PolicyBundle: corrupted section table in " + path_.string());
+        }
+
+        for (uint32_t i = 0; i < num_sections; ++i)
+        {
+            const size_t entry = HEADER_SIZE + i * ENTRY_SIZE;
+            std::string name(data_ + entry, strnlen(data_ + entry, NAME_SIZE));
+            const auto offset = read_<uint64_t>(entry + NAME_SIZE);
+            const auto size = read_<uint64_t>(entry + NAME_SIZE + 8);
+            const auto crc = read_<uint32_t>(entry + NAME_SIZE + 16);
+            if (offset > size_ || size > size_ - offset) {
+                throw std::runtime_error("PolicyBundle: section '" + name + "' is out of bounds");
+            }
+            if (crc32(data_ + offset, size) != crc) {
+                throw std::runtime_error("PolicyBundle: checksum mismatch in section '" + name + "'");
+            }
+            sections_.emplace(name, std::string_view(data_ + offset, size));
+        }
+    }
+
+    std::filesystem::path path_;
+    const char* data_ = nullptr;
+    size_t size_ = 0;
+    std::unordered_map<std::string, std::string_view> sections_;
+};
+
+};
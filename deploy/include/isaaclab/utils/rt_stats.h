@@ -0,0 +1,90 @@
+// Copyright (c) 2025, Unitree Robotics Co., Ltd.
+// All rights reserved.
+
+#pragma once
+
+#include <atomic>
+#include <chrono>
+#include <cstdint>
+#include <string>
+#include <spdlog/spdlog.h>
+
+namespace isaaclab
+{
+
+inline void atomic_max(std::atomic<uint64_t>& target, uint64_t value)
+{
+    uint64_t prev = target.load(std::memory_order_relaxed);
+    while (prev < value && !target.compare_exchange_weak(prev, value, std::memory_order_relaxed)) {}
+}
+
+// Time spent waiting for a mutex. Updated by one thread, may be reported from any thread.
+struct LockStats
+{
+    std::atomic<uint64_t> count{0};
+    std::atomic<uint64_t> total_ns{0};
+    std::atomic<uint64_t> max_ns{0};
+
+    void record(std::chrono::nanoseconds wait)
+    {
+        const uint64_t ns = wait.count() > 0 ? wait.count() : 0;
+        count.fetch_add(1, std::memory_order_relaxed);
+        total_ns.fetch_add(ns, std::memory_order_relaxed);
+        atomic_max(max_ns, ns);
+    }
+
+    void report(const std::string& name) const
+    {
+        const uint64_t n = count.load(std::memory_order_relaxed);
+        if (n == 0) return;
+        spdlog::info("{}: lock wait mean {:.2f}us, max {:.2f}us over {} acquisitions",
+            name, total_ns.load(std::memory_order_relaxed) / 1e3 / n, max_ns.load(std::memory_order_relaxed) / 1e3, n);
+    }
+
+    void clear()
+    {
+        count = 0;
+        total_ns = 0;
+        max_ns = 0;
+    }
+};
+
+// Periodic loop deadline misses.
+struct LoopStats
+{
+    std::atomic<uint64_t> cycles{0};
+    std::atomic<uint64_t> overruns{0};
+    std::atomic<uint64_t> max_late_ns{0};
+
+    // `late` is how far the loop body ran past its deadline; non-positive means on time.
+    void record(std::chrono::nanoseconds late)
+    {
+        cycles.fetch_add(1, std::memory_order_relaxed);
+        if (late.count() > 0) {
+            overruns.fetch_add(1, std::memory_order_relaxed);
+            atomic_max(max_late_ns, late.count());
+        }
+    }
+
+    void report(const std::string& name) const
+    {
+        const uint64_t n = cycles.load(std::memory_order_relaxed);
+        if (n == 0) return;
+        const uint64_t m = overruns.load(std::memory_order_relaxed);
+        if (m == 0) {
+            spdlog::info("{}: {} cycles, no overrun", name, n);
+        } else {
+            spdlog::warn("{}: {} / {} cycles overran ({:.2f}%), worst {:.2f}ms late",
+                name, m, n, 100.0 * m / n, max_late_ns.load(std::memory_order_relaxed) / 1e6);
+        }
+    }
+
+    void clear()
+    {
+        cycles = 0;
+        overruns = 0;
+        max_late_ns = 0;
+    }
+};
+
+};
@@ -0,0 +1,219 @@
+// Copyright (c) 2025, Unitree Robotics Co., Ltd.
+// All rights reserved.
+
+#pragma once
+
+#include <algorithm>
+#include <array>
+#include <chrono>
+#include <cstdint>
+#include <cstring>
+#include <filesystem>
+#include <fstream>
+#include <string>
+#include <vector>
+#include <spdlog/spdlog.h>
+
+namespace isaaclab
+{
+
+/**
+ * Per-step stage timings of the policy loop, kept in a preallocated ring.
+ *
+ * Usage (one thread):
+ *     begin(); ...; mark(UPDATE); ...; mark(OBSERVATION); ...; mark(INFERENCE); ...; mark(ACTION); end();
+ *
+ * `end()` prints p50/p90/p99/max summaries every `report_interval` seconds and
+ * `dump()` writes the ring to a binary trace:
+ *     char[8]  magic "URLTIME"
+ *     uint32   version, num_stages
+ *     float    budget [s]
+ *     uint32   reserved
+ *     char[16] stage names x num_stages
+ *     uint64   num_samples
+ *     Sample   samples x num_samples (oldest first, little endian, 32 bytes each)
+ * which numpy reads with
+ *     np.dtype([("start_ns", "<i8"), ("period_ns", "<u4"), ("stage_ns", "<u4", (4,)), ("reserved", "<u4")])
+ */
+class TimingRecorder
+{
+public:
+    enum Stage : uint32_t { UPDATE = 0, OBSERVATION, INFERENCE, ACTION, NUM_STAGES };
+
+    struct Sample
+    {
+        int64_t start_ns;               // step start, relative to the recorder epoch
+        uint32_t period_ns;             // time since the previous step start, 0 for the first step
+        uint32_t stage_ns[NUM_STAGES];  // duration of each stage
+        uint32_t reserved;
+    };
+    static_assert(sizeof(Sample) == 32, "TimingRecorder::Sample layout is part of the trace format");
+
+    static constexpr const char* STAGE_NAMES[NUM_STAGES] = {"update", "observation", "inference", "action"};
+    // Upper edges of the step time histogram, as a fraction of the budget. The last bucket is open.
+    static constexpr std::array<float, 7> HISTOGRAM_EDGES = {0.25f, 0.5f, 0.75f, 0.9f, 1.0f, 1.5f, 2.0f};
+
+    TimingRecorder(size_t capacity = 1 << 15)
+    : samples_(capacity), scratch_(capacity)
+    {
+        reset();
+    }
+
+    void reset()
+    {
+        epoch_ = clock::now();
+        last_report_ = epoch_;
+        count_ = 0;
+        reported_ = 0;
+        overruns_ = 0;
+        histogram_.fill(0);
+    }
+
+    void begin()
+    {
+        const auto now = clock::now();
+        auto & s = samples_[count_ % samples_.size()];
+        s.start_ns = std::chrono::duration_cast<std::chrono::nanoseconds>(now - epoch_).count();
+        s.period_ns = count_ > 0 ? s.start_ns - samples_[(count_ - 1) % samples_.size()].start_ns : 0;
+        std::fill(std::begin(s.stage_ns), std::end(s.stage_ns), 0);
+        s.reserved = 0;
+        stage_start_ = now;
+    }
+
+    void mark(Stage stage)
+    {
+        const auto now = clock::now();
+        samples_[count_ % samples_.size()].stage_ns[stage] =
+            std::chrono::duration_cast<std::chrono::nanoseconds>(now - stage_start_).count();
+        stage_start_ = now;
+    }
+
+    void end()
+    {
+        const auto & s = samples_[count_ % samples_.size()];
+        const float used = total_ns_(s) * 1e-9f / budget;
+        const auto bucket = std::upper_bound(HISTOGRAM_EDGES.begin(), HISTOGRAM_EDGES.end(), used) - HISTOGRAM_EDGES.begin();
+        histogram_[bucket]++;
+        if (used > 1.0f) overruns_++;
+        count_++;
+
+        if (report_interval > 0 && stage_start_ - last_report_ >= std::chrono::duration<double>(report_interval)) {
+            report();
+        }
+    }
+
+    // Percentile summary of the steps recorded since the last report.
+    void report()
+    {
+        last_report_ = clock::now();
+        const uint64_t first = std::max(reported_, count_ > samples_.size() ? count_ - samples_.size() : 0);
+        const size_t n = count_ - first;
+        reported_ = count_;
+        if (n == 0) return;
+
+        std::string msg = fmt::format("{}: {} steps, budget {:.1f}ms, {} overruns in total | p50/p90/p99/max", name, n, budget * 1e3, overruns_);
+        for (uint32_t k = 0; k < NUM_STAGES; ++k) {
+            msg += summarize_(STAGE_NAMES[k], first, n, [k](const Sample & s) { return s.stage_ns[k]; });
+        }
+        msg += summarize_("total", first, n, [](const Sample & s) { return total_ns_(s); });
+        msg += summarize_("period", first, n, [](const Sample & s) { return s.period_ns; });
+        spdlog::info(msg);
+
+        std::string hist = fmt::format("{}: step time / budget histogram |", name);
+        for (size_t i = 0; i < histogram_.size(); ++i) {
+            if (i < HISTOGRAM_EDGES.size()) {
+                hist += fmt::format(" <{:.0f}%: {}", HISTOGRAM_EDGES[i] * 100, histogram_[i]);
+            } else {
+                hist += fmt::format(" >{:.0f}%: {}", HISTOGRAM_EDGES.back() * 100, histogram_[i]);
+            }
+        }
+        if (overruns_ > 0) {
+            spdlog::warn(hist);
+        } else {
+            spdlog::info(hist);
+        }
+    }
+
+    // Write the samples still in the ring to `path`. Not real-time safe; call after the loop stopped.
+    bool dump(const std::filesystem::path & path) const
+    {
+        if (path.has_parent_path()) {
+            std::filesystem::create_directories(path.parent_path());
+        }
+        std::ofstream file(path, std::ios::binary);
+        if (!file.is_open()) {
+            spdlog::error("Failed to open timing trace file: {}", path.string());
+            return false;
+        }
+
+        const uint64_t first = count_ > samples_.size() ? count_ - samples_.size() : 0;
+        const uint64_t n = count_ - first;
+
+        const char magic[8] = "URLTIME";
+        const uint32_t header[2] = {1, NUM_STAGES};
+        const uint32_t reserved = 0;
+        file.write(magic, sizeof(magic));
+        file.write(reinterpret_cast<const char*>(header), sizeof(header));
+        file.write(reinterpret_cast<const char*>(&budget), sizeof(budget));
+        file.write(reinterpret_cast<const char*>(&reserved), sizeof(reserved));
+        for (uint32_t k = 0; k < NUM_STAGES; ++k) {
+            char stage_name[16] = {};
+            std::strncpy(stage_name, STAGE_NAMES[k], sizeof(stage_name) - 1);
+            file.write(stage_name, sizeof(stage_name));
+        }
+        file.write(reinterpret_cast<const char*>(&n), sizeof(n));
+        for (uint64_t i = first; i < count_; ++i) {
+            file.write(reinterpret_cast<const char*>(&samples_[i % samples_.size()]), sizeof(Sample));
+        }
+        spdlog::info("{}: wrote {} timing samples to {}", name, n, path.string());
+        return true;
+    }
+
+    uint64_t count() const { return count_; }
+    uint64_t overruns() const { return overruns_; }
+
+    std::string name = "timing";
+    float budget = 0.02f;         // [s] step deadline
+    float report_interval = 0.0f; // [s] 0 disables periodic summaries
+
+private:
+    using clock = std::chrono::steady_clock;
+
+    static uint32_t total_ns_(const Sample & s)
+    {
+        uint32_t total = 0;
+        for (auto t : s.stage_ns) total += t;
+        return total;
+    }
+
+    template <typename F>
+    std::string summarize_(const char* label, uint64_t first, size_t n, F value)
+    {
+        for (size_t i = 0; i < n; ++i) {
+            scratch_[i] = value(samples_[(first + i) % samples_.size()]);
+        }
+        auto percentile = [&](float p) {
+            auto it = scratch_.begin() + std::min<size_t>(n - 1, static_cast<size_t>(p * n));
+            std::nth_element(scratch_.begin(), it, scratch_.begin() + n);
+            return *it * 1e-3f;
+        };
+        const float p50 = percentile(0.5f);
+        const float p90 = percentile(0.9f);
+        const float p99 = percentile(0.99f);
+        const float max = *std::max_element(scratch_.begin(), scratch_.begin() + n) * 1e-3f;
+        return fmt::format(" {} {:.0f}/{:.0f}/{:.0f}/{:.0f}us", label, p50, p90, p99, max);
+    }
+
+    std::vector<Sample> samples_;
+    std::vector<uint32_t> scratch_;
+    std::array<uint64_t, HISTOGRAM_EDGES.size() + 1> histogram_{};
+
+    clock::time_point epoch_;
+    clock::time_point stage_start_;
+    clock::time_point last_report_;
+    uint64_t count_ = 0;
+    uint64_t reported_ = 0;
+    uint64_t overruns_ = 0;
+};
+
+};
@@ -0,0 +1,70 @@
+// Copyright (c) 2025, Unitree Robotics Co., Ltd.
+// All rights reserved.
+
+#pragma once
+
+#include <array>
+#include <atomic>
+#include <cstdint>
+
+namespace isaaclab
+{
+
+/**
+ * Wait-free single-producer / single-consumer exchange.
+ *
+ * The producer fills `write_buffer()` and calls `publish()`; the consumer calls `update()`
+ * to grab the latest published value and reads it through `read()`. Neither side ever blocks,
+ * the consumer simply keeps the previous value if nothing new was published.
+ */
+template <typename T>
+class TripleBuffer
+{
+public:
+    TripleBuffer() = default;
+    explicit TripleBuffer(const T& init) { reset(init); }
+
+    TripleBuffer(const TripleBuffer&) = delete;
+    TripleBuffer& operator=(const TripleBuffer&) = delete;
+
+    // Fill all slots with `init`. Not thread-safe, only call before the threads are started.
+    void reset(const T& init)
+    {
+        buffers_.fill(init);
+        write_ = 0;
+        middle_.store(1, std::memory_order_relaxed);
+        read_ = 2;
+    }
+
+    /* ---------- producer ---------- */
+    T& write_buffer() { return buffers_[write_]; }
+
+    void publish()
+    {
+        write_ = middle_.exchange(write_ | FRESH, std::memory_order_acq_rel) & INDEX;
+    }
+
+    /* ---------- consumer ---------- */
+    // Returns true if a new value was published since the last call.
+    bool update()
+    {
+        if (!(middle_.load(std::memory_order_relaxed) & FRESH)) {
+            return false;
+        }
+        read_ = middle_.exchange(read_, std::memory_order_acq_rel) & INDEX;
+        return true;
+    }
+
+    const T& read() const { return buffers_[read_]; }
+
+private:
+    static constexpr uint8_t INDEX = 0x3;
+    static constexpr uint8_t FRESH = 0x4;
+
+    std::array<T, 3> buffers_{};
+    uint8_t write_ = 0;
+    std::atomic<uint8_t> middle_{1};
+    uint8_t read_ = 2;
+};
+
+};
@@ -3,11 +3,24 @@
 
 #pragma once
 
+#include <array>
+#include <chrono>
+#include <mutex>
 #include "isaaclab/assets/articulation/articulation.h"
+#include "isaaclab/utils/triple_buffer.h"
 
 namespace unitree
 {
 
+// Copy of the lowstate fields used by the policy, in sdk order.
+struct LowStateSnapshot
+{
+    std::array<float, 3> gyroscope{};
+    std::array<float, 4> quaternion{1.0f, 0.0f, 0.0f, 0.0f}; // w, x, y, z
+    std::vector<float> q;
+    std::vector<float> dq;
+};
+
 template <typename LowStatePtr>
 class BaseArticulation : public isaaclab::Articulation
 {
@@ -16,31 +29,72 @@ public:
     : lowstate(lowstate_)
     {
         data.joystick = &lowstate->joystick;
+
+        LowStateSnapshot init;
+        init.q.resize(lowstate->msg_.motor_state().size());
+        init.dq.resize(lowstate->msg_.motor_state().size());
+        snapshot_.reset(init);
+        sample();
+    }
+
+    /**
+     * Only place that touches `lowstate->mutex_`, shared with the dds callback.
+     * The policy thread reads the published snapshot and never blocks this thread.
+     */
+    void sample() override
+    {
+        auto & snap = snapshot_.write_buffer();
+        {
+            const auto t0 = std::chrono::steady_clock::now();
+            std::lock_guard<std::mutex> lock(lowstate->mutex_);
+            lock_stats.record(std::chrono::steady_clock::now() - t0);
+
+            const auto & imu = lowstate->msg_.imu_state();
+            for(int i(0); i<3; i++) {
+                snap.gyroscope[i] = imu.gyroscope()[i];
+            }
+            for(int i(0); i<4; i++) {
+                snap.quaternion[i] = imu.quaternion()[i];
+            }
+            const auto & motors = lowstate->msg_.motor_state();
+            for(int i(0); i<snap.q.size(); i++) {
+                snap.q[i] = motors[i].q();
+                snap.dq[i] = motors[i].dq();
+            }
+        }
+        snapshot_.publish();
     }
 
     void update() override
     {
-        std::lock_guard<std::mutex> lock(lowstate->mutex_);
+        snapshot_.update();
+        const auto & snap = snapshot_.read();
         // base_angular_velocity
         for(int i(0); i<3; i++) {
-            data.root_ang_vel_b[i] = lowstate->msg_.imu_state().gyroscope()[i];
+            data.root_ang_vel_b[i] = snap.gyroscope[i];
         }
         // project_gravity_body
         data.root_quat_w = Eigen::Quaternionf(
-            lowstate->msg_.imu_state().quaternion()[0],
-            lowstate->msg_.imu_state().quaternion()[1],
-            lowstate->msg_.imu_state().quaternion()[2],
-            lowstate->msg_.imu_state().quaternion()[3]
+            snap.quaternion[0],
+            snap.quaternion[1],
+            snap.quaternion[2],
+            snap.quaternion[3]
         );
         data.projected_gravity_b = data.root_quat_w.conjugate() * data.GRAVITY_VEC_W;
         // joint positions and velocities
         for(int i(0); i< data.joint_ids_map.size(); i++) {
-            data.joint_pos[i] = lowstate->msg_.motor_state()[data.joint_ids_map[i]].q();
-            data.joint_vel[i] = lowstate->msg_.motor_state()[data.joint_ids_map[i]].dq();
+            data.joint_pos[i] = snap.q[data.joint_ids_map[i]];
+            data.joint_vel[i] = snap.dq[data.joint_ids_map[i]];
         }
     }
 
+    // Snapshot consumed by the last `update()`; only valid on the policy thread.
+    const LowStateSnapshot & snapshot() const { return snapshot_.read(); }
+
     LowStatePtr lowstate;
+
+private:
+    isaaclab::TripleBuffer<LowStateSnapshot> snapshot_;
 };
 
-}
\ No newline at end of file
+}
@@ -0,0 +1,182 @@
+// Copyright (c) 2025, Unitree Robotics Co., Ltd.
+// All rights reserved.
+
+#pragma once
+
+#include <array>
+#include <cstdio>
+#include <cstdlib>
+#include <filesystem>
+#include <fstream>
+#include <memory>
+#include <mutex>
+#include <sstream>
+#include <string>
+#include <vector>
+#include <spdlog/spdlog.h>
+#include "unitree_articulation.h"
+
+/**
+ * Lowstate recordings for offline replay.
+ *
+ * A recording is a csv file with one row per policy step:
+ *     # lowstate v1 motors=<N> actions=<M>
+ *     gyro(3), quat wxyz(4), q(N), dq(N), joystick lx ly rx ry (4), action(M)
+ * `q`/`dq` are in sdk order, as consumed by `BaseArticulation::update()`, and
+ * `action` is the raw policy output of that step. The first row is the state seen
+ * by `env->reset()` (its action is the zero action after reset). Values are written
+ * with 9 significant digits so they round-trip to the exact same float.
+ */
+namespace unitree
+{
+
+class LowStateRecorder
+{
+public:
+    LowStateRecorder(const std::filesystem::path & path, size_t num_motors, size_t num_actions)
+    : path_(path)
+    {
+        if (path.has_parent_path()) {
+            std::filesystem::create_directories(path.parent_path());
+        }
+        file_.open(path);
+        if (!file_.is_open()) {
+            throw std::runtime_error("Failed to open lowstate recording " + path.string());
+        }
+        file_ << "# lowstate v1 motors=" << num_motors << " actions=" << num_actions << "\n";
+        spdlog::info("Recording lowstate to {}", path.string());
+    }
+
+    ~LowStateRecorder()
+    {
+        file_.close();
+        spdlog::info("Recorded {} steps to {}", rows_, path_.string());
+    }
+
+    template <typename Joystick>
+    void write(const LowStateSnapshot & snap, Joystick & joy, const std::vector<float> & action)
+    {
+        line_.clear();
+        append_(snap.gyroscope);
+        append_(snap.quaternion);
+        append_(snap.q);
+        append_(snap.dq);
+        append_(std::array<float, 4>{joy.lx(), joy.ly(), joy.rx(), joy.ry()});
+        append_(action);
+        line_.back() = '\n';
+        file_ << line_;
+        rows_++;
+    }
+
+private:
+    template <typename T>
+    void append_(const T & values)
+    {
+        char buf[32];
+        for (float v : values) {
+            int n = std::snprintf(buf, sizeof(buf), "%.9g,", v);
+            line_.append(buf, n);
+        }
+    }
+
+    std::filesystem::path path_;
+    std::ofstream file_;
+    std::string line_;
+    size_t rows_ = 0;
+};
+
+/**
+ * Stand-in for the sdk LowState subscriber, fed from a recording instead of dds.
+ * Exposes the members `BaseArticulation` reads, so the replay goes through the same code path as the robot.
+ */
+class ReplayLowState
+{
+public:
+    using SharedPtr = std::shared_ptr<ReplayLowState>;
+
+    struct MotorState
+    {
+        float q_ = 0.0f;
+        float dq_ = 0.0f;
+        float q() const { return q_; }
+        float dq() const { return dq_; }
+    };
+
+    struct ImuState
+    {
+        std::array<float, 3> gyroscope_{};
+        std::array<float, 4> quaternion_{1.0f, 0.0f, 0.0f, 0.0f};
+        const std::array<float, 3> & gyroscope() const { return gyroscope_; }
+        const std::array<float, 4> & quaternion() const { return quaternion_; }
+    };
+
+    struct Msg
+    {
+        std::vector<MotorState> motor_state_;
+        ImuState imu_state_;
+        const std::vector<MotorState> & motor_state() const { return motor_state_; }
+        const ImuState & imu_state() const { return imu_state_; }
+    };
+
+    // Load a recording written by `LowStateRecorder`.
+    explicit ReplayLowState(const std::filesystem::path & path)
+    {
+        std::ifstream file(path);
+        if (!file.is_open()) {
+            throw std::runtime_error("Failed to open lowstate recording " + path.string());
+        }
+        std::string line;
+        std::getline(file, line);
+        if (std::sscanf(line.c_str(), "# lowstate v1 motors=%zu actions=%zu", &num_motors, &num_actions) != 2) {
+            throw std::runtime_error("Invalid lowstate recording header: " + line);
+        }
+        const size_t row_size = 3 + 4 + 2 * num_motors + 4 + num_actions;
+        while (std::getline(file, line))
+        {
+            if (line.empty() || line[0] == '#') continue;
+            std::vector<float> row;
+            row.reserve(row_size);
+            std::stringstream ss(line);
+            std::string value;
+            while (std::getline(ss, value, ',')) {
+                row.push_back(std::strtof(value.c_str(), nullptr));
+            }
+            if (row.size() != row_size) {
+                throw std::runtime_error(fmt::format("Row {} of {} has {} values, expected {}", rows.size(), path.string(), row.size(), row_size));
+            }
+            rows.push_back(std::move(row));
+        }
+        msg_.motor_state_.resize(num_motors);
+    }
+
+    // Apply step `i` of the recording to `msg_` and the joystick axes.
+    void load(size_t i)
+    {
+        std::lock_guard<std::mutex> lock(mutex_);
+        const float* p = rows[i].data();
+        for (int k = 0; k < 3; ++k) msg_.imu_state_.gyroscope_[k] = *p++;
+        for (int k = 0; k < 4; ++k) msg_.imu_state_.quaternion_[k] = *p++;
+        for (auto & m : msg_.motor_state_) m.q_ = *p++;
+        for (auto & m : msg_.motor_state_) m.dq_ = *p++;
+        for (auto & a : axes) a = *p++;
+    }
+
+    // Raw policy output recorded at step `i`.
+    std::vector<float> recorded_action(size_t i) const
+    {
+        return std::vector<float>(rows[i].end() - num_actions, rows[i].end());
+    }
+
+    size_t size() const { return rows.size(); }
+
+    Msg msg_;
+    std::mutex mutex_;
+    common::UnitreeJoystick joystick; // only for `ArticulationData::joystick`, commands are taken from `axes`
+    std::array<float, 4> axes{}; // lx, ly, rx, ry
+
+    size_t num_motors = 0;
+    size_t num_actions = 0;
+    std::vector<std::vector<float>> rows;
+};
+
+}
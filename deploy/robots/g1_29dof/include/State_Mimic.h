@@ -9,7 +9,22 @@ public:
 
     void enter();
 
+    void pre_run()
+    {
+        FSMState::pre_run();
+        env->robot->sample();
+    }
+
     void run();
+
+    // Latest policy target, ramped at the control rate if `action_interpolation` is set in deploy.yaml.
+    const std::vector<float> & policy_action()
+    {
+        bool updated = false;
+        const auto & target = env->action_manager->processed_actions(&updated);
+        if (!env->action_interpolation) return target;
+        return action_interpolator.step(target, updated);
+    }
     
     void exit()
     {
@@ -17,6 +32,11 @@ public:
         if (policy_thread.joinable()) {
             policy_thread.join();
         }
+        env->robot->lock_stats.report("State_" + getStateString() + " lowstate");
+        env->robot->lock_stats.clear();
+        policy_loop_stats.report("State_" + getStateString() + " policy loop");
+        policy_loop_stats.clear();
+        finish_timing(env->timing, getStateString());
     }
 
     class MotionLoader_;
@@ -27,7 +47,9 @@ private:
     std::shared_ptr<MotionLoader_> motion_; // for saving
 
     std::thread policy_thread;
-    bool policy_thread_running = false;
+    std::atomic<bool> policy_thread_running = false;
+    isaaclab::LoopStats policy_loop_stats;
+    ActionInterpolator action_interpolator;
     std::array<float, 2> time_range_;
 };
 
@@ -39,18 +61,34 @@ public:
     {
         auto data = isaaclab::load_csv(motion_file);
         
-        num_frames = data.size();
-        duration = num_frames * dt;
-        
-        for(int i(0); i < num_frames; ++i)
+        for(int i(0); i < data.size(); ++i)
         {
-            root_positions.push_back(Eigen::VectorXf::Map(data[i].data(), 3));
-            root_quaternions.push_back(Eigen::Quaternionf(data[i][6],data[i][3], data[i][4], data[i][5]));
-            dof_positions.push_back(Eigen::VectorXf::Map(data[i].data() + 7, data[i].size() - 7));
+            add_frame_(data[i].data(), data[i].size());
         }
-        dof_velocities = _comupte_raw_derivative(dof_positions);
+        finalize_();
+    }
 
-        update(0.0f);
+    // Motion track of a policy bundle, frames are laid out as the motion csv.
+    MotionLoader_(std::string_view track)
+    {
+        struct { uint32_t num_frames, num_dofs; float fps; uint32_t reserved; } header;
+        if (track.size() < sizeof(header)) {
+            throw std::runtime_error("Motion track is too small");
+        }
+        std::memcpy(&header, track.data(), sizeof(header));
+        const size_t row_size = 7 + header.num_dofs;
+        if (track.size() != sizeof(header) + header.num_frames * row_size * sizeof(float) || header.num_frames == 0) {
+            throw std::runtime_error("Motion track size does not match its header");
+        }
+        dt = 1.0f / header.fps;
+
+        std::vector<float> row(row_size);
+        for(int i(0); i < header.num_frames; ++i)
+        {
+            std::memcpy(row.data(), track.data() + sizeof(header) + i * row_size * sizeof(float), row_size * sizeof(float));
+            add_frame_(row.data(), row_size);
+        }
+        finalize_();
     }
 
     void update(float time) 
@@ -100,6 +138,22 @@ private:
     int index_1_;
     float blend_;
 
+    void add_frame_(const float* row, size_t size)
+    {
+        root_positions.push_back(Eigen::VectorXf::Map(row, 3));
+        root_quaternions.push_back(Eigen::Quaternionf(row[6], row[3], row[4], row[5]));
+        dof_positions.push_back(Eigen::VectorXf::Map(row + 7, size - 7));
+    }
+
+    void finalize_()
+    {
+        num_frames = dof_positions.size();
+        duration = num_frames * dt;
+        dof_velocities = _comupte_raw_derivative(dof_positions);
+
+        update(0.0f);
+    }
+
     std::vector<Eigen::VectorXf> _comupte_raw_derivative(const std::vector<Eigen::VectorXf>& data)
     {
         std::vector<Eigen::VectorXf> derivative;
@@ -11,12 +11,12 @@ Eigen::Quaternionf torso_quat_w(isaaclab::ManagerBasedRLEnv* env) {
     G1Type* robot = dynamic_cast<G1Type*>(env->robot.get());
 
     auto root_quat = env->robot->data.root_quat_w;
-    auto & motors = robot->lowstate->msg_.motor_state();
+    auto & q = robot->snapshot().q; // same sample as root_quat_w, no lock needed
 
     Eigen::Quaternionf torso_quat = root_quat \
-        * Eigen::AngleAxisf(motors[12].q(), Eigen::Vector3f::UnitZ()) \
-        * Eigen::AngleAxisf(motors[13].q(), Eigen::Vector3f::UnitX()) \
-        * Eigen::AngleAxisf(motors[14].q(), Eigen::Vector3f::UnitY()) \
+        * Eigen::AngleAxisf(q[12], Eigen::Vector3f::UnitZ()) \
+        * Eigen::AngleAxisf(q[13], Eigen::Vector3f::UnitX()) \
+        * Eigen::AngleAxisf(q[14], Eigen::Vector3f::UnitY()) \
     ;
     return torso_quat;
 };
@@ -115,14 +115,20 @@ State_Mimic::State_Mimic(int state_mode, std::string state_string)
 
     auto articulation = std::make_shared<unitree::BaseArticulation<LowState_t::SharedPtr>>(FSMState::lowstate);
 
-    std::filesystem::path motion_file = cfg["motion_file"].as<std::string>();
-    if(!motion_file.is_absolute()) {
-        motion_file = param::proj_dir / motion_file;
-    }
+    auto bundle = isaaclab::load_policy_bundle(policy_dir);
 
     // Motion
-    motion_ = std::make_shared<MotionLoader_>(motion_file.string(), cfg["fps"].as<float>());
-    spdlog::info("Loaded motion file '{}' with duration {:.2f}s", motion_file.stem().string(), motion_->duration);
+    if (bundle && bundle->has("motion")) {
+        motion_ = std::make_shared<MotionLoader_>(bundle->section("motion"));
+        spdlog::info("Loaded motion of '{}' with duration {:.2f}s", bundle->path().string(), motion_->duration);
+    } else {
+        std::filesystem::path motion_file = cfg["motion_file"].as<std::string>();
+        if(!motion_file.is_absolute()) {
+            motion_file = param::proj_dir / motion_file;
+        }
+        motion_ = std::make_shared<MotionLoader_>(motion_file.string(), cfg["fps"].as<float>());
+        spdlog::info("Loaded motion file '{}' with duration {:.2f}s", motion_file.stem().string(), motion_->duration);
+    }
     motion = motion_;
     if(cfg["time_start"]) {
         float time_start = cfg["time_start"].as<float>();
@@ -137,11 +143,7 @@ State_Mimic::State_Mimic(int state_mode, std::string state_string)
         time_range_[1] = motion_->duration;
     }
 
-    env = std::make_unique<isaaclab::ManagerBasedRLEnv>(
-        YAML::LoadFile(policy_dir / "params" / "deploy.yaml"),
-        articulation
-    );
-    env->alg = std::make_unique<isaaclab::OrtRunner>(policy_dir / "exported" / "policy.onnx");
+    env = isaaclab::make_policy_env(policy_dir, articulation, bundle);
 
     const auto & joy = FSMState::lowstate->joystick;
     this->registered_checks.emplace_back(
@@ -170,6 +172,9 @@ void State_Mimic::enter()
     }
 
     motion = motion_; // set for specific motion
+    env->robot->sample();
+    configure_timing(env->timing, getStateString());
+    action_interpolator.reset(env->action_manager->processed_actions(), std::lround(env->step_dt / CONTROL_DT));
     env->reset();
     // Start policy thread
     policy_thread_running = true;
@@ -193,6 +198,7 @@ void State_Mimic::enter()
             env->robot->update();
             motion->update(env->episode_length * env->step_dt + time_range_[0]);
             env->step();
+            policy_loop_stats.record(clock::now() - sleepTill);
 
             // Sleep
             std::this_thread::sleep_until(sleepTill);
@@ -204,7 +210,7 @@ void State_Mimic::enter()
 
 void State_Mimic::run()
 {
-    auto action = env->action_manager->processed_actions();
+    const auto & action = policy_action();
     for(int i(0); i < env->robot->data.joint_ids_map.size(); i++) {
         lowcmd->msg_.motor_cmd()[env->robot->data.joint_ids_map[i]].q() = action[i];
     }
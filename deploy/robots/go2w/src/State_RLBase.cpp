@@ -9,11 +9,10 @@ State_RLBase::State_RLBase(int state_mode, std::string state_string)
     auto cfg = param::config["FSM"][state_string];
     auto policy_dir = param::parser_policy_dir(cfg["policy_dir"].as<std::string>());
 
-    env = std::make_unique<isaaclab::ManagerBasedRLEnv>(
-        YAML::LoadFile(policy_dir / "params" / "deploy.yaml"),
+    env = isaaclab::make_policy_env(
+        policy_dir,
         std::make_shared<unitree::BaseArticulation<LowState_t::SharedPtr>>(FSMState::lowstate)
     );
-    env->alg = std::make_unique<isaaclab::OrtRunner>(policy_dir / "exported" / "policy.onnx");
 
     this->registered_checks.emplace_back(
         std::make_pair(
@@ -24,7 +23,7 @@ State_RLBase::State_RLBase(int state_mode, std::string state_string)
 }
 void State_RLBase::run()
 {
-    auto action = env->action_manager->processed_actions();
+    const auto & action = policy_action();
     for(int i(0); i < 12; i++) {
         lowcmd->msg_.motor_cmd()[env->robot->data.joint_ids_map[i]].q() = action[i];
     }
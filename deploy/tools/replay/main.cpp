@@ -0,0 +1,182 @@
+// Copyright (c) 2025, Unitree Robotics Co., Ltd.
+// All rights reserved.
+
+// Offline replay of a lowstate recording through the deploy stack.
+//
+// Feeds every row of a recording (see `unitree::LowStateRecorder`) into `BaseArticulation`,
+// runs `ManagerBasedRLEnv::step()` as fast as possible and compares the policy actions
+// against the recorded ones, or against a reference file.
+//
+//     ./replay -p <policy_dir> -i lowstate.csv -o actions.csv --obs obs.csv
+//     ./replay -p <policy_dir> -i lowstate.csv -r python_actions.csv --tolerance 1e-5
+//     ./replay -p <policy_dir> -i lowstate.csv --repeat 100 # throughput
+
+#include <boost/program_options.hpp>
+#include <chrono>
+#include <fstream>
+#include "unitree_replay.h"
+#include "isaaclab/envs/mdp/observations/observations.h"
+#include "isaaclab/envs/mdp/actions/joint_actions.h"
+
+namespace po = boost::program_options;
+using ReplayRobot = unitree::BaseArticulation<unitree::ReplayLowState::SharedPtr>;
+
+static unitree::ReplayLowState* replay_state = nullptr;
+
+// Same as `velocity_commands`, but with the joystick axes stored in the recording.
+std::vector<float> replay_velocity_commands(isaaclab::ManagerBasedRLEnv* env, YAML::Node params)
+{
+    std::vector<float> obs(3);
+    const auto & axes = replay_state->axes; // lx, ly, rx, ry
+    const auto cfg = env->cfg["commands"]["base_velocity"]["ranges"];
+
+    obs[0] = std::clamp(axes[1], cfg["lin_vel_x"][0].as<float>(), cfg["lin_vel_x"][1].as<float>());
+    obs[1] = std::clamp(-axes[0], cfg["lin_vel_y"][0].as<float>(), cfg["lin_vel_y"][1].as<float>());
+    obs[2] = std::clamp(-axes[2], cfg["ang_vel_z"][0].as<float>(), cfg["ang_vel_z"][1].as<float>());
+    return obs;
+}
+
+// Reference actions, either a lowstate recording or a plain csv with one action per row.
+std::vector<std::vector<float>> load_reference(const std::filesystem::path & path)
+{
+    std::ifstream file(path);
+    std::string head;
+    std::getline(file, head);
+    file.close();
+    if (head.rfind("# lowstate", 0) == 0)
+    {
+        unitree::ReplayLowState ref(path);
+        std::vector<std::vector<float>> actions;
+        for (size_t i = 1; i < ref.size(); ++i) {
+            actions.push_back(ref.recorded_action(i));
+        }
+        return actions;
+    }
+    return isaaclab::load_csv(path.string());
+}
+
+void write_row(std::ofstream & file, const float* data, size_t size)
+{
+    char buf[32];
+    for (size_t i = 0; i < size; ++i) {
+        int n = std::snprintf(buf, sizeof(buf), i + 1 < size ? "%.9g," : "%.9g\n", data[i]);
+        file.write(buf, n);
+    }
+}
+
+int main(int argc, char** argv)
+{
+    po::options_description desc("Deploy replay");
+    desc.add_options()
+        ("help,h", "produce help message")
+        ("policy,p", po::value<std::string>()->required(), "policy directory with exported/policy.bundle, or params/deploy.yaml and exported/policy.onnx")
+        ("input,i", po::value<std::string>()->required(), "lowstate recording")
+        ("output,o", po::value<std::string>(), "write raw actions to this csv")
+        ("obs", po::value<std::string>(), "write observations to this csv")
+        ("reference,r", po::value<std::string>(), "reference actions, defaults to the actions stored in the recording")
+        ("tolerance", po::value<float>()->default_value(0.0f), "max abs action error, 0 for bit-exact")
+        ("repeat", po::value<int>()->default_value(1), "replay the recording n times, for throughput")
+        ;
+
+    po::variables_map vm;
+    po::store(po::parse_command_line(argc, argv, desc), vm);
+    if (vm.count("help")) {
+        std::cout << desc << std::endl;
+        return 0;
+    }
+    po::notify(vm);
+
+    const std::filesystem::path policy_dir = vm["policy"].as<std::string>();
+    auto lowstate = std::make_shared<unitree::ReplayLowState>(vm["input"].as<std::string>());
+    replay_state = lowstate.get();
+    if (lowstate->size() < 2) {
+        spdlog::error("Recording has no policy step");
+        return 1;
+    }
+    spdlog::info("Loaded {} steps, {} motors, {} actions", lowstate->size() - 1, lowstate->num_motors, lowstate->num_actions);
+
+    isaaclab::observations_map()["velocity_commands"] = replay_velocity_commands;
+
+    auto robot = std::make_shared<ReplayRobot>(lowstate);
+    auto env = isaaclab::make_policy_env(policy_dir, robot);
+    env->timing.name = "replay";
+
+    // reference[i] is the action of step i + 1 of the recording, row 0 being the reset state
+    std::vector<std::vector<float>> reference;
+    if (vm.count("reference")) {
+        reference = load_reference(vm["reference"].as<std::string>());
+    } else {
+        for (size_t i = 1; i < lowstate->size(); ++i) {
+            reference.push_back(lowstate->recorded_action(i));
+        }
+    }
+
+    std::ofstream action_file, obs_file;
+    if (vm.count("output")) action_file.open(vm["output"].as<std::string>());
+    if (vm.count("obs")) obs_file.open(vm["obs"].as<std::string>());
+
+    const float tolerance = vm["tolerance"].as<float>();
+    const int repeat = std::max(1, vm["repeat"].as<int>());
+    float max_error = 0.0f;
+    size_t mismatched = 0, first_mismatch = 0;
+
+    const auto start = std::chrono::steady_clock::now();
+    for (int r = 0; r < repeat; ++r)
+    {
+        lowstate->load(0); // state at reset
+        robot->sample();
+        env->reset();
+        for (size_t i = 1; i < lowstate->size(); ++i)
+        {
+            lowstate->load(i);
+            robot->sample();
+            env->step();
+
+            if (r > 0) continue;
+            const auto action = env->action_manager->action();
+            if (action_file.is_open()) {
+                write_row(action_file, action.data(), action.size());
+            }
+            if (obs_file.is_open()) {
+                std::vector<std::string> groups;
+                for (const auto & [name, _] : env->obs) groups.push_back(name);
+                std::sort(groups.begin(), groups.end());
+                std::vector<float> row;
+                for (const auto & name : groups) {
+                    row.insert(row.end(), env->obs[name].begin(), env->obs[name].end());
+                }
+                write_row(obs_file, row.data(), row.size());
+            }
+            if (i - 1 < reference.size())
+            {
+                const auto & ref = reference[i - 1];
+                float error = ref.size() == action.size() ? 0.0f : std::numeric_limits<float>::infinity();
+                for (size_t k = 0; k < action.size() && k < ref.size(); ++k) {
+                    error = std::max(error, std::abs(action[k] - ref[k]));
+                }
+                if (error > tolerance) {
+                    if (mismatched == 0) first_mismatch = i;
+                    mismatched++;
+                }
+                max_error = std::max(max_error, error);
+            }
+        }
+    }
+    const std::chrono::duration<double> elapsed = std::chrono::steady_clock::now() - start;
+
+    const size_t steps = (lowstate->size() - 1) * repeat;
+    spdlog::info("Replayed {} steps in {:.3f}s: {:.0f} steps/s, {:.1f}us/step", steps, elapsed.count(), steps / elapsed.count(), elapsed.count() * 1e6 / steps);
+    env->timing.report();
+
+    const size_t compared = std::min(reference.size(), lowstate->size() - 1);
+    if (reference.size() != lowstate->size() - 1) {
+        spdlog::warn("Reference has {} rows, recording has {} steps", reference.size(), lowstate->size() - 1);
+    }
+    if (mismatched > 0) {
+        spdlog::error("{} / {} steps differ from the reference (max abs error {:.3e} > {:.3e}), first at step {}",
+            mismatched, compared, max_error, tolerance, first_mismatch);
+        return 1;
+    }
+    spdlog::info("All {} steps match the reference (max abs error {:.3e})", compared, max_error);
+    return 0;
+}
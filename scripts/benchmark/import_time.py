@@ -0,0 +1,114 @@
+"""Import-time benchmark of the task packages.
+
+Every measurement runs in a fresh interpreter:
+
+* ``register``: ``import unitree_rl_lab.tasks``, which must register all tasks without importing Isaac Lab,
+  torch or any robot package.
+* ``<task>``: loading the env config of one task (Isaac Sim is launched headless first, outside the timing),
+  which must not import the packages of other tasks.
+
+The script exits with 1 when a budget or an import rule is violated, so it can guard against regressions::
+
+    python scripts/benchmark/import_time.py                                 # registration only
+    python scripts/benchmark/import_time.py --task Unitree-Go2-Velocity --task Unitree-G1-29dof-Mimic-Dance-102
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+import time
+
+# never imported by `import unitree_rl_lab.tasks`
+HEAVY_MODULES = ("isaaclab", "isaaclab_tasks", "isaacsim", "omni", "torch")
+
+
+def _foreign_modules(modules: list[str], own: str) -> list[str]:
+    """Task modules in ``modules`` that the task package ``own`` has no reason to import."""
+    family = own.split(".")[2]
+    foreign = []
+    for module in modules:
+        if not module.startswith("unitree_rl_lab.tasks.") or module.count(".") < 2:
+            continue
+        other_family = module.split(".")[2] != family
+        other_robot = ".robots." in module and not (module.startswith(own) or own.startswith(module))
+        if other_family or other_robot:
+            foreign.append(module)
+    return foreign
+
+
+def child_register():
+    start = time.perf_counter()
+    import gymnasium as gym
+
+    import unitree_rl_lab.tasks  # noqa: F401
+
+    elapsed = time.perf_counter() - start
+    tasks = [task_id for task_id in gym.registry if task_id.startswith("Unitree")]
+    return {"seconds": elapsed, "tasks": len(tasks), "modules": sorted(sys.modules)}
+
+
+def child_task(task: str):
+    from isaaclab.app import AppLauncher
+
+    app_launcher = AppLauncher(headless=True)  # noqa: F841
+
+    start = time.perf_counter()
+    from isaaclab_tasks.utils.parse_cfg import load_cfg_from_registry
+
+    import unitree_rl_lab.tasks  # noqa: F401
+
+    load_cfg_from_registry(task, "env_cfg_entry_point")
+    elapsed = time.perf_counter() - start
+    return {"seconds": elapsed, "modules": sorted(sys.modules)}
+
+
+def run_child(*args: str) -> dict:
+    result = subprocess.run([sys.executable, __file__, "--child", *args], capture_output=True, text=True)
+    if result.returncode != 0:
+        raise RuntimeError(f"Benchmark child {args} failed:\n{result.stderr}")
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Import-time benchmark of unitree_rl_lab.tasks.")
+    parser.add_argument("--task", action="append", default=[], help="Also time loading the config of this task.")
+    parser.add_argument("--repeat", type=int, default=3, help="Fresh interpreters per measurement, best is kept.")
+    parser.add_argument("--max_register_s", type=float, default=0.5, help="Budget of `import unitree_rl_lab.tasks`.")
+    parser.add_argument("--child", nargs="+", default=None, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child is not None:
+        result = child_register() if args.child[0] == "register" else child_task(args.child[1])
+        print(json.dumps(result))
+        return
+
+    from unitree_rl_lab.utils.task_registry import load_manifest
+
+    failures = []
+    runs = [run_child("register") for _ in range(args.repeat)]
+    best = min(r["seconds"] for r in runs)
+    heavy = sorted({m.split(".")[0] for m in runs[0]["modules"]} & set(HEAVY_MODULES))
+    robots = [m for m in runs[0]["modules"] if ".robots." in m]
+    print(f"register        {best * 1e3:8.1f} ms  {runs[0]['tasks']} tasks, {len(runs[0]['modules'])} modules")
+    if best > args.max_register_s:
+        failures.append(f"registering tasks took {best:.3f}s > {args.max_register_s}s")
+    if heavy or robots:
+        failures.append(f"registering tasks imported {', '.join(heavy + robots)}")
+
+    manifest = {t["id"]: t for t in load_manifest()}
+    for task in args.task:
+        runs = [run_child("task", task) for _ in range(args.repeat)]
+        best = min(r["seconds"] for r in runs)
+        others = _foreign_modules(runs[0]["modules"], manifest[task]["module"])
+        print(f"{task:<15} {best * 1e3:8.1f} ms  {len(runs[0]['modules'])} modules")
+        if others:
+            failures.append(f"loading {task} imported {', '.join(others)}")
+
+    for failure in failures:
+        print(f"[FAIL] {failure}")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,307 @@
+"""Throughput benchmark of the MDP terms on synthetic state, without Isaac Sim.
+
+Times every public function of the reward, observation and termination modules of the locomotion and mimic tasks,
+``MotionCommand._update_command`` and ``UnitreeActuator.compute`` on the synthetic robot state of
+:mod:`synthetic`, for each of the given numbers of environments. The Isaac Sim modules are replaced by the
+placeholders of :mod:`unitree_rl_lab.utils.kit_shims` when the simulator is not installed, so only Isaac Lab
+and torch are required, and the default device is the CPU.
+
+Results are written as json for regression tracking::
+
+    python scripts/benchmark/mdp_terms.py --num_envs 1024 4096 --output mdp_terms.json
+    python scripts/benchmark/mdp_terms.py --num_envs 1024 4096 --compare mdp_terms.json --tolerance 0.2
+"""
+
+import argparse
+import importlib
+import inspect
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import torch
+from datetime import datetime
+
+from unitree_rl_lab.utils import kit_shims
+
+kit_shims.install()
+
+import isaaclab.envs  # noqa: F401, E402  # isaaclab.managers is only importable once isaaclab.envs is
+from isaaclab.managers import SceneEntityCfg  # noqa: E402
+from isaaclab.utils.types import ArticulationActions  # noqa: E402
+
+from unitree_rl_lab.assets.robots import unitree_actuators  # noqa: E402
+from unitree_rl_lab.tasks.mimic.mdp.commands import MotionCommand, MotionCommandCfg  # noqa: E402
+from unitree_rl_lab.tasks.mimic.robots.g1_29dof.dance_102.tracking_env_cfg import (  # noqa: E402
+    RewardsCfg as MimicRewardsCfg,
+)
+
+import synthetic  # isort: skip  # noqa: E402
+
+MODULES = {
+    "locomotion.rewards": "unitree_rl_lab.tasks.locomotion.mdp.rewards",
+    "locomotion.observations": "unitree_rl_lab.tasks.locomotion.mdp.observations",
+    "mimic.rewards": "unitree_rl_lab.tasks.mimic.mdp.rewards",
+    "mimic.observations": "unitree_rl_lab.tasks.mimic.mdp.observations",
+    "mimic.terminations": "unitree_rl_lab.tasks.mimic.mdp.terminations",
+}
+
+MIMIC_REWARDS = MimicRewardsCfg()
+
+# terms timed together as well as one by one, because they share values the motion command caches for the step
+STEP_GROUPS = {
+    "relative frames": (
+        "mimic.observations",
+        ("robot_body_pos_b", "robot_body_ori_b", "motion_anchor_pos_b", "motion_anchor_ori_b"),
+    ),
+    "body errors": (
+        "mimic.rewards",
+        (
+            "motion_relative_body_position_error_exp",
+            "motion_relative_body_orientation_error_exp",
+            "motion_global_body_linear_velocity_error_exp",
+            "motion_global_body_angular_velocity_error_exp",
+        ),
+    ),
+}
+
+# values of the term parameters without default, by parameter name
+PARAMS = {
+    "std": 0.5,
+    "threshold": 0.25,
+    "period": 0.8,
+    "target_height": 0.1,
+    "tanh_mult": 2.0,
+    "desired_gravity": [0.0, 0.0, -1.0],
+    "stand_still_scale": 5.0,
+    "velocity_threshold": 0.3,
+}
+
+
+def _term_kwargs(func, env: synthetic.SyntheticEnv, command_name: str) -> dict:
+    """Arguments of ``func`` after ``env``, from its defaults and :data:`PARAMS`."""
+    feet = env.spec.feet
+    kwargs = {}
+    for name, param in list(inspect.signature(func).parameters.items())[1:]:
+        if name == "asset_cfg":
+            kwargs[name] = SceneEntityCfg("robot", body_ids=feet)
+        elif name == "sensor_cfg":
+            kwargs[name] = SceneEntityCfg("contact_forces", body_ids=feet)
+        elif name == "command_name":
+            kwargs[name] = command_name
+        elif name == "offset":
+            kwargs[name] = [i / len(feet) for i in range(len(feet))]
+        elif name == "mirror_joints":
+            names = env.spec.joint_names
+            kwargs[name] = [[names[i], names[i + 1]] for i in range(0, len(names) - 1, 2)]
+        elif name in PARAMS:
+            kwargs[name] = PARAMS[name]
+        elif param.default is not inspect.Parameter.empty:
+            kwargs[name] = param.default
+        else:
+            raise ValueError(f"No benchmark value for parameter '{name}' of {func.__name__}, add it to PARAMS.")
+    return kwargs
+
+
+def _motion_command(env: synthetic.SyntheticEnv, motion_file: str) -> MotionCommand:
+    body_names = env.spec.body_names[::2]
+    cfg = MotionCommandCfg(
+        asset_name="robot",
+        motion_file=motion_file,
+        anchor_body_name=body_names[len(body_names) // 2],
+        body_names=body_names,
+        resampling_time_range=(1.0e9, 1.0e9),
+    )
+    command = MotionCommand(cfg, env)
+    command.time_steps[:] = torch.randint(0, command.motion.time_step_total, (env.num_envs,), device=env.device)
+    command._update_command()
+    return command
+
+
+def _actuator(env: synthetic.SyntheticEnv) -> unitree_actuators.UnitreeActuator:
+    cfg = unitree_actuators.UnitreeActuatorCfg_N7520_14p3(
+        joint_names_expr=[".*"], stiffness=100.0, damping=2.0, min_delay=0, max_delay=2
+    )
+    return cfg.class_type(
+        cfg,
+        joint_names=env.spec.joint_names,
+        joint_ids=slice(None),
+        num_envs=env.num_envs,
+        device=env.device,
+        stiffness=cfg.stiffness,
+        damping=cfg.damping,
+    )
+
+
+def _new_step(env: synthetic.SyntheticEnv):
+    """Start a new step, so that the terms do not reuse what they cached in the previous call."""
+    env.common_step_counter += 1
+
+
+def benchmark_cases(env: synthetic.SyntheticEnv, motion_file: str) -> dict:
+    """Callables to time, by name."""
+    command = _motion_command(env, motion_file)
+    env.command_manager._terms["motion"] = command
+
+    cases = {}
+    for prefix, module_name in MODULES.items():
+        module = importlib.import_module(module_name)
+        command_name = "motion" if prefix.startswith("mimic") else "base_velocity"
+        for name, func in inspect.getmembers(module, inspect.isfunction):
+            if func.__module__ != module_name or name.startswith("_"):
+                continue
+            kwargs = _term_kwargs(func, env, command_name)
+            cases[f"{prefix}.{name}"] = lambda func=func, kwargs=kwargs: _new_step(env) or func(env, **kwargs)
+
+    # terms sharing what the motion command computes once per step, timed together within a step
+    for group, (prefix, names) in STEP_GROUPS.items():
+        module = importlib.import_module(MODULES[prefix])
+        calls = [(getattr(module, name), _term_kwargs(getattr(module, name), env, "motion")) for name in names]
+        cases[f"{prefix}.<{group}>"] = lambda calls=calls: _new_step(env) or [
+            func(env, **kwargs) for func, kwargs in calls
+        ]
+
+    # the tracking rewards of the mimic tasks as one class-based term
+    tracking_cfg = MIMIC_REWARDS.motion_tracking.copy()
+    tracking = tracking_cfg.func(tracking_cfg, env)
+    cases["mimic.rewards.motion_tracking_exp"] = lambda: _new_step(env) or tracking(env, **tracking_cfg.params)
+
+    cases["mimic.commands.MotionCommand._update_command"] = command._update_command
+
+    actuator = _actuator(env)
+    data = env.scene["robot"].data
+    cases["actuators.UnitreeActuator.compute"] = lambda: actuator.compute(
+        ArticulationActions(
+            joint_positions=data.default_joint_pos,
+            joint_velocities=data.default_joint_vel,
+            joint_efforts=torch.zeros_like(data.joint_pos),
+        ),
+        data.joint_pos,
+        data.joint_vel,
+    )
+    return cases
+
+
+def time_case(func, device: str, repeat: int, warmup: int) -> dict:
+    """Statistics of the wall-clock time of ``func`` in microseconds."""
+
+    def _sync():
+        if torch.device(device).type == "cuda":
+            torch.cuda.synchronize(device)
+
+    for _ in range(warmup):
+        func()
+    _sync()
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        _sync()
+        samples.append((time.perf_counter() - start) * 1e6)
+    return {
+        "median_us": statistics.median(samples),
+        "mean_us": statistics.fmean(samples),
+        "min_us": min(samples),
+        "repeat": repeat,
+    }
+
+
+def _git_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> list[str]:
+    """Cases of ``results`` slower than in ``baseline`` by more than ``tolerance`` (relative median time)."""
+    regressions = []
+    for num_envs, cases in results.items():
+        for name, result in cases.items():
+            base = baseline.get(num_envs, {}).get(name)
+            if base is None or "median_us" not in base or "median_us" not in result:
+                continue
+            ratio = result["median_us"] / base["median_us"]
+            if ratio > 1.0 + tolerance:
+                regressions.append(
+                    f"{name} @ {num_envs} envs: {base['median_us']:.1f} -> {result['median_us']:.1f} us (x{ratio:.2f})"
+                )
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the MDP terms of unitree_rl_lab on synthetic state.")
+    parser.add_argument("--num_envs", type=int, nargs="+", default=[1024, 4096], help="Numbers of environments.")
+    parser.add_argument("--robot", type=str, default="g1", choices=sorted(synthetic.ROBOTS), help="Robot sizes.")
+    parser.add_argument("--device", type=str, default="cpu", help="Torch device.")
+    parser.add_argument("--threads", type=int, default=None, help="Torch CPU threads, for reproducible numbers.")
+    parser.add_argument("--repeat", type=int, default=50, help="Timed calls per case.")
+    parser.add_argument("--warmup", type=int, default=5, help="Untimed calls per case.")
+    parser.add_argument("--filter", type=str, default=None, help="Only run the cases containing this string.")
+    parser.add_argument("--output", type=str, default=None, help="Json file to write the results to.")
+    parser.add_argument("--compare", type=str, default=None, help="Json results to compare against.")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="Relative slowdown reported as regression.")
+    args = parser.parse_args()
+
+    if args.threads is not None:
+        torch.set_num_threads(args.threads)
+    torch.manual_seed(0)
+
+    results = {}
+    failures = []
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        motion_file = os.path.join(tmp_dir, "motion.npz")
+        synthetic.write_motion(motion_file, synthetic.ROBOTS[args.robot])
+        for num_envs in args.num_envs:
+            env = synthetic.SyntheticEnv(args.robot, num_envs, args.device)
+            results[str(num_envs)] = {}
+            for name, func in benchmark_cases(env, motion_file).items():
+                if args.filter is not None and args.filter not in name:
+                    continue
+                try:
+                    result = time_case(func, args.device, args.repeat, args.warmup)
+                except Exception as e:
+                    result = {"error": f"{type(e).__name__}: {e}"}
+                    failures.append(f"{name} @ {num_envs} envs: {result['error']}")
+                    print(f"[FAIL] {failures[-1]}")
+                else:
+                    print(f"{name:<70} {num_envs:>6} envs {result['median_us']:>10.1f} us")
+                results[str(num_envs)][name] = result
+
+    report = {
+        "meta": {
+            "date": datetime.now().isoformat(timespec="seconds"),
+            "commit": _git_commit(),
+            "robot": args.robot,
+            "device": args.device,
+            "threads": torch.get_num_threads(),
+            "torch": torch.__version__,
+            "processor": platform.processor() or platform.machine(),
+            "kit_shims": not kit_shims.kit_available(),
+        },
+        "results": results,
+    }
+    if args.output is not None:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"[INFO]: Results written to {args.output}")
+
+    if args.compare is not None:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline["results"], args.tolerance)
+        for regression in regressions:
+            print(f"[REGRESSION] {regression}")
+        failures += regressions
+
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+"""Throughput benchmark of the full ``env.step`` of a task on the mock simulation backend, without Isaac Sim.
+
+Builds the task with :class:`unitree_rl_lab.utils.mock_env.MockRLEnv`, which runs the real managers and MDP terms
+on kinematic stand-ins of the robot, contact sensors, ray casters and terrain, and steps it with random actions.
+Reports the environment steps per second and the time per step of each stage (actions, physics, scene update,
+terminations, rewards, resets, commands and observations), for each of the given numbers of environments::
+
+    python scripts/benchmark/mock_env_step.py --task Unitree-G1-29dof-Velocity --num_envs 256 1024
+    python scripts/benchmark/mock_env_step.py --task Unitree-G1-29dof-Mimic-Dance-102 --output mock_step.json
+
+The physics of the mock backend costs a fraction of PhysX, so the numbers isolate the Python and torch overhead of
+the managers and terms: use them to compare changes of the task code, not to predict training throughput.
+"""
+
+import argparse
+import json
+import platform
+import statistics
+import time
+import torch
+from datetime import datetime
+
+from unitree_rl_lab.utils import kit_shims
+from unitree_rl_lab.utils.mock_env import MockRLEnv, load_env_cfg
+from unitree_rl_lab.utils.term_profiler import _TimedCall, _Timer
+
+# stages of ``ManagerBasedRLEnv.step``, as (object attribute of the env, method)
+STAGES = {
+    "actions": ("action_manager", "process_action"),
+    "write_data": ("scene", "write_data_to_sim"),
+    "physics": ("sim", "step"),
+    "scene_update": ("scene", "update"),
+    "terminations": ("termination_manager", "compute"),
+    "rewards": ("reward_manager", "compute"),
+    "resets": (None, "_reset_idx"),
+    "commands": ("command_manager", "compute"),
+    "events": ("event_manager", "apply"),
+    "observations": ("observation_manager", "compute"),
+}
+
+
+def _sync(device: str):
+    if torch.device(device).type == "cuda":
+        torch.cuda.synchronize(device)
+
+
+def benchmark(task: str, num_envs: int, device: str, steps: int, warmup: int) -> dict:
+    """Steps per second of ``task`` and the milliseconds per step of each of its :data:`STAGES`."""
+    env = MockRLEnv(load_env_cfg(task, num_envs=num_envs, device=device))
+    env.reset()
+    timers = {}
+    for stage, (owner, method) in STAGES.items():
+        obj = env if owner is None else getattr(env, owner)
+        timers[stage] = _Timer(device)
+        setattr(obj, method, _TimedCall(getattr(obj, method), timers[stage]))
+
+    def _step():
+        env.step(2.0 * torch.rand(num_envs, env.action_manager.total_action_dim, device=device) - 1.0)
+
+    for _ in range(warmup):
+        _step()
+    _sync(device)
+    for timer in timers.values():
+        timer.collect()
+
+    samples = []
+    for _ in range(steps):
+        start = time.perf_counter()
+        _step()
+        _sync(device)
+        samples.append((time.perf_counter() - start) * 1e3)
+    env.close()
+
+    step_ms = statistics.median(samples)
+    return {
+        "steps_per_s": num_envs * 1e3 / step_ms,
+        "median_step_ms": step_ms,
+        "mean_step_ms": statistics.fmean(samples),
+        "stages_ms": {stage: timer.collect() / steps for stage, timer in timers.items()},
+        "steps": steps,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the step of a task on the mock simulation backend.")
+    parser.add_argument("--task", type=str, default="Unitree-G1-29dof-Velocity", help="Name of the task.")
+    parser.add_argument("--num_envs", type=int, nargs="+", default=[256, 1024], help="Numbers of environments.")
+    parser.add_argument("--device", type=str, default="cpu", help="Torch device.")
+    parser.add_argument("--threads", type=int, default=None, help="Torch CPU threads, for reproducible numbers.")
+    parser.add_argument("--steps", type=int, default=50, help="Timed environment steps.")
+    parser.add_argument("--warmup", type=int, default=5, help="Untimed environment steps.")
+    parser.add_argument("--output", type=str, default=None, help="Json file to write the results to.")
+    args = parser.parse_args()
+
+    if args.threads is not None:
+        torch.set_num_threads(args.threads)
+    torch.manual_seed(0)
+
+    results = {}
+    for num_envs in args.num_envs:
+        result = benchmark(args.task, num_envs, args.device, args.steps, args.warmup)
+        results[str(num_envs)] = result
+        print(
+            f"{args.task} {num_envs:>6} envs {result['median_step_ms']:>9.2f} ms/step"
+            f" {result['steps_per_s']:>10.0f} steps/s"
+        )
+        for stage, ms in result["stages_ms"].items():
+            print(f"    {stage:<20} {ms:>9.2f} ms")
+
+    if args.output is not None:
+        report = {
+            "meta": {
+                "date": datetime.now().isoformat(timespec="seconds"),
+                "task": args.task,
+                "device": args.device,
+                "threads": torch.get_num_threads(),
+                "torch": torch.__version__,
+                "processor": platform.processor() or platform.machine(),
+                "kit_shims": not kit_shims.kit_available(),
+            },
+            "results": results,
+        }
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"[INFO]: Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
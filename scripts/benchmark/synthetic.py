@@ -0,0 +1,224 @@
+"""Synthetic stand-ins for the simulation state read by the MDP terms.
+
+The classes mirror the attributes of Isaac Lab's ``Articulation``/``ArticulationData``, ``ContactSensor``/
+``ContactSensorData``, the scene and the command manager that the terms of ``unitree_rl_lab`` read, filled with
+random but valid values (unit quaternions, positive contact times, ...) so that the terms run their usual code
+paths. Nothing is simulated: the state only changes when a term writes to it.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import re
+import torch
+from dataclasses import dataclass
+from types import SimpleNamespace
+
+
+@dataclass
+class RobotSpec:
+    """Sizes of the synthetic robot."""
+
+    num_joints: int
+    num_bodies: int
+    feet: list[int]
+    """Body indices of the feet."""
+
+    @property
+    def joint_names(self) -> list[str]:
+        return [f"joint_{i}" for i in range(self.num_joints)]
+
+    @property
+    def body_names(self) -> list[str]:
+        return [f"body_{i}" for i in range(self.num_bodies)]
+
+
+ROBOTS = {
+    "go2": RobotSpec(num_joints=12, num_bodies=17, feet=[4, 8, 12, 16]),
+    "h1": RobotSpec(num_joints=19, num_bodies=20, feet=[9, 10]),
+    "g1": RobotSpec(num_joints=29, num_bodies=30, feet=[11, 12]),
+}
+
+
+def random_quat(n: int, *shape: int, device: str = "cpu") -> torch.Tensor:
+    """Unit quaternions (w, x, y, z) close to upright, of shape ``(n, *shape, 4)``."""
+    quat = torch.randn(n, *shape, 4, device=device) * 0.1
+    quat[..., 0] += 1.0
+    return quat / quat.norm(dim=-1, keepdim=True)
+
+
+def _find(names: list[str], name_keys: str | list[str], preserve_order: bool = False) -> tuple[list[int], list[str]]:
+    keys = [name_keys] if isinstance(name_keys, str) else list(name_keys)
+    if preserve_order:
+        ids = [i for key in keys for i, name in enumerate(names) if re.fullmatch(key, name)]
+    else:
+        ids = [i for i, name in enumerate(names) if any(re.fullmatch(key, name) for key in keys)]
+    return ids, [names[i] for i in ids]
+
+
+class SyntheticArticulation:
+    """``Articulation`` with the ``data`` buffers used by the terms."""
+
+    def __init__(self, spec: RobotSpec, num_envs: int, device: str):
+        self.spec = spec
+        self.num_instances = num_envs
+        self.device = device
+        self.joint_names = spec.joint_names
+        self.body_names = spec.body_names
+        self.num_joints = spec.num_joints
+        self.num_bodies = spec.num_bodies
+
+        n, j, b = num_envs, spec.num_joints, spec.num_bodies
+        default_joint_pos = torch.rand(n, j, device=device) - 0.5
+        root_pos_w = torch.rand(n, 3, device=device)
+        root_pos_w[:, 2] += 0.5
+        limits = torch.stack([default_joint_pos - 1.5, default_joint_pos + 1.5], dim=-1)
+        self.data = SimpleNamespace(
+            joint_pos=default_joint_pos + 0.1 * torch.randn(n, j, device=device),
+            joint_vel=torch.randn(n, j, device=device),
+            joint_acc=torch.randn(n, j, device=device),
+            default_joint_pos=default_joint_pos,
+            default_joint_vel=torch.zeros(n, j, device=device),
+            applied_torque=10.0 * torch.randn(n, j, device=device),
+            computed_torque=10.0 * torch.randn(n, j, device=device),
+            joint_pos_limits=limits.clone(),
+            soft_joint_pos_limits=limits.clone(),
+            soft_joint_vel_limits=torch.full((n, j), 30.0, device=device),
+            root_pos_w=root_pos_w,
+            root_quat_w=random_quat(n, device=device),
+            root_lin_vel_w=torch.randn(n, 3, device=device),
+            root_ang_vel_w=torch.randn(n, 3, device=device),
+            root_lin_vel_b=torch.randn(n, 3, device=device),
+            root_ang_vel_b=torch.randn(n, 3, device=device),
+            projected_gravity_b=torch.nn.functional.normalize(
+                torch.tensor([0.0, 0.0, -1.0], device=device) + 0.1 * torch.randn(n, 3, device=device), dim=-1
+            ),
+            heading_w=torch.rand(n, device=device) * 2 * torch.pi - torch.pi,
+            body_pos_w=root_pos_w[:, None, :] + 0.3 * torch.randn(n, b, 3, device=device),
+            body_quat_w=random_quat(n, b, device=device),
+            body_lin_vel_w=torch.randn(n, b, 3, device=device),
+            body_ang_vel_w=torch.randn(n, b, 3, device=device),
+            GRAVITY_VEC_W=torch.tensor([0.0, 0.0, -1.0], device=device).repeat(n, 1),
+            FORWARD_VEC_B=torch.tensor([1.0, 0.0, 0.0], device=device).repeat(n, 1),
+        )
+
+    def find_joints(self, name_keys, joint_subset=None, preserve_order: bool = False):
+        return _find(self.joint_names if joint_subset is None else joint_subset, name_keys, preserve_order)
+
+    def find_bodies(self, name_keys, preserve_order: bool = False):
+        return _find(self.body_names, name_keys, preserve_order)
+
+    def write_joint_state_to_sim(self, position, velocity, joint_ids=None, env_ids=None):
+        env_ids = slice(None) if env_ids is None else env_ids
+        self.data.joint_pos[env_ids] = position
+        self.data.joint_vel[env_ids] = velocity
+
+    def write_root_state_to_sim(self, root_state, env_ids=None):
+        env_ids = slice(None) if env_ids is None else env_ids
+        self.data.root_pos_w[env_ids] = root_state[:, :3]
+        self.data.root_quat_w[env_ids] = root_state[:, 3:7]
+        self.data.root_lin_vel_w[env_ids] = root_state[:, 7:10]
+        self.data.root_ang_vel_w[env_ids] = root_state[:, 10:13]
+
+
+class SyntheticContactSensor:
+    """``ContactSensor`` tracking air time, with the ``data`` buffers used by the terms."""
+
+    def __init__(self, spec: RobotSpec, num_envs: int, device: str, history_length: int = 3):
+        n, b = num_envs, spec.num_bodies
+        self.body_names = spec.body_names
+        self.num_bodies = b
+        self.cfg = SimpleNamespace(track_air_time=True, history_length=history_length)
+        in_contact = torch.rand(n, b, device=device) > 0.5
+        self.data = SimpleNamespace(
+            net_forces_w=100.0 * torch.randn(n, b, 3, device=device),
+            net_forces_w_history=100.0 * torch.randn(n, history_length, b, 3, device=device),
+            current_contact_time=torch.rand(n, b, device=device) * in_contact,
+            current_air_time=torch.rand(n, b, device=device) * ~in_contact,
+            last_contact_time=torch.rand(n, b, device=device),
+            last_air_time=torch.rand(n, b, device=device),
+        )
+
+    def find_bodies(self, name_keys, preserve_order: bool = False):
+        return _find(self.body_names, name_keys, preserve_order)
+
+    def compute_first_contact(self, dt: float, abs_tol: float = 1.0e-8) -> torch.Tensor:
+        currently_in_contact = self.data.current_contact_time > 0.0
+        return currently_in_contact * (self.data.current_contact_time < (dt + abs_tol))
+
+    def compute_first_air(self, dt: float, abs_tol: float = 1.0e-8) -> torch.Tensor:
+        currently_detached = self.data.current_air_time > 0.0
+        return currently_detached * (self.data.current_air_time < (dt + abs_tol))
+
+
+class SyntheticScene:
+    """``InteractiveScene`` indexing the robot and its contact sensor."""
+
+    def __init__(self, robot: SyntheticArticulation, contact_forces: SyntheticContactSensor, device: str):
+        self.num_envs = robot.num_instances
+        self.articulations = {"robot": robot}
+        self.sensors = {"contact_forces": contact_forces}
+        self.env_origins = torch.zeros(self.num_envs, 3, device=device)
+        self.env_origins[:, :2] = torch.randn(self.num_envs, 2, device=device) * 10.0
+
+    def __getitem__(self, key: str):
+        if key in self.articulations:
+            return self.articulations[key]
+        return self.sensors[key]
+
+
+class SyntheticCommandManager:
+    """Command manager returning a random 3-D command (velocity or pose) for any name, and registered terms."""
+
+    def __init__(self, num_envs: int, device: str):
+        self._command = torch.randn(num_envs, 3, device=device)
+        self._command[: num_envs // 4] = 0.0  # standing envs
+        self._terms = {}
+
+    def get_command(self, name: str) -> torch.Tensor:
+        return self._terms[name].command if name in self._terms else self._command
+
+    def get_term(self, name: str):
+        return self._terms[name]
+
+
+class SyntheticEnv:
+    """The parts of ``ManagerBasedRLEnv`` read by the terms."""
+
+    def __init__(self, robot: str = "g1", num_envs: int = 4096, device: str = "cpu", decimation: int = 4):
+        self.spec = ROBOTS[robot]
+        self.num_envs = num_envs
+        self.device = device
+        self.physics_dt = 0.005
+        self.step_dt = self.physics_dt * decimation
+        self.max_episode_length = 1000
+        self.common_step_counter = 0
+        self.cfg = SimpleNamespace(decimation=decimation, sim=SimpleNamespace(dt=self.physics_dt))
+        self.episode_length_buf = torch.randint(0, self.max_episode_length, (num_envs,), device=device)
+        self.scene = SyntheticScene(
+            SyntheticArticulation(self.spec, num_envs, device),
+            SyntheticContactSensor(self.spec, num_envs, device),
+            device,
+        )
+        self.command_manager = SyntheticCommandManager(num_envs, device)
+        self.termination_manager = SimpleNamespace(
+            terminated=torch.rand(num_envs, device=device) < 0.01,
+            time_outs=torch.zeros(num_envs, dtype=torch.bool, device=device),
+        )
+
+
+def write_motion(path: str, spec: RobotSpec, num_frames: int = 1000, fps: int = 50):
+    """Write a random motion file in the format read by ``MotionLoader``."""
+    rng = np.random.default_rng(0)
+    quat = rng.normal(size=(num_frames, spec.num_bodies, 4)) * 0.1
+    quat[..., 0] += 1.0
+    np.savez(
+        path,
+        fps=np.array([fps]),
+        joint_pos=rng.uniform(-1.0, 1.0, (num_frames, spec.num_joints)),
+        joint_vel=rng.normal(size=(num_frames, spec.num_joints)),
+        body_pos_w=rng.normal(size=(num_frames, spec.num_bodies, 3)) * 0.3 + np.array([0.0, 0.0, 0.8]),
+        body_quat_w=quat / np.linalg.norm(quat, axis=-1, keepdims=True),
+        body_lin_vel_w=rng.normal(size=(num_frames, spec.num_bodies, 3)),
+        body_ang_vel_w=rng.normal(size=(num_frames, spec.num_bodies, 3)),
+    )
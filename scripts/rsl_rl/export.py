@@ -0,0 +1,201 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Script to export an RSL-RL checkpoint without launching the simulator.
+
+The actor is rebuilt from ``params/agent.yaml`` and the checkpoint state dict, and its input size is checked
+against ``params/deploy.yaml``, both written next to the checkpoint by ``train.py``. Only torch is needed,
+so this runs on a CPU-only machine::
+
+    python scripts/rsl_rl/export.py logs/rsl_rl/<experiment>/<run>               # latest checkpoint
+    python scripts/rsl_rl/export.py logs/rsl_rl/<experiment>/<run>/model_5000.pt
+"""
+
+import argparse
+import os
+import re
+import torch
+import yaml
+from torch import nn
+
+from unitree_rl_lab.utils.policy_bundle import build_policy_bundle, motion_from_npz
+
+# activations of ``rsl_rl.utils.resolve_nn_activation``
+ACTIVATIONS = {
+    "elu": nn.ELU,
+    "selu": nn.SELU,
+    "relu": nn.ReLU,
+    "crelu": nn.CELU,
+    "lrelu": nn.LeakyReLU,
+    "tanh": nn.Tanh,
+    "sigmoid": nn.Sigmoid,
+    "softplus": nn.Softplus,
+    "gelu": nn.GELU,
+    "swish": nn.SiLU,
+    "mish": nn.Mish,
+    "identity": nn.Identity,
+}
+
+
+class _ParamsLoader(yaml.SafeLoader):
+    """Safe loader for the ``params/*.yaml`` written by ``dump_yaml``, python objects other than tuples are skipped."""
+
+
+_ParamsLoader.add_constructor(
+    "tag:yaml.org,2002:python/tuple", lambda loader, node: tuple(loader.construct_sequence(node))
+)
+_ParamsLoader.add_multi_constructor("tag:yaml.org,2002:python/", lambda loader, suffix, node: None)
+
+
+class Normalizer(nn.Module):
+    """Inference-time counterpart of rsl-rl ``EmpiricalNormalization``."""
+
+    def __init__(self, mean: torch.Tensor, std: torch.Tensor, eps: float = 1e-2):
+        super().__init__()
+        self.register_buffer("mean", mean.reshape(1, -1).float())
+        self.register_buffer("std", std.reshape(1, -1).float())
+        self.eps = eps
+
+    def forward(self, x: torch.Tensor) -> torch.Tensor:
+        return (x - self.mean) / (self.std + self.eps)
+
+
+class Policy(nn.Module):
+    """Deterministic actor, with the observation normalizer in front if the run used one."""
+
+    def __init__(self, actor: nn.Module, normalizer: nn.Module | None = None):
+        super().__init__()
+        self.actor = actor
+        self.normalizer = normalizer if normalizer is not None else nn.Identity()
+
+    def forward(self, x: torch.Tensor) -> torch.Tensor:
+        return self.actor(self.normalizer(x))
+
+
+def find_checkpoint(path: str) -> str:
+    """The checkpoint itself, or the one with the highest iteration in a run directory."""
+    if os.path.isfile(path):
+        return path
+    checkpoints = [f for f in os.listdir(path) if re.fullmatch(r"model_\d+\.pt", f)]
+    if not checkpoints:
+        raise FileNotFoundError(f"No model_<iteration>.pt checkpoint in {path}")
+    return os.path.join(path, max(checkpoints, key=lambda f: int(f[6:-3])))
+
+
+def build_actor(policy_cfg: dict, state_dict: dict) -> nn.Sequential:
+    """Rebuild the rsl-rl ``ActorCritic`` actor MLP and load its weights."""
+    class_name = policy_cfg.get("class_name", "ActorCritic")
+    if class_name != "ActorCritic":
+        raise ValueError(
+            f"Only feed-forward ActorCritic policies can be exported without the simulator, got {class_name}."
+        )
+    activation_name = policy_cfg.get("activation", "elu")
+    if activation_name not in ACTIVATIONS:
+        raise ValueError(
+            f"Unsupported activation '{activation_name}', the supported ones are: {', '.join(ACTIVATIONS)}."
+        )
+    activation = ACTIVATIONS[activation_name]
+
+    weights = {k[len("actor.") :]: v for k, v in state_dict.items() if k.startswith("actor.")}
+    num_linear = len(policy_cfg["actor_hidden_dims"]) + 1
+    dims = (
+        [weights["0.weight"].shape[1]]
+        + list(policy_cfg["actor_hidden_dims"])
+        + [weights[f"{2 * (num_linear - 1)}.weight"].shape[0]]
+    )
+
+    layers = []
+    for i in range(num_linear):
+        layers.append(nn.Linear(dims[i], dims[i + 1]))
+        if i < num_linear - 1:
+            layers.append(activation())
+    actor = nn.Sequential(*layers)
+    actor.load_state_dict(weights)
+    return actor
+
+
+def build_normalizer(checkpoint: dict) -> Normalizer | None:
+    """Observation normalizer of the checkpoint, stored in the policy (rsl-rl >= 2.3) or separately (older)."""
+    state_dict = checkpoint["model_state_dict"]
+    prefix = "actor_obs_normalizer."
+    if prefix + "_mean" in state_dict:
+        return Normalizer(state_dict[prefix + "_mean"], state_dict[prefix + "_std"])
+    if "obs_norm_state_dict" in checkpoint:
+        return Normalizer(checkpoint["obs_norm_state_dict"]["_mean"], checkpoint["obs_norm_state_dict"]["_std"])
+    return None
+
+
+def load_motion(log_dir: str, deploy_cfg: dict):
+    """Motion track of mimic runs, from the ``motion_file`` recorded in ``params/env.yaml``."""
+    env_yaml = os.path.join(log_dir, "params", "env.yaml")
+    if not os.path.isfile(env_yaml):
+        return None
+    with open(env_yaml) as f:
+        env_cfg = yaml.load(f, Loader=_ParamsLoader)
+    motion_file = ((env_cfg.get("commands") or {}).get("motion") or {}).get("motion_file")
+    if motion_file is None:
+        return None
+    if not os.path.isfile(motion_file):
+        print(f"[WARN]: Motion file {motion_file} not found, the bundle will not contain the motion.")
+        return None
+    return motion_from_npz(motion_file, deploy_cfg["joint_ids_map"])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Export an RSL-RL checkpoint to onnx/jit without the simulator.")
+    parser.add_argument("checkpoint", type=str, help="Checkpoint file, or run directory to export the latest one.")
+    parser.add_argument("--opset", type=int, default=11, help="Onnx opset version.")
+    parser.add_argument("--no_bundle", action="store_true", default=False, help="Do not write exported/policy.bundle.")
+    args = parser.parse_args()
+
+    resume_path = find_checkpoint(args.checkpoint)
+    log_dir = os.path.dirname(resume_path)
+    with open(os.path.join(log_dir, "params", "agent.yaml")) as f:
+        agent_cfg = yaml.load(f, Loader=_ParamsLoader)
+    with open(os.path.join(log_dir, "params", "deploy.yaml")) as f:
+        deploy_cfg = yaml.safe_load(f)
+
+    print(f"[INFO]: Loading model checkpoint from: {resume_path}")
+    checkpoint = torch.load(resume_path, map_location="cpu", weights_only=False)
+    actor = build_actor(agent_cfg["policy"], checkpoint["model_state_dict"])
+    normalizer = build_normalizer(checkpoint)
+    policy = Policy(actor, normalizer).eval()
+
+    # the deploy runtime feeds the observations described in deploy.yaml, they must match the trained input
+    num_obs = sum(len(term["scale"]) * term.get("history_length", 1) for term in deploy_cfg["observations"].values())
+    num_actions = sum(len(term["scale"]) for term in deploy_cfg["actions"].values())
+    if actor[0].in_features != num_obs or actor[-1].out_features != num_actions:
+        raise ValueError(
+            f"Checkpoint expects {actor[0].in_features} observations and {actor[-1].out_features} actions,"
+            f" deploy.yaml describes {num_obs} and {num_actions}."
+        )
+
+    export_model_dir = os.path.join(log_dir, "exported")
+    os.makedirs(export_model_dir, exist_ok=True)
+    obs = torch.zeros(1, num_obs)
+    with torch.no_grad():
+        torch.jit.script(policy).save(os.path.join(export_model_dir, "policy.pt"))
+        torch.onnx.export(
+            policy,
+            obs,
+            os.path.join(export_model_dir, "policy.onnx"),
+            export_params=True,
+            opset_version=args.opset,
+            verbose=False,
+            input_names=["obs"],
+            output_names=["actions"],
+            dynamic_axes={},
+        )
+    print(f"[INFO]: Exported policy ({num_obs} -> {num_actions}) to {export_model_dir}")
+
+    if not args.no_bundle:
+        normalizer_stats = None
+        if normalizer is not None:
+            normalizer_stats = (normalizer.mean.numpy(), normalizer.std.numpy(), normalizer.eps)
+        build_policy_bundle(log_dir, normalizer=normalizer_stats, motion=load_motion(log_dir, deploy_cfg))
+
+
+if __name__ == "__main__":
+    main()
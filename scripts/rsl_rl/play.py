@@ -30,6 +30,12 @@ parser.add_argument(
     help="Use the pre-trained checkpoint from Nucleus.",
 )
 parser.add_argument("--real-time", action="store_true", default=False, help="Run in real-time, if possible.")
+parser.add_argument(
+    "--optimize_onnx",
+    action="store_true",
+    default=False,
+    help="Write optimized onnx variants and compare them on the observations of the first steps.",
+)
 # append RSL-RL cli arguments
 cli_args.add_rsl_rl_args(parser)
 # append AppLauncher cli args
@@ -46,9 +52,11 @@ simulation_app = app_launcher.app
 """Rest everything follows."""
 
 import gymnasium as gym
+import numpy as np
 import os
 import time
 import torch
+import yaml
 
 from rsl_rl.runners import OnPolicyRunner
 
@@ -61,7 +69,9 @@ from isaaclab_rl.rsl_rl import RslRlOnPolicyRunnerCfg, RslRlVecEnvWrapper, expor
 from isaaclab_tasks.utils import get_checkpoint_path
 
 import unitree_rl_lab.tasks  # noqa: F401
+from unitree_rl_lab.utils.onnx_optimize import optimize_policy
 from unitree_rl_lab.utils.parser_cfg import parse_env_cfg
+from unitree_rl_lab.utils.policy_bundle import build_policy_bundle, motion_from_npz
 
 
 def main():
@@ -151,6 +161,23 @@ def main():
     export_policy_as_jit(policy_nn, normalizer=normalizer, path=export_model_dir, filename="policy.pt")
     export_policy_as_onnx(policy_nn, normalizer=normalizer, path=export_model_dir, filename="policy.onnx")
 
+    # bundle the onnx graph with its deploy config (and motion) into a single file for the robot
+    if os.path.isfile(os.path.join(log_dir, "params", "deploy.yaml")):
+        normalizer_stats = None
+        if normalizer is not None and hasattr(normalizer, "_mean"):
+            normalizer_stats = (
+                normalizer._mean.detach().cpu().numpy(),
+                normalizer._std.detach().cpu().numpy(),
+                float(normalizer.eps),
+            )
+        motion = None
+        motion_cfg = getattr(env.unwrapped.cfg.commands, "motion", None)
+        if motion_cfg is not None and hasattr(motion_cfg, "motion_file"):
+            with open(os.path.join(log_dir, "params", "deploy.yaml")) as f:
+                joint_ids_map = yaml.safe_load(f)["joint_ids_map"]
+            motion = motion_from_npz(motion_cfg.motion_file, joint_ids_map)
+        build_policy_bundle(log_dir, normalizer=normalizer_stats, motion=motion)
+
     dt = env.unwrapped.step_dt
 
     # reset environment
@@ -158,6 +185,8 @@ def main():
     if version("rsl-rl-lib").startswith("2.3."):
         obs, _ = env.get_observations()
     timestep = 0
+    # observations fed to the onnx variants, recorded over the first steps
+    recorded_obs = [] if args_cli.optimize_onnx else None
     # simulate environment
     while simulation_app.is_running():
         start_time = time.time()
@@ -165,6 +194,11 @@ def main():
         with torch.inference_mode():
             # agent stepping
             actions = policy(obs)
+            if recorded_obs is not None:
+                recorded_obs.append((obs if isinstance(obs, torch.Tensor) else obs["policy"]).cpu().numpy())
+                if len(recorded_obs) == 100:
+                    optimize_policy(export_model_dir, np.concatenate(recorded_obs), int8=True, fp16=True)
+                    recorded_obs = None
             # env stepping
             obs, _, _, _ = env.step(actions)
         if args_cli.video:
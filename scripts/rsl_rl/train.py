@@ -8,19 +8,12 @@
 """Launch Isaac Sim Simulator first."""
 
 
-import gymnasium as gym
-import pathlib
 import sys
 
-sys.path.insert(0, f"{pathlib.Path(__file__).parent.parent}")
-from list_envs import import_packages  # noqa: F401
-
-sys.path.pop(0)
+from unitree_rl_lab.utils.task_registry import task_ids
 
-tasks = []
-for task_spec in gym.registry.values():
-    if "Unitree" in task_spec.id and "Isaac" not in task_spec.id:
-        tasks.append(task_spec.id)
+# read from the static task manifest, so that argument completion does not import the task packages
+tasks = task_ids()
 
 import argparse
 
@@ -43,6 +36,24 @@ parser.add_argument("--max_iterations", type=int, default=None, help="RL Policy
 parser.add_argument(
     "--distributed", action="store_true", default=False, help="Run training with multiple GPUs or nodes."
 )
+parser.add_argument(
+    "--profile_terms", action="store_true", default=False, help="Log the time spent in every term to TensorBoard."
+)
+parser.add_argument(
+    "--sync_checkpoint", action="store_true", default=False, help="Write checkpoints on the training thread."
+)
+parser.add_argument(
+    "--keep_last", type=int, default=0, help="Number of most recent checkpoints kept on disk, 0 keeps all."
+)
+parser.add_argument(
+    "--keep_best", type=int, default=0, help="Number of best checkpoints kept on top of the --keep_last most recent."
+)
+parser.add_argument(
+    "--best_metric",
+    type=str,
+    default="reward",
+    help="Metric ranking checkpoints for --keep_best: 'reward', 'episode_length' or an episode info key.",
+)
 # append RSL-RL cli arguments
 cli_args.add_rsl_rl_args(parser)
 # append AppLauncher cli args
@@ -109,7 +120,9 @@ from isaaclab_tasks.utils import get_checkpoint_path
 from isaaclab_tasks.utils.hydra import hydra_task_config
 
 import unitree_rl_lab.tasks  # noqa: F401
+from unitree_rl_lab.utils.async_checkpoint import AsyncCheckpointer
 from unitree_rl_lab.utils.export_deploy_cfg import export_deploy_cfg
+from unitree_rl_lab.utils.term_profiler import TermProfiler
 
 torch.backends.cuda.matmul.allow_tf32 = True
 torch.backends.cudnn.allow_tf32 = True
@@ -200,8 +213,26 @@ def main(env_cfg: ManagerBasedRLEnvCfg | DirectRLEnvCfg | DirectMARLEnvCfg, agen
         os.path.join(log_dir, "params", os.path.basename(inspect.getfile(env_cfg.__class__))),
     )
 
+    # write checkpoints from a background thread
+    checkpointer = None
+    if not args_cli.sync_checkpoint:
+        checkpointer = AsyncCheckpointer(
+            runner, keep_last=args_cli.keep_last, keep_best=args_cli.keep_best, metric=args_cli.best_metric
+        )
+    elif args_cli.keep_last > 0 or args_cli.keep_best > 0:
+        print("[WARNING]: --keep_last and --keep_best are ignored with --sync_checkpoint.")
+
+    # time every manager term and learning step
+    if args_cli.profile_terms:
+        TermProfiler(env.unwrapped, runner)
+
     # run training
-    runner.learn(num_learning_iterations=agent_cfg.max_iterations, init_at_random_ep_len=True)
+    try:
+        runner.learn(num_learning_iterations=agent_cfg.max_iterations, init_at_random_ep_len=True)
+    finally:
+        if checkpointer is not None:
+            # flush the last checkpoint
+            checkpointer.close()
 
     # close the simulator
     env.close()
@@ -2,9 +2,8 @@
 # Register Gym environments.
 ##
 
-from isaaclab_tasks.utils import import_packages
+# Tasks are registered from the static manifest of their `register` calls, so that importing this package
+# does not import any robot package. The config of a task is imported when the task is created.
+from unitree_rl_lab.utils.task_registry import register_tasks
 
-# The blacklist is used to prevent importing configs from sub-packages
-_BLACKLIST_PKGS = []
-# Import all configs in this package
-import_packages(__name__, _BLACKLIST_PKGS)
+register_tasks()
@@ -1,7 +1,13 @@
-from isaaclab.envs.mdp import *  # noqa: F401, F403
-from isaaclab_tasks.manager_based.locomotion.velocity.mdp import *  # noqa: F401, F403
+"""This sub-module contains the functions that are specific to the locomotion environments.
 
-from .commands import *  # noqa: F401, F403
-from .curriculums import *  # noqa: F401, F403
-from .observations import *  # noqa: F401, F403
-from .rewards import *  # noqa: F401, F403
+Terms are resolved on first access, see :mod:`unitree_rl_lab.utils.lazy_import`. The lookup order is the same
+as star-importing ``isaaclab.envs.mdp``, the Isaac Lab velocity mdp and then the submodules below.
+"""
+
+from unitree_rl_lab.utils.lazy_import import lazy_module
+
+__getattr__, __dir__ = lazy_module(
+    __name__,
+    submodules=["commands", "curriculums", "events", "observations", "rewards"],
+    fallbacks=["isaaclab_tasks.manager_based.locomotion.velocity.mdp", "isaaclab.envs.mdp"],
+)
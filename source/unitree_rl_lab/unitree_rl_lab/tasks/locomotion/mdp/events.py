@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import torch
+from typing import TYPE_CHECKING
+
+import isaaclab.utils.math as math_utils
+from isaaclab.assets import Articulation
+from isaaclab.managers import EventTermCfg, ManagerTermBase, SceneEntityCfg
+
+from unitree_rl_lab.utils.terrain_cache import height_field
+
+if TYPE_CHECKING:
+    from isaaclab.envs import ManagerBasedEnv
+
+AXES = ["x", "y", "z", "roll", "pitch", "yaw"]
+
+
+class reset_root_state_from_slots(ManagerTermBase):
+    """Reset the asset root state to a random spawn slot of the terrain tile of the environment.
+
+    Same distribution as ``reset_root_state_uniform``, drawn from ``num_slots`` spawn poses per tile of the terrain
+    sampled once from ``pose_range`` when the term is created, instead of at every reset. The height of every slot
+    is adjusted to the terrain below it when the terrain has a height field (see
+    :func:`~unitree_rl_lab.utils.terrain_cache.height_field`), relative to the origin of its tile, so that robots do
+    not spawn inside or above the bumps around the origin. A reset then gathers the slots of the tiles the terrain
+    curriculum moved the environments to, and only samples velocities when ``velocity_range`` is not zero.
+    """
+
+    def __init__(self, cfg: EventTermCfg, env: ManagerBasedEnv):
+        super().__init__(cfg, env)
+        asset_cfg: SceneEntityCfg = cfg.params.get("asset_cfg", SceneEntityCfg("robot"))
+        self.asset: Articulation = env.scene[asset_cfg.name]
+        self.terrain = env.scene.terrain
+        num_slots = cfg.params.get("num_slots", 256)
+
+        # tiles of the terrain generator, a single one when the env origins are on a grid
+        self.tiled = self.terrain.terrain_origins is not None
+        if self.tiled:
+            self.num_cols = self.terrain.terrain_origins.shape[1]
+            origins = self.terrain.terrain_origins.view(-1, 3)
+        else:
+            origins = torch.zeros(1, 3, device=self.device)
+
+        pose_range = cfg.params["pose_range"]
+        ranges = torch.tensor([pose_range.get(key, (0.0, 0.0)) for key in AXES], device=self.device)
+        samples = math_utils.sample_uniform(ranges[:, 0], ranges[:, 1], (len(origins), num_slots, 6), self.device)
+        self.slot_pos = samples[..., :3]
+        """Offsets of the slots from the origin of their tile and the default root position. Shape is (T, S, 3)."""
+        self.slot_quat = math_utils.quat_from_euler_xyz(samples[..., 3], samples[..., 4], samples[..., 5])
+        """Rotations of the slots from the default root orientation. Shape is (T, S, 4)."""
+
+        field = height_field(self.terrain.cfg.terrain_generator) if self.tiled else None
+        if field is not None:
+            self.slot_pos[..., 2] += field.sample(origins[:, None, :2] + self.slot_pos[..., :2]) - origins[:, None, 2]
+
+        velocity_range = cfg.params["velocity_range"]
+        self.velocity_ranges = torch.tensor([velocity_range.get(key, (0.0, 0.0)) for key in AXES], device=self.device)
+        self.sample_velocities = bool(self.velocity_ranges.any())
+
+    def __call__(
+        self,
+        env: ManagerBasedEnv,
+        env_ids: torch.Tensor,
+        pose_range: dict[str, tuple[float, float]],
+        velocity_range: dict[str, tuple[float, float]],
+        asset_cfg: SceneEntityCfg = SceneEntityCfg("robot"),
+        num_slots: int = 256,
+    ):
+        if self.tiled:
+            tiles = self.terrain.terrain_levels[env_ids] * self.num_cols + self.terrain.terrain_types[env_ids]
+        else:
+            tiles = torch.zeros_like(env_ids)
+        slots = torch.randint(0, self.slot_pos.shape[1], (len(env_ids),), device=self.device)
+
+        default_root_state = self.asset.data.default_root_state[env_ids]
+        positions = default_root_state[:, :3] + env.scene.env_origins[env_ids] + self.slot_pos[tiles, slots]
+        orientations = math_utils.quat_mul(default_root_state[:, 3:7], self.slot_quat[tiles, slots])
+        velocities = default_root_state[:, 7:13]
+        if self.sample_velocities:
+            velocities = velocities + math_utils.sample_uniform(
+                self.velocity_ranges[:, 0], self.velocity_ranges[:, 1], (len(env_ids), 6), self.device
+            )
+
+        self.asset.write_root_pose_to_sim(torch.cat([positions, orientations], dim=-1), env_ids=env_ids)
+        self.asset.write_root_velocity_to_sim(velocities, env_ids=env_ids)
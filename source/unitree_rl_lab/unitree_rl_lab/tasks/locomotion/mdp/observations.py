@@ -3,6 +3,12 @@ from __future__ import annotations
 import torch
 from typing import TYPE_CHECKING
 
+from isaaclab.assets import Articulation
+from isaaclab.managers import ManagerTermBase, ObservationTermCfg, SceneEntityCfg
+from isaaclab.sensors import patterns
+
+from unitree_rl_lab.utils.terrain_cache import height_field
+
 if TYPE_CHECKING:
     from isaaclab.envs import ManagerBasedRLEnv
 
@@ -17,3 +23,51 @@ def gait_phase(env: ManagerBasedRLEnv, period: float) -> torch.Tensor:
     phase[:, 0] = torch.sin(global_phase * torch.pi * 2.0)
     phase[:, 1] = torch.cos(global_phase * torch.pi * 2.0)
     return phase
+
+
+class height_field_scan(ManagerTermBase):
+    """Height scan of the terrain around a body, looked up in the height field of the terrain instead of ray-cast.
+
+    Returns the same values as ``height_scan`` of a ray caster attached to the body with the same pattern and ray
+    alignment, the height of the body above the terrain at every point of the pattern minus ``offset``, without a
+    ray caster in the scene. The terrain must be generated by
+    :class:`~unitree_rl_lab.utils.terrain_cache.CachedTerrainGenerator`, whose height field is bilinear between points
+    ``horizontal_scale`` apart: the heights differ from the ray-cast ones within a cell of the edges of steps and boxes.
+
+    The term is opt-in, no task observes it by default (see the commented-out term of the Go2 critic observations).
+    """
+
+    def __init__(self, cfg: ObservationTermCfg, env: ManagerBasedRLEnv):
+        super().__init__(cfg, env)
+        asset_cfg: SceneEntityCfg = cfg.params["asset_cfg"]
+        self.asset: Articulation = env.scene[asset_cfg.name]
+        self.body_id = asset_cfg.body_ids[0]
+
+        terrain_cfg = env.scene.terrain.cfg
+        self.height_field = (
+            height_field(terrain_cfg.terrain_generator) if terrain_cfg.terrain_type == "generator" else None
+        )
+        if self.height_field is None:
+            raise ValueError("height_field_scan needs a terrain generated by CachedTerrainGenerator.")
+        if cfg.params.get("ray_alignment", "yaw") not in ("yaw", "world"):
+            raise ValueError("height_field_scan only casts vertical rays, the ray alignment must be 'yaw' or 'world'.")
+        pattern_cfg: patterns.PatternBaseCfg = cfg.params["pattern_cfg"]
+        self.points = pattern_cfg.func(pattern_cfg, self.device)[0][:, :2]
+
+    def __call__(
+        self,
+        env: ManagerBasedRLEnv,
+        asset_cfg: SceneEntityCfg,
+        pattern_cfg: patterns.PatternBaseCfg,
+        offset: float = 0.5,
+        ray_alignment: str = "yaw",
+    ) -> torch.Tensor:
+        pos_w = self.asset.data.body_pos_w[:, self.body_id]
+        points = self.points
+        if ray_alignment == "yaw":
+            # heading of the body as the rotation of its x axis in the xy-plane
+            w, x, y, z = self.asset.data.body_quat_w[:, self.body_id].unbind(-1)
+            heading = torch.stack([1.0 - 2.0 * (y * y + z * z), 2.0 * (x * y + w * z)], dim=-1)
+            cos, sin = torch.nn.functional.normalize(heading, dim=-1)[:, None, :].unbind(-1)
+            points = torch.stack([cos * points[:, 0] - sin * points[:, 1], sin * points[:, 0] + cos * points[:, 1]], -1)
+        return pos_w[:, 2:3] - self.height_field.sample(pos_w[:, None, :2] + points) - offset
@@ -1,6 +1,6 @@
-import gymnasium as gym
+from unitree_rl_lab.utils.task_registry import register
 
-gym.register(
+register(
     id="Unitree-Go2-Velocity",
     entry_point="isaaclab.envs:ManagerBasedRLEnv",
     disable_env_checker=True,
@@ -11,7 +11,7 @@ gym.register(
     },
 )
 
-gym.register(
+register(
     id="Unitree-Go2-VelocityPose",
     entry_point="isaaclab.envs:ManagerBasedRLEnv",
     disable_env_checker=True,
@@ -21,4 +21,3 @@ gym.register(
         "rsl_rl_cfg_entry_point": f"unitree_rl_lab.tasks.locomotion.agents.rsl_rl_ppo_cfg:BasePPORunnerCfg",
     },
 )
-
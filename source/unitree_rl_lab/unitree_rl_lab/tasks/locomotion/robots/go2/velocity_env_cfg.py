@@ -20,6 +20,8 @@ from isaaclab.utils.noise import AdditiveUniformNoiseCfg as Unoise
 
 from unitree_rl_lab.assets.robots.unitree import UNITREE_GO2_CFG as ROBOT_CFG
 from unitree_rl_lab.tasks.locomotion import mdp
+from unitree_rl_lab.utils.sensor_cfg import narrow_contact_sensor, remove_unread_sensors
+from unitree_rl_lab.utils.terrain_cache import CachedTerrainGenerator
 
 COBBLESTONE_ROAD_CFG = terrain_gen.TerrainGeneratorCfg(
     size=(8.0, 8.0),
@@ -31,6 +33,7 @@ COBBLESTONE_ROAD_CFG = terrain_gen.TerrainGeneratorCfg(
     slope_threshold=0.75,
     difficulty_range=(0.0, 1.0),
     use_cache=False,
+    class_type=CachedTerrainGenerator,  # the whole terrain is cached in cache_dir instead
     sub_terrains={
         "flat": terrain_gen.MeshPlaneTerrainCfg(proportion=0.1),
         # "random_rough": terrain_gen.HfRandomUniformTerrainCfg(
@@ -151,7 +154,7 @@ class EventCfg:
     )
 
     reset_base = EventTerm(
-        func=mdp.reset_root_state_uniform,
+        func=mdp.reset_root_state_from_slots,
         mode="reset",
         params={
             "pose_range": {"x": (-0.5, 0.5), "y": (-0.5, 0.5), "yaw": (-3.14, 3.14)},
@@ -253,8 +256,12 @@ class ObservationsCfg:
         joint_vel_rel = ObsTerm(func=mdp.joint_vel_rel, scale=0.05, clip=(-100, 100))
         joint_effort = ObsTerm(func=mdp.joint_effort, scale=0.01, clip=(-100, 100))
         last_action = ObsTerm(func=mdp.last_action, clip=(-100, 100))
-        # height_scanner = ObsTerm(func=mdp.height_scan,
-        #     params={"sensor_cfg": SceneEntityCfg("height_scanner")},
+        # height scan looked up in the height field of the cached terrain, without the height_scanner ray caster
+        # height_scanner = ObsTerm(func=mdp.height_field_scan,
+        #     params={
+        #         "asset_cfg": SceneEntityCfg("robot", body_names="base"),
+        #         "pattern_cfg": patterns.GridPatternCfg(resolution=0.1, size=[1.6, 1.0]),
+        #     },
         #     clip=(-1.0, 5.0),
         # )
 
@@ -404,6 +411,11 @@ class RobotEnvCfg(ManagerBasedRLEnvCfg):
             if self.scene.terrain.terrain_generator is not None:
                 self.scene.terrain.terrain_generator.curriculum = False
 
+        # only sense the bodies the terms read, the sensor covers all the bodies of the robot otherwise, and drop the
+        # sensors no term reads (the height scanner when its observation is disabled)
+        narrow_contact_sensor(self)
+        remove_unread_sensors(self)
+
 
 @configclass
 class RobotPlayEnvCfg(RobotEnvCfg):
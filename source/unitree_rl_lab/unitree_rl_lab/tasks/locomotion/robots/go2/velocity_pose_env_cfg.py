@@ -33,6 +33,8 @@ from isaaclab.utils.noise import AdditiveUniformNoiseCfg as Unoise
 
 from unitree_rl_lab.assets.robots.unitree import UNITREE_GO2_CFG as ROBOT_CFG
 from unitree_rl_lab.tasks.locomotion import mdp
+from unitree_rl_lab.utils.sensor_cfg import narrow_contact_sensor, remove_unread_sensors
+from unitree_rl_lab.utils.terrain_cache import CachedTerrainGenerator
 
 # Flat terrain for initial curriculum stage
 FLAT_TERRAIN_CFG = terrain_gen.TerrainGeneratorCfg(
@@ -45,6 +47,7 @@ FLAT_TERRAIN_CFG = terrain_gen.TerrainGeneratorCfg(
     slope_threshold=0.75,
     difficulty_range=(0.0, 1.0),
     use_cache=False,
+    class_type=CachedTerrainGenerator,  # the whole terrain is cached in cache_dir instead
     sub_terrains={
         "flat": terrain_gen.MeshPlaneTerrainCfg(proportion=1.0),
     },
@@ -138,7 +141,7 @@ class EventCfg:
     )
 
     reset_base = EventTerm(
-        func=mdp.reset_root_state_uniform,
+        func=mdp.reset_root_state_from_slots,
         mode="reset",
         params={
             "pose_range": {"x": (-0.5, 0.5), "y": (-0.5, 0.5), "yaw": (-3.14, 3.14)},
@@ -414,6 +417,11 @@ class RobotVelocityPoseEnvCfg(ManagerBasedRLEnvCfg):
         self.scene.contact_forces.update_period = self.sim.dt
         self.scene.height_scanner.update_period = self.decimation * self.sim.dt
 
+        # only sense the bodies the terms read, the sensor covers all the bodies of the robot otherwise, and drop the
+        # sensors no term reads (the height scanner when its observation is disabled)
+        narrow_contact_sensor(self)
+        remove_unread_sensors(self)
+
 
 class RobotVelocityPosePlayEnvCfg(RobotVelocityPoseEnvCfg):
     """Configuration for playing/inference with the Go2 velocity & pose control environment."""
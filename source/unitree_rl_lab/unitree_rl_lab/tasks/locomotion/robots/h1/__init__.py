@@ -1,6 +1,6 @@
-import gymnasium as gym
+from unitree_rl_lab.utils.task_registry import register
 
-gym.register(
+register(
     id="Unitree-H1-Velocity",
     entry_point="isaaclab.envs:ManagerBasedRLEnv",
     disable_env_checker=True,
@@ -1,11 +1,13 @@
-"""This sub-module contains the functions that are specific to the locomotion environments."""
+"""This sub-module contains the functions that are specific to the motion tracking environments.
 
-from isaaclab.envs.mdp import *  # noqa: F401, F403
+Terms are resolved on first access, see :mod:`unitree_rl_lab.utils.lazy_import`. The lookup order is the same
+as star-importing ``isaaclab.envs.mdp`` and then the submodules below.
+"""
 
-from unitree_rl_lab.tasks.mimic.mdp import *  # noqa: F401, F403
+from unitree_rl_lab.utils.lazy_import import lazy_module
 
-from .commands import *  # noqa: F401, F403
-from .events import *  # noqa: F401, F403
-from .observations import *  # noqa: F401, F403
-from .rewards import *  # noqa: F401, F403
-from .terminations import *  # noqa: F401, F403
+__getattr__, __dir__ = lazy_module(
+    __name__,
+    submodules=["commands", "events", "observations", "rewards", "terminations"],
+    fallbacks=["isaaclab.envs.mdp"],
+)
@@ -27,6 +27,45 @@ if TYPE_CHECKING:
     from isaaclab.envs import ManagerBasedRLEnv
 
 
+def _quat_conj_mul(q1: torch.Tensor, q2: torch.Tensor) -> torch.Tensor:
+    """Product of the conjugate of the unit quaternions ``q1`` with ``q2``, broadcasting their leading dimensions."""
+    w1, x1, y1, z1 = q1.unbind(-1)
+    w2, x2, y2, z2 = q2.unbind(-1)
+    return torch.stack(
+        (
+            w1 * w2 + x1 * x2 + y1 * y2 + z1 * z2,
+            w1 * x2 - x1 * w2 - y1 * z2 + z1 * y2,
+            w1 * y2 + x1 * z2 - y1 * w2 - z1 * x2,
+            w1 * z2 - x1 * y2 + y1 * x2 - z1 * w2,
+        ),
+        dim=-1,
+    )
+
+
+def _quat_conj_apply(quat: torch.Tensor, vec: torch.Tensor) -> torch.Tensor:
+    """Rotate ``vec`` by the inverse of the unit quaternions ``quat``, broadcasting their leading dimensions."""
+    xyz = -quat[..., 1:]
+    t = 2.0 * torch.linalg.cross(xyz.expand_as(vec), vec, dim=-1)
+    return vec + quat[..., :1] * t + torch.linalg.cross(xyz.expand_as(t), t, dim=-1)
+
+
+def _rotation_6d(quat: torch.Tensor) -> torch.Tensor:
+    """First two columns of the rotation matrices of ``quat``, row by row, as ``matrix_from_quat(quat)[..., :2]``."""
+    w, x, y, z = quat.unbind(-1)
+    two_s = 2.0 / (quat * quat).sum(-1)
+    return torch.stack(
+        (
+            1.0 - two_s * (y * y + z * z),
+            two_s * (x * y - z * w),
+            two_s * (x * y + z * w),
+            1.0 - two_s * (x * x + z * z),
+            two_s * (x * z - y * w),
+            two_s * (y * z + x * w),
+        ),
+        dim=-1,
+    )
+
+
 class MotionLoader:
     def __init__(self, motion_file: str, body_indexes: Sequence[int], device: str = "cpu"):
         assert os.path.isfile(motion_file), f"Invalid file path: {motion_file}"
@@ -76,6 +115,10 @@ class MotionCommand(CommandTerm):
         self.body_pos_relative_w = torch.zeros(self.num_envs, len(cfg.body_names), 3, device=self.device)
         self.body_quat_relative_w = torch.zeros(self.num_envs, len(cfg.body_names), 4, device=self.device)
         self.body_quat_relative_w[:, :, 0] = 1.0
+        # quantities shared by the observation, reward and termination terms, computed once per step
+        self._step_cache: dict[str, torch.Tensor | tuple[torch.Tensor, torch.Tensor]] = {}
+        self._step_cache_step = -1
+        self._body_subsets: dict[tuple[str, ...] | None, slice | torch.Tensor] = {}
 
         self.bin_count = int(self.motion.time_step_total // (1 / (env.cfg.decimation * env.cfg.sim.dt))) + 1
         self.bin_failed_count = torch.zeros(self.bin_count, dtype=torch.float, device=self.device)
@@ -91,6 +134,8 @@ class MotionCommand(CommandTerm):
         self.metrics["error_anchor_ang_vel"] = torch.zeros(self.num_envs, device=self.device)
         self.metrics["error_body_pos"] = torch.zeros(self.num_envs, device=self.device)
         self.metrics["error_body_rot"] = torch.zeros(self.num_envs, device=self.device)
+        self.metrics["error_body_lin_vel"] = torch.zeros(self.num_envs, device=self.device)
+        self.metrics["error_body_ang_vel"] = torch.zeros(self.num_envs, device=self.device)
         self.metrics["error_joint_pos"] = torch.zeros(self.num_envs, device=self.device)
         self.metrics["error_joint_vel"] = torch.zeros(self.num_envs, device=self.device)
         self.metrics["sampling_entropy"] = torch.zeros(self.num_envs, device=self.device)
@@ -181,28 +226,123 @@ class MotionCommand(CommandTerm):
     def robot_anchor_ang_vel_w(self) -> torch.Tensor:
         return self.robot.data.body_ang_vel_w[:, self.robot_anchor_body_index]
 
-    def _update_metrics(self):
-        self.metrics["error_anchor_pos"] = torch.norm(self.anchor_pos_w - self.robot_anchor_pos_w, dim=-1)
-        self.metrics["error_anchor_rot"] = quat_error_magnitude(self.anchor_quat_w, self.robot_anchor_quat_w)
-        self.metrics["error_anchor_lin_vel"] = torch.norm(self.anchor_lin_vel_w - self.robot_anchor_lin_vel_w, dim=-1)
-        self.metrics["error_anchor_ang_vel"] = torch.norm(self.anchor_ang_vel_w - self.robot_anchor_ang_vel_w, dim=-1)
-
-        self.metrics["error_body_pos"] = torch.norm(self.body_pos_relative_w - self.robot_body_pos_w, dim=-1).mean(
-            dim=-1
+    def robot_body_frames_b(self) -> tuple[torch.Tensor, torch.Tensor]:
+        """Positions and 6-D orientations of the robot bodies in the frame of the robot anchor body."""
+        return self._memoize(
+            "robot_body_frames_b",
+            lambda: self._relative_frames(
+                self.robot_anchor_pos_w[:, None],
+                self.robot_anchor_quat_w[:, None],
+                self.robot_body_pos_w,
+                self.robot_body_quat_w,
+            ),
         )
-        self.metrics["error_body_rot"] = quat_error_magnitude(self.body_quat_relative_w, self.robot_body_quat_w).mean(
-            dim=-1
+
+    def motion_anchor_frame_b(self) -> tuple[torch.Tensor, torch.Tensor]:
+        """Position and 6-D orientation of the motion anchor body in the frame of the robot anchor body."""
+        return self._memoize(
+            "motion_anchor_frame_b",
+            lambda: self._relative_frames(
+                self.robot_anchor_pos_w, self.robot_anchor_quat_w, self.anchor_pos_w, self.anchor_quat_w
+            ),
         )
 
-        self.metrics["error_body_lin_vel"] = torch.norm(self.body_lin_vel_w - self.robot_body_lin_vel_w, dim=-1).mean(
-            dim=-1
+    @staticmethod
+    def _relative_frames(
+        pos_a: torch.Tensor, quat_a: torch.Tensor, pos: torch.Tensor, quat: torch.Tensor
+    ) -> tuple[torch.Tensor, torch.Tensor]:
+        """``subtract_frame_transforms(pos_a, quat_a, pos, quat)`` with broadcasting, orientations as 6-D features."""
+        return _quat_conj_apply(quat_a, pos - pos_a), _rotation_6d(_quat_conj_mul(quat_a, quat))
+
+    def body_subset(self, body_names: list[str] | None) -> slice | torch.Tensor:
+        """Index of the bodies of ``cfg.body_names`` that are in ``body_names`` (all if None), resolved once.
+
+        The index is a slice when the bodies are contiguous, a tensor on the device otherwise, so that indexing with
+        it does not copy an index list to the device on every call.
+        """
+        key = None if body_names is None else tuple(body_names)
+        if key not in self._body_subsets:
+            ids = [i for i, name in enumerate(self.cfg.body_names) if (body_names is None) or (name in body_names)]
+            if ids and ids == list(range(ids[0], ids[-1] + 1)):
+                self._body_subsets[key] = slice(ids[0], ids[-1] + 1)
+            else:
+                self._body_subsets[key] = torch.tensor(ids, dtype=torch.long, device=self.device)
+        return self._body_subsets[key]
+
+    def body_error(self, kind: str) -> torch.Tensor:
+        """Tracking error of every body of ``cfg.body_names``, of shape (num_envs, num_bodies), computed once per step.
+
+        Args:
+            kind: ``"pos"`` (squared distance of the positions relative to the anchor), ``"pos_z"`` (absolute height
+                difference of these positions), ``"rot"`` (squared rotation angle), ``"lin_vel"`` or ``"ang_vel"``
+                (squared norm of the velocity differences in the world frame).
+        """
+        if kind in ("pos", "pos_z"):
+            diff = self._memoize("body_pos_diff", lambda: self.body_pos_relative_w - self.robot_body_pos_w)
+            if kind == "pos_z":
+                return self._memoize("body_error_pos_z", lambda: diff[..., 2].abs())
+            return self._memoize("body_error_pos", lambda: diff.square().sum(-1))
+        if kind == "rot":
+            return self._memoize(
+                "body_error_rot",
+                lambda: quat_error_magnitude(self.body_quat_relative_w, self.robot_body_quat_w).square(),
+            )
+        if kind == "lin_vel":
+            return self._memoize(
+                "body_error_lin_vel", lambda: (self.body_lin_vel_w - self.robot_body_lin_vel_w).square().sum(-1)
+            )
+        if kind == "ang_vel":
+            return self._memoize(
+                "body_error_ang_vel", lambda: (self.body_ang_vel_w - self.robot_body_ang_vel_w).square().sum(-1)
+            )
+        raise ValueError(f"Unknown body error '{kind}'.")
+
+    def _memoize(self, key: str, compute):
+        """Result of ``compute`` cached until the next step, command update or resampling."""
+        if self._step_cache_step != self._env.common_step_counter:
+            self._step_cache.clear()
+            self._step_cache_step = self._env.common_step_counter
+        if key not in self._step_cache:
+            self._step_cache[key] = compute()
+        return self._step_cache[key]
+
+    def reset(self, env_ids: Sequence[int] | None = None) -> dict[str, float]:
+        if self.cfg.metrics_interval == 0:
+            # the metrics of the envs are only read here, when their episode ends
+            self._update_metrics(slice(None) if env_ids is None else env_ids)
+        return super().reset(env_ids)
+
+    def _update_metrics(self, env_ids: Sequence[int] | slice | None = None):
+        if env_ids is None:  # every step, from compute()
+            if self.cfg.metrics_interval == 0 or self._env.common_step_counter % self.cfg.metrics_interval != 0:
+                return
+            env_ids = slice(None)
+
+        self.metrics["error_anchor_pos"][env_ids] = torch.norm(
+            self.anchor_pos_w[env_ids] - self.robot_anchor_pos_w[env_ids], dim=-1
         )
-        self.metrics["error_body_ang_vel"] = torch.norm(self.body_ang_vel_w - self.robot_body_ang_vel_w, dim=-1).mean(
-            dim=-1
+        self.metrics["error_anchor_rot"][env_ids] = quat_error_magnitude(
+            self.anchor_quat_w[env_ids], self.robot_anchor_quat_w[env_ids]
+        )
+        self.metrics["error_anchor_lin_vel"][env_ids] = torch.norm(
+            self.anchor_lin_vel_w[env_ids] - self.robot_anchor_lin_vel_w[env_ids], dim=-1
+        )
+        self.metrics["error_anchor_ang_vel"][env_ids] = torch.norm(
+            self.anchor_ang_vel_w[env_ids] - self.robot_anchor_ang_vel_w[env_ids], dim=-1
         )
 
-        self.metrics["error_joint_pos"] = torch.norm(self.joint_pos - self.robot_joint_pos, dim=-1)
-        self.metrics["error_joint_vel"] = torch.norm(self.joint_vel - self.robot_joint_vel, dim=-1)
+        # squared body errors of the step, usually already computed by the rewards and terminations
+        self.metrics["error_body_pos"][env_ids] = self.body_error("pos")[env_ids].sqrt().mean(dim=-1)
+        self.metrics["error_body_rot"][env_ids] = self.body_error("rot")[env_ids].sqrt().mean(dim=-1)
+        self.metrics["error_body_lin_vel"][env_ids] = self.body_error("lin_vel")[env_ids].sqrt().mean(dim=-1)
+        self.metrics["error_body_ang_vel"][env_ids] = self.body_error("ang_vel")[env_ids].sqrt().mean(dim=-1)
+
+        self.metrics["error_joint_pos"][env_ids] = torch.norm(
+            self.joint_pos[env_ids] - self.robot_joint_pos[env_ids], dim=-1
+        )
+        self.metrics["error_joint_vel"][env_ids] = torch.norm(
+            self.joint_vel[env_ids] - self.robot_joint_vel[env_ids], dim=-1
+        )
 
     def _adaptive_sampling(self, env_ids: Sequence[int]):
         episode_failed = self._env.termination_manager.terminated[env_ids]
@@ -243,6 +383,7 @@ class MotionCommand(CommandTerm):
     def _resample_command(self, env_ids: Sequence[int]):
         if len(env_ids) == 0:
             return
+        self._step_cache.clear()
         self._adaptive_sampling(env_ids)
 
         root_pos = self.body_pos_w[:, 0].clone()
@@ -277,6 +418,7 @@ class MotionCommand(CommandTerm):
         )
 
     def _update_command(self):
+        self._step_cache.clear()
         self.time_steps += 1
         env_ids = torch.where(self.time_steps >= self.motion.time_step_total)[0]
         self._resample_command(env_ids)
@@ -370,6 +512,12 @@ class MotionCommandCfg(CommandTermCfg):
     adaptive_uniform_ratio: float = 0.1
     adaptive_alpha: float = 0.001
 
+    metrics_interval: int = 0
+    """Steps between two updates of the tracking error metrics of all the envs.
+
+    With 0, the metrics of an env are only computed when its episode ends and they are logged.
+    """
+
     anchor_visualizer_cfg: VisualizationMarkersCfg = FRAME_MARKER_CFG.replace(prim_path="/Visuals/Command/pose")
     anchor_visualizer_cfg.markers["frame"].scale = (0.2, 0.2, 0.2)
 
@@ -5,89 +5,129 @@ from typing import TYPE_CHECKING, Literal
 
 import isaaclab.utils.math as math_utils
 from isaaclab.assets import Articulation
+from isaaclab.envs.mdp.actions.joint_actions import JointPositionAction
 from isaaclab.envs.mdp.events import _randomize_prop_by_op
-from isaaclab.managers import SceneEntityCfg
+from isaaclab.managers import EventTermCfg, ManagerTermBase, SceneEntityCfg
 
 if TYPE_CHECKING:
     from isaaclab.envs import ManagerBasedEnv
 
 
-def randomize_joint_default_pos(
-    env: ManagerBasedEnv,
-    env_ids: torch.Tensor | None,
-    asset_cfg: SceneEntityCfg,
-    pos_distribution_params: tuple[float, float] | None = None,
-    operation: Literal["add", "scale", "abs"] = "abs",
-    distribution: Literal["uniform", "log_uniform", "gaussian"] = "uniform",
-):
+class randomize_joint_default_pos(ManagerTermBase):
     """
     Randomize the joint default positions which may be different from URDF due to calibration errors.
-    """
-    # extract the used quantities (to enable type-hinting)
-    asset: Articulation = env.scene[asset_cfg.name]
-
-    # save nominal value for export
-    asset.data.default_joint_pos_nominal = torch.clone(asset.data.default_joint_pos[0])
 
-    # resolve environment ids
-    if env_ids is None:
-        env_ids = torch.arange(env.scene.num_envs, device=asset.device)
-
-    # resolve joint indices
-    if asset_cfg.joint_ids == slice(None):
-        joint_ids = slice(None)  # for optimization purposes
-    else:
-        joint_ids = torch.tensor(asset_cfg.joint_ids, dtype=torch.int, device=asset.device)
+    The positions are drawn around the nominal default positions read when the term is created, so that
+    randomizing again does not accumulate the offsets, and only the entries of the selected envs and joints are
+    written. The calibration offsets of all envs are kept in :attr:`offsets` and the nominal positions in
+    :attr:`nominal_joint_pos`, which is what ``export_deploy_cfg`` exports. The offsets of the joint position
+    actions of the asset using the default offset are updated as well, since they are not updated automatically
+    (those of the joint velocity actions are the default joint velocities, which are left unchanged).
+    """
 
-    if pos_distribution_params is not None:
-        pos = asset.data.default_joint_pos.to(asset.device).clone()
+    def __init__(self, cfg: EventTermCfg, env: ManagerBasedEnv):
+        super().__init__(cfg, env)
+        asset_cfg: SceneEntityCfg = cfg.params["asset_cfg"]
+        self.asset: Articulation = env.scene[asset_cfg.name]
+
+        # resolve joint indices
+        if asset_cfg.joint_ids == slice(None):
+            self.joint_ids = slice(None)  # for optimization purposes
+        else:
+            self.joint_ids = torch.tensor(asset_cfg.joint_ids, dtype=torch.long, device=self.device)
+
+        self.nominal_joint_pos = self.asset.data.default_joint_pos.clone()
+        self.offsets = torch.zeros_like(self.nominal_joint_pos)
+        # looked up on the first call, once the action manager exists
+        self._action_terms = None
+
+    def __call__(
+        self,
+        env: ManagerBasedEnv,
+        env_ids: torch.Tensor | None,
+        asset_cfg: SceneEntityCfg,
+        pos_distribution_params: tuple[float, float] | None = None,
+        operation: Literal["add", "scale", "abs"] = "abs",
+        distribution: Literal["uniform", "log_uniform", "gaussian"] = "uniform",
+    ):
+        if pos_distribution_params is None:
+            return
+
+        # resolve environment ids
+        if env_ids is None:
+            env_ids = torch.arange(env.scene.num_envs, device=self.device)
+        rows = env_ids[:, None] if not isinstance(self.joint_ids, slice) else env_ids
+
+        nominal = self.nominal_joint_pos[rows, self.joint_ids]
         pos = _randomize_prop_by_op(
-            pos, pos_distribution_params, env_ids, joint_ids, operation=operation, distribution=distribution
-        )[env_ids][:, joint_ids]
+            nominal.clone(), pos_distribution_params, None, slice(None), operation=operation, distribution=distribution
+        )
+        self.offsets[rows, self.joint_ids] = pos - nominal
+        self.asset.data.default_joint_pos[rows, self.joint_ids] = pos
 
-        if env_ids != slice(None) and joint_ids != slice(None):
-            env_ids = env_ids[:, None]
-        asset.data.default_joint_pos[env_ids, joint_ids] = pos
         # update the offset in action since it is not updated automatically
-        env.action_manager.get_term("JointPositionAction")._offset[env_ids, joint_ids] = pos
-
-
-def randomize_rigid_body_com(
-    env: ManagerBasedEnv,
-    env_ids: torch.Tensor | None,
-    com_range: dict[str, tuple[float, float]],
-    asset_cfg: SceneEntityCfg,
-):
+        for action_term in self._joint_action_terms(env):
+            action_term._offset[env_ids] = self.asset.data.default_joint_pos[env_ids][:, action_term._joint_ids]
+
+    def _joint_action_terms(self, env: ManagerBasedEnv) -> list[JointPositionAction]:
+        if self._action_terms is None:
+            if not hasattr(env, "action_manager"):
+                return []
+            self._action_terms = [
+                term
+                for term in env.action_manager._terms.values()
+                if isinstance(term, JointPositionAction) and term._asset is self.asset and term.cfg.use_default_offset
+            ]
+        return self._action_terms
+
+
+class randomize_rigid_body_com(ManagerTermBase):
     """Randomize the center of mass (CoM) of rigid bodies by adding a random value sampled from the given ranges.
 
+    The offsets are added to the nominal CoMs read once from the simulation, so that randomizing again does not
+    accumulate them, and the CoMs are kept in a host buffer in which only the rows of the selected envs and bodies are
+    rewritten: the simulation is never read back. This makes the term cheap enough for the ``"reset"`` mode.
+
     .. note::
-        This function uses CPU tensors to assign the CoM. It is recommended to use this function
-        only during the initialization of the environment.
+        CoMs changed by other means after the term is created are overwritten for the randomized envs.
     """
-    # extract the used quantities (to enable type-hinting)
-    asset: Articulation = env.scene[asset_cfg.name]
-    # resolve environment ids
-    if env_ids is None:
-        env_ids = torch.arange(env.scene.num_envs, device="cpu")
-    else:
-        env_ids = env_ids.cpu()
-
-    # resolve body indices
-    if asset_cfg.body_ids == slice(None):
-        body_ids = torch.arange(asset.num_bodies, dtype=torch.int, device="cpu")
-    else:
-        body_ids = torch.tensor(asset_cfg.body_ids, dtype=torch.int, device="cpu")
-
-    # sample random CoM values
-    range_list = [com_range.get(key, (0.0, 0.0)) for key in ["x", "y", "z"]]
-    ranges = torch.tensor(range_list, device="cpu")
-    rand_samples = math_utils.sample_uniform(ranges[:, 0], ranges[:, 1], (len(env_ids), 3), device="cpu").unsqueeze(1)
-
-    # get the current com of the bodies (num_assets, num_bodies)
-    coms = asset.root_physx_view.get_coms().clone()
-
-    # Randomize the com in range
-    coms[:, body_ids, :3] += rand_samples
-
-    # Set the new coms
-    asset.root_physx_view.set_coms(coms, env_ids)
+
+    def __init__(self, cfg: EventTermCfg, env: ManagerBasedEnv):
+        super().__init__(cfg, env)
+        asset_cfg: SceneEntityCfg = cfg.params["asset_cfg"]
+        self.asset: Articulation = env.scene[asset_cfg.name]
+
+        # resolve body indices
+        if asset_cfg.body_ids == slice(None):
+            self.body_ids = torch.arange(self.asset.num_bodies, dtype=torch.long, device="cpu")
+        else:
+            self.body_ids = torch.tensor(asset_cfg.body_ids, dtype=torch.long, device="cpu")
+
+        # CoMs of the bodies (num_assets, num_bodies, 7), on the CPU as the physics view expects them
+        self.nominal_coms = self.asset.root_physx_view.get_coms().clone()
+        self.coms = self.nominal_coms.clone()
+
+    def __call__(
+        self,
+        env: ManagerBasedEnv,
+        env_ids: torch.Tensor | None,
+        com_range: dict[str, tuple[float, float]],
+        asset_cfg: SceneEntityCfg,
+    ):
+        # resolve environment ids
+        if env_ids is None:
+            env_ids = torch.arange(env.scene.num_envs, device="cpu")
+        else:
+            env_ids = env_ids.cpu()
+
+        # sample random CoM offsets, one per env
+        range_list = [com_range.get(key, (0.0, 0.0)) for key in ["x", "y", "z"]]
+        ranges = torch.tensor(range_list, device="cpu")
+        rand_samples = math_utils.sample_uniform(ranges[:, 0], ranges[:, 1], (len(env_ids), 3), device="cpu")
+
+        # offset the nominal CoMs of the selected envs and bodies only
+        env_rows = env_ids[:, None]
+        self.coms[env_rows, self.body_ids, :3] = self.nominal_coms[env_rows, self.body_ids, :3] + rand_samples[:, None]
+
+        # Set the new coms
+        self.asset.root_physx_view.set_coms(self.coms, env_ids)
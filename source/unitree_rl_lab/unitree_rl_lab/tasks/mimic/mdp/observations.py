@@ -3,7 +3,7 @@ from __future__ import annotations
 import torch
 from typing import TYPE_CHECKING
 
-from isaaclab.utils.math import matrix_from_quat, subtract_frame_transforms
+from isaaclab.utils.math import matrix_from_quat
 
 from unitree_rl_lab.tasks.mimic.mdp.commands import MotionCommand
 
@@ -20,64 +20,38 @@ def robot_anchor_ori_w(env: ManagerBasedEnv, command_name: str) -> torch.Tensor:
 def robot_anchor_lin_vel_w(env: ManagerBasedEnv, command_name: str) -> torch.Tensor:
     command: MotionCommand = env.command_manager.get_term(command_name)
 
-    return command.robot_anchor_vel_w[:, :3].view(env.num_envs, -1)
+    return command.robot_anchor_lin_vel_w.view(env.num_envs, -1)
 
 
 def robot_anchor_ang_vel_w(env: ManagerBasedEnv, command_name: str) -> torch.Tensor:
     command: MotionCommand = env.command_manager.get_term(command_name)
 
-    return command.robot_anchor_vel_w[:, 3:6].view(env.num_envs, -1)
+    return command.robot_anchor_ang_vel_w.view(env.num_envs, -1)
 
 
 def robot_body_pos_b(env: ManagerBasedEnv, command_name: str) -> torch.Tensor:
     command: MotionCommand = env.command_manager.get_term(command_name)
 
-    num_bodies = len(command.cfg.body_names)
-    pos_b, _ = subtract_frame_transforms(
-        command.robot_anchor_pos_w[:, None, :].repeat(1, num_bodies, 1),
-        command.robot_anchor_quat_w[:, None, :].repeat(1, num_bodies, 1),
-        command.robot_body_pos_w,
-        command.robot_body_quat_w,
-    )
-
-    return pos_b.view(env.num_envs, -1)
+    pos_b, _ = command.robot_body_frames_b()
+    return pos_b.reshape(env.num_envs, -1)
 
 
 def robot_body_ori_b(env: ManagerBasedEnv, command_name: str) -> torch.Tensor:
     command: MotionCommand = env.command_manager.get_term(command_name)
 
-    num_bodies = len(command.cfg.body_names)
-    _, ori_b = subtract_frame_transforms(
-        command.robot_anchor_pos_w[:, None, :].repeat(1, num_bodies, 1),
-        command.robot_anchor_quat_w[:, None, :].repeat(1, num_bodies, 1),
-        command.robot_body_pos_w,
-        command.robot_body_quat_w,
-    )
-    mat = matrix_from_quat(ori_b)
-    return mat[..., :2].reshape(mat.shape[0], -1)
+    _, ori_b = command.robot_body_frames_b()
+    return ori_b.reshape(env.num_envs, -1)
 
 
 def motion_anchor_pos_b(env: ManagerBasedEnv, command_name: str) -> torch.Tensor:
     command: MotionCommand = env.command_manager.get_term(command_name)
 
-    pos, _ = subtract_frame_transforms(
-        command.robot_anchor_pos_w,
-        command.robot_anchor_quat_w,
-        command.anchor_pos_w,
-        command.anchor_quat_w,
-    )
-
+    pos, _ = command.motion_anchor_frame_b()
     return pos.view(env.num_envs, -1)
 
 
 def motion_anchor_ori_b(env: ManagerBasedEnv, command_name: str) -> torch.Tensor:
     command: MotionCommand = env.command_manager.get_term(command_name)
 
-    _, ori = subtract_frame_transforms(
-        command.robot_anchor_pos_w,
-        command.robot_anchor_quat_w,
-        command.anchor_pos_w,
-        command.anchor_quat_w,
-    )
-    mat = matrix_from_quat(ori)
-    return mat[..., :2].reshape(mat.shape[0], -1)
+    _, ori = command.motion_anchor_frame_b()
+    return ori.view(env.num_envs, -1)
@@ -1,9 +1,10 @@
 from __future__ import annotations
 
 import torch
+from collections.abc import Sequence
 from typing import TYPE_CHECKING
 
-from isaaclab.managers import SceneEntityCfg
+from isaaclab.managers import ManagerTermBase, RewardTermCfg, SceneEntityCfg
 from isaaclab.sensors import ContactSensor
 from isaaclab.utils.math import quat_error_magnitude
 
@@ -13,8 +14,8 @@ if TYPE_CHECKING:
     from isaaclab.envs import ManagerBasedRLEnv
 
 
-def _get_body_indexes(command: MotionCommand, body_names: list[str] | None) -> list[int]:
-    return [i for i, name in enumerate(command.cfg.body_names) if (body_names is None) or (name in body_names)]
+def _get_body_indexes(command: MotionCommand, body_names: list[str] | None) -> slice | torch.Tensor:
+    return command.body_subset(body_names)
 
 
 def motion_global_anchor_position_error_exp(env: ManagerBasedRLEnv, command_name: str, std: float) -> torch.Tensor:
@@ -33,10 +34,7 @@ def motion_relative_body_position_error_exp(
     env: ManagerBasedRLEnv, command_name: str, std: float, body_names: list[str] | None = None
 ) -> torch.Tensor:
     command: MotionCommand = env.command_manager.get_term(command_name)
-    body_indexes = _get_body_indexes(command, body_names)
-    error = torch.sum(
-        torch.square(command.body_pos_relative_w[:, body_indexes] - command.robot_body_pos_w[:, body_indexes]), dim=-1
-    )
+    error = command.body_error("pos")[:, _get_body_indexes(command, body_names)]
     return torch.exp(-error.mean(-1) / std**2)
 
 
@@ -44,11 +42,7 @@ def motion_relative_body_orientation_error_exp(
     env: ManagerBasedRLEnv, command_name: str, std: float, body_names: list[str] | None = None
 ) -> torch.Tensor:
     command: MotionCommand = env.command_manager.get_term(command_name)
-    body_indexes = _get_body_indexes(command, body_names)
-    error = (
-        quat_error_magnitude(command.body_quat_relative_w[:, body_indexes], command.robot_body_quat_w[:, body_indexes])
-        ** 2
-    )
+    error = command.body_error("rot")[:, _get_body_indexes(command, body_names)]
     return torch.exp(-error.mean(-1) / std**2)
 
 
@@ -56,10 +50,7 @@ def motion_global_body_linear_velocity_error_exp(
     env: ManagerBasedRLEnv, command_name: str, std: float, body_names: list[str] | None = None
 ) -> torch.Tensor:
     command: MotionCommand = env.command_manager.get_term(command_name)
-    body_indexes = _get_body_indexes(command, body_names)
-    error = torch.sum(
-        torch.square(command.body_lin_vel_w[:, body_indexes] - command.robot_body_lin_vel_w[:, body_indexes]), dim=-1
-    )
+    error = command.body_error("lin_vel")[:, _get_body_indexes(command, body_names)]
     return torch.exp(-error.mean(-1) / std**2)
 
 
@@ -67,13 +58,68 @@ def motion_global_body_angular_velocity_error_exp(
     env: ManagerBasedRLEnv, command_name: str, std: float, body_names: list[str] | None = None
 ) -> torch.Tensor:
     command: MotionCommand = env.command_manager.get_term(command_name)
-    body_indexes = _get_body_indexes(command, body_names)
-    error = torch.sum(
-        torch.square(command.body_ang_vel_w[:, body_indexes] - command.robot_body_ang_vel_w[:, body_indexes]), dim=-1
-    )
+    error = command.body_error("ang_vel")[:, _get_body_indexes(command, body_names)]
     return torch.exp(-error.mean(-1) / std**2)
 
 
+class motion_tracking_exp(ManagerTermBase):
+    """Weighted sum of the motion tracking rewards, computed together.
+
+    Replaces the ``motion_global_anchor_*`` and ``motion_*_body_*`` terms by a single term: the errors of all the
+    components come from the tensors the motion command computes once per step, and their exponentials and weights are
+    applied in one operation over the components. The contribution of each component to the reward is still logged
+    under ``Episode_Reward/<name>``, as it would be by the reward manager for separate terms.
+
+    ``terms`` maps the name of each component to its parameters: ``error`` (one of :attr:`ERRORS`), ``weight``, ``std``
+    and, for the body errors, ``body_names`` (all the bodies of the command by default). The weight of the term itself
+    multiplies all of them and is usually 1.0.
+    """
+
+    ERRORS = ("anchor_pos", "anchor_rot", "body_pos", "body_rot", "body_lin_vel", "body_ang_vel")
+
+    def __init__(self, cfg: RewardTermCfg, env: ManagerBasedRLEnv):
+        super().__init__(cfg, env)
+        command: MotionCommand = env.command_manager.get_term(cfg.params["command_name"])
+        terms: dict[str, dict] = cfg.params["terms"]
+        for name, term in terms.items():
+            if term["error"] not in self.ERRORS:
+                raise ValueError(f"Unknown error '{term['error']}' of tracking reward '{name}', not in {self.ERRORS}.")
+
+        self._names = list(terms)
+        self._errors = [term["error"] for term in terms.values()]
+        self._body_indexes = [_get_body_indexes(command, term.get("body_names")) for term in terms.values()]
+        self._weights = torch.tensor([term["weight"] for term in terms.values()], device=self.device)
+        self._inv_var = torch.tensor([1.0 / term["std"] ** 2 for term in terms.values()], device=self.device)
+        self._episode_sums = torch.zeros(self.num_envs, len(terms), device=self.device)
+
+    def reset(self, env_ids: Sequence[int] | None = None):
+        if env_ids is None:
+            env_ids = slice(None)
+        episode_sums = self._episode_sums[env_ids].mean(dim=0) / self._env.max_episode_length_s
+        log = self._env.extras.setdefault("log", {})
+        for name, episode_sum in zip(self._names, episode_sums):
+            log[f"Episode_Reward/{name}"] = episode_sum
+        self._episode_sums[env_ids] = 0.0
+
+    def __call__(self, env: ManagerBasedRLEnv, command_name: str, terms: dict[str, dict]) -> torch.Tensor:
+        command: MotionCommand = env.command_manager.get_term(command_name)
+        errors = torch.stack(
+            [self._error(command, error, body_ids) for error, body_ids in zip(self._errors, self._body_indexes)],
+            dim=-1,
+        )
+        rewards = torch.exp(-errors * self._inv_var) * self._weights
+        self._episode_sums += rewards * (self.cfg.weight * env.step_dt)
+        return rewards.sum(dim=-1)
+
+    @staticmethod
+    def _error(command: MotionCommand, error: str, body_ids: slice | torch.Tensor) -> torch.Tensor:
+        if error == "anchor_pos":
+            return torch.sum(torch.square(command.anchor_pos_w - command.robot_anchor_pos_w), dim=-1)
+        if error == "anchor_rot":
+            return quat_error_magnitude(command.anchor_quat_w, command.robot_anchor_quat_w) ** 2
+        return command.body_error(error.removeprefix("body_"))[:, body_ids].mean(-1)
+
+
 def feet_contact_time(env: ManagerBasedRLEnv, sensor_cfg: SceneEntityCfg, threshold: float) -> torch.Tensor:
     contact_sensor: ContactSensor = env.scene.sensors[sensor_cfg.name]
     first_air = contact_sensor.compute_first_air(env.step_dt, env.physics_dt)[:, sensor_cfg.body_ids]
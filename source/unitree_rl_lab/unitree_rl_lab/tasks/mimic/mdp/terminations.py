@@ -47,9 +47,8 @@ def bad_motion_body_pos(
 ) -> torch.Tensor:
     command: MotionCommand = env.command_manager.get_term(command_name)
 
-    body_indexes = _get_body_indexes(command, body_names)
-    error = torch.norm(command.body_pos_relative_w[:, body_indexes] - command.robot_body_pos_w[:, body_indexes], dim=-1)
-    return torch.any(error > threshold, dim=-1)
+    error = command.body_error("pos")[:, _get_body_indexes(command, body_names)]
+    return torch.any(error > threshold**2, dim=-1)
 
 
 def bad_motion_body_pos_z_only(
@@ -57,6 +56,5 @@ def bad_motion_body_pos_z_only(
 ) -> torch.Tensor:
     command: MotionCommand = env.command_manager.get_term(command_name)
 
-    body_indexes = _get_body_indexes(command, body_names)
-    error = torch.abs(command.body_pos_relative_w[:, body_indexes, -1] - command.robot_body_pos_w[:, body_indexes, -1])
+    error = command.body_error("pos_z")[:, _get_body_indexes(command, body_names)]
     return torch.any(error > threshold, dim=-1)
@@ -230,35 +230,20 @@ class RewardsCfg:
     )
 
     # -- tracking
-    motion_global_anchor_pos = RewTerm(
-        func=mdp.motion_global_anchor_position_error_exp,
-        weight=0.5,
-        params={"command_name": "motion", "std": 0.3},
-    )
-    motion_global_anchor_ori = RewTerm(
-        func=mdp.motion_global_anchor_orientation_error_exp,
-        weight=0.5,
-        params={"command_name": "motion", "std": 0.4},
-    )
-    motion_body_pos = RewTerm(
-        func=mdp.motion_relative_body_position_error_exp,
-        weight=1.0,
-        params={"command_name": "motion", "std": 0.3},
-    )
-    motion_body_ori = RewTerm(
-        func=mdp.motion_relative_body_orientation_error_exp,
-        weight=1.0,
-        params={"command_name": "motion", "std": 0.4},
-    )
-    motion_body_lin_vel = RewTerm(
-        func=mdp.motion_global_body_linear_velocity_error_exp,
+    motion_tracking = RewTerm(
+        func=mdp.motion_tracking_exp,
         weight=1.0,
-        params={"command_name": "motion", "std": 1.0},
-    )
-    motion_body_ang_vel = RewTerm(
-        func=mdp.motion_global_body_angular_velocity_error_exp,
-        weight=1.0,
-        params={"command_name": "motion", "std": 3.14},
+        params={
+            "command_name": "motion",
+            "terms": {
+                "motion_global_anchor_pos": {"error": "anchor_pos", "weight": 0.5, "std": 0.3},
+                "motion_global_anchor_ori": {"error": "anchor_rot", "weight": 0.5, "std": 0.4},
+                "motion_body_pos": {"error": "body_pos", "weight": 1.0, "std": 0.3},
+                "motion_body_ori": {"error": "body_rot", "weight": 1.0, "std": 0.4},
+                "motion_body_lin_vel": {"error": "body_lin_vel", "weight": 1.0, "std": 1.0},
+                "motion_body_ang_vel": {"error": "body_ang_vel", "weight": 1.0, "std": 3.14},
+            },
+        },
     )
 
     undesired_contacts = RewTerm(
@@ -0,0 +1,179 @@
+"""Non-blocking checkpoint writer for the RSL-RL ``OnPolicyRunner``.
+
+``OnPolicyRunner.save`` serializes the model and optimizer on the training thread, stalling the rollout for the
+whole disk write. :class:`AsyncCheckpointer` replaces it on a runner: the state dicts are copied into pinned host
+buffers (reused from one save to the next), and a background thread writes them to a temporary file which is then
+atomically renamed, so an interrupted run never leaves a truncated ``model_*.pt`` behind. The file content is the
+one ``OnPolicyRunner.save`` would have written, whatever the installed rsl_rl version, and ``runner.load`` reads
+it unchanged.
+
+Optionally only the last ``keep_last`` checkpoints and the ``keep_best`` best ones by a training metric are kept
+on disk. The metrics of the kept checkpoints are listed in ``checkpoints.yaml`` of the log directory.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import os
+import statistics
+import torch
+import yaml
+from concurrent.futures import Future, ThreadPoolExecutor
+
+# bound at import, ``torch.save`` is swapped on the training thread while the runner builds a checkpoint
+_torch_save = torch.save
+
+
+class AsyncCheckpointer:
+    """Write the checkpoints of an ``OnPolicyRunner`` from a background thread.
+
+    Args:
+        runner: The runner whose ``save`` is replaced.
+        keep_last: Number of most recent checkpoints kept on disk. Zero or less keeps all of them.
+        keep_best: Number of best checkpoints by ``metric`` kept on top of the ``keep_last`` most recent ones.
+        metric: ``"reward"`` (mean episode return), ``"episode_length"`` or a key of the episode infos, e.g.
+            ``"Episode_Reward/track_lin_vel_xy"``. Higher is better.
+    """
+
+    def __init__(self, runner, keep_last: int = 0, keep_best: int = 0, metric: str = "reward"):
+        self.runner = runner
+        self.keep_last = keep_last
+        self.keep_best = keep_best
+        self.metric = metric
+
+        self._runner_save = runner.save
+        self._runner_log = runner.log
+        runner.save = self.save
+        runner.log = self._log
+
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="checkpoint")
+        self._pending: Future | None = None
+        self._buffers: dict[str, torch.Tensor] = {}
+        self._last_metric: float | None = None
+        self._checkpoints: dict[str, float | None] = {}  # written by this checkpointer, oldest first
+
+    """
+    Operations
+    """
+
+    def save(self, path: str, infos=None):
+        """Drop-in replacement of ``OnPolicyRunner.save`` returning once the state is copied to host memory."""
+        # the buffers of the previous snapshot are reused, let its write finish (and raise its errors) first
+        self.wait()
+        with self._capture() as captured:
+            self._runner_save(path, infos)
+        snapshot = self._snapshot(captured["obj"], "")
+        event = None
+        if torch.device(self.runner.device).type == "cuda":
+            # the copies are ordered before the next update on the stream, only the writer has to wait for them
+            event = torch.cuda.Event()
+            event.record(torch.cuda.current_stream(self.runner.device))
+        self._pending = self._executor.submit(
+            self._write, snapshot, captured["path"], event, captured.get("upload"), self._last_metric
+        )
+
+    def wait(self):
+        """Block until the pending checkpoint is on disk."""
+        if self._pending is not None:
+            pending, self._pending = self._pending, None
+            pending.result()
+
+    def close(self):
+        """Flush the pending checkpoint and stop the writer thread."""
+        self.wait()
+        self._executor.shutdown()
+
+    """
+    Internal helpers
+    """
+
+    @contextlib.contextmanager
+    def _capture(self):
+        """Intercept the ``torch.save`` (and model upload) of ``OnPolicyRunner.save`` instead of running them."""
+        captured = {}
+        writer = getattr(self.runner, "writer", None)
+        upload = getattr(writer, "save_model", None)
+
+        def _save(obj, f, *args, **kwargs):
+            captured.update(obj=obj, path=f)
+
+        def _save_model(path, it):
+            # wandb and neptune upload the file, which only exists once written
+            captured["upload"] = (upload, path, it)
+
+        torch.save = _save
+        if upload is not None:
+            writer.save_model = _save_model
+        try:
+            yield captured
+        finally:
+            torch.save = _torch_save
+            if upload is not None:
+                del writer.save_model
+
+    def _snapshot(self, obj, key: str):
+        """Copy the tensors of ``obj`` into reusable pinned host buffers, keeping the containers' structure."""
+        if isinstance(obj, torch.Tensor):
+            buffer = self._buffers.get(key)
+            if buffer is None or buffer.shape != obj.shape or buffer.dtype != obj.dtype:
+                buffer = torch.empty(obj.shape, dtype=obj.dtype, pin_memory=obj.is_cuda)
+                self._buffers[key] = buffer
+            buffer.copy_(obj.detach(), non_blocking=obj.is_cuda)
+            return buffer
+        if isinstance(obj, dict):
+            return type(obj)((k, self._snapshot(v, f"{key}/{k}")) for k, v in obj.items())
+        if isinstance(obj, (list, tuple)):
+            return type(obj)(self._snapshot(v, f"{key}/{i}") for i, v in enumerate(obj))
+        return obj
+
+    def _write(self, snapshot, path: str, event, upload, metric: float | None):
+        if event is not None:
+            event.synchronize()
+        tmp_path = f"{path}.tmp"
+        _torch_save(snapshot, tmp_path)
+        os.replace(tmp_path, path)
+        if upload is not None:
+            save_model, upload_path, it = upload
+            save_model(upload_path, it)
+
+        self._checkpoints.pop(path, None)
+        self._checkpoints[path] = metric
+        self._prune()
+
+    def _prune(self):
+        if self.keep_last <= 0:
+            kept = list(self._checkpoints)
+        else:
+            kept = list(self._checkpoints)[-self.keep_last :]
+            scored = [p for p, m in self._checkpoints.items() if m is not None]
+            kept += sorted(scored, key=self._checkpoints.get, reverse=True)[: max(self.keep_best, 0)]
+        for path in list(self._checkpoints):
+            if path not in kept:
+                del self._checkpoints[path]
+                with contextlib.suppress(FileNotFoundError):
+                    os.remove(path)
+
+        index_path = os.path.join(os.path.dirname(next(reversed(self._checkpoints))), "checkpoints.yaml")
+        with open(f"{index_path}.tmp", "w") as f:
+            yaml.safe_dump(
+                {"metric": self.metric, "checkpoints": {os.path.basename(p): m for p, m in self._checkpoints.items()}},
+                f,
+                sort_keys=False,
+            )
+        os.replace(f"{index_path}.tmp", index_path)
+
+    def _log(self, locs: dict, *args, **kwargs):
+        """``OnPolicyRunner.log``, recording the metric of the iteration for the following save."""
+        if self.metric == "reward":
+            values = list(locs["rewbuffer"])
+        elif self.metric == "episode_length":
+            values = list(locs["lenbuffer"])
+        else:
+            values = [
+                float(torch.as_tensor(info[self.metric]).float().mean())
+                for info in locs["ep_infos"]
+                if self.metric in info
+            ]
+        if values:
+            self._last_metric = float(statistics.mean(values))
+        return self._runner_log(locs, *args, **kwargs)
@@ -4,6 +4,7 @@ import yaml
 
 from isaaclab.assets import Articulation
 from isaaclab.envs import ManagerBasedRLEnv
+from isaaclab.envs.mdp.actions.joint_actions import JointPositionAction
 from isaaclab.utils import class_to_dict
 from isaaclab.utils.string import resolve_matching_names
 
@@ -19,6 +20,34 @@ def format_value(x):
         return x
 
 
+def obs_term_dim(env: ManagerBasedRLEnv, group_name: str, term_index: int) -> int:
+    """Per-step dimension of an observation term, without evaluating it.
+
+    The observation manager already evaluated every term once when it was built and keeps the
+    resulting shapes in ``group_obs_term_dim`` (history included). Calling the term again would run
+    it on the full batch and may mutate the environment, e.g. ``gait_phase`` creates ``episode_length_buf``.
+    """
+    obs_manager = env.observation_manager
+    term_cfg = obs_manager._group_obs_term_cfgs[group_name][term_index]
+    dim = int(np.prod(obs_manager.group_obs_term_dim[group_name][term_index]))
+    if term_cfg.history_length > 0:
+        dim //= term_cfg.history_length
+    return dim
+
+
+def nominal_default_joint_pos(env: ManagerBasedRLEnv, asset: Articulation):
+    """Default joint positions of ``asset`` in the first env, without the calibration offsets of the event terms.
+
+    Event terms randomizing the default joint positions (e.g. ``randomize_joint_default_pos`` of the mimic tasks)
+    expose the positions they started from as ``nominal_joint_pos``, and the robot runs with the nominal ones.
+    """
+    for term_cfgs in env.event_manager._mode_term_cfgs.values():
+        for term_cfg in term_cfgs:
+            if getattr(term_cfg.func, "asset", None) is asset and hasattr(term_cfg.func, "nominal_joint_pos"):
+                return term_cfg.func.nominal_joint_pos[0]
+    return asset.data.default_joint_pos[0]
+
+
 def export_deploy_cfg(env: ManagerBasedRLEnv, log_dir):
     asset: Articulation = env.scene["robot"]
     joint_sdk_names = env.cfg.scene.robot.joint_sdk_names
@@ -27,13 +56,15 @@ def export_deploy_cfg(env: ManagerBasedRLEnv, log_dir):
     cfg = {}  # noqa: SIM904
     cfg["joint_ids_map"] = joint_ids_map
     cfg["step_dt"] = env.cfg.sim.dt * env.cfg.decimation
+    cfg["action_interpolation"] = False  # ramp between policy targets at the 1 kHz control rate on the robot
     stiffness = np.zeros(len(joint_sdk_names))
     stiffness[joint_ids_map] = asset.data.default_joint_stiffness[0].detach().cpu().numpy().tolist()
     cfg["stiffness"] = stiffness.tolist()
     damping = np.zeros(len(joint_sdk_names))
     damping[joint_ids_map] = asset.data.default_joint_damping[0].detach().cpu().numpy().tolist()
     cfg["damping"] = damping.tolist()
-    cfg["default_joint_pos"] = asset.data.default_joint_pos[0].detach().cpu().numpy().tolist()
+    default_joint_pos = nominal_default_joint_pos(env, asset)
+    cfg["default_joint_pos"] = default_joint_pos.detach().cpu().numpy().tolist()
 
     # --- commands ---
     cfg["commands"] = {}
@@ -62,7 +93,9 @@ def export_deploy_cfg(env: ManagerBasedRLEnv, log_dir):
             term_cfg.clip = action_term._clip[0].detach().cpu().numpy().tolist()
 
         if action_name in ["JointPositionAction", "JointVelocityAction"]:
-            if term_cfg.use_default_offset:
+            if term_cfg.use_default_offset and isinstance(action_term, JointPositionAction):
+                term_cfg.offset = default_joint_pos[action_term._joint_ids].detach().cpu().numpy().tolist()
+            elif term_cfg.use_default_offset:  # the default joint velocities, not randomized
                 term_cfg.offset = action_term._offset[0].detach().cpu().numpy().tolist()
             else:
                 term_cfg.offset = [0.0 for _ in range(action_term.action_dim)]
@@ -84,17 +117,17 @@ def export_deploy_cfg(env: ManagerBasedRLEnv, log_dir):
     obs_cfgs = env.observation_manager._group_obs_term_cfgs["policy"]
     obs_terms = zip(obs_names, obs_cfgs)
     cfg["observations"] = {}
-    for obs_name, obs_cfg in obs_terms:
-        obs_dims = tuple(obs_cfg.func(env, **obs_cfg.params).shape)
+    for term_index, (obs_name, obs_cfg) in enumerate(obs_terms):
+        obs_dim = obs_term_dim(env, "policy", term_index)
         term_cfg = obs_cfg.copy()
         if term_cfg.scale is not None:
             scale = term_cfg.scale.detach().cpu().numpy().tolist()
             if isinstance(scale, float):
-                term_cfg.scale = [scale for _ in range(obs_dims[1])]
+                term_cfg.scale = [scale for _ in range(obs_dim)]
             else:
                 term_cfg.scale = scale
         else:
-            term_cfg.scale = [1.0 for _ in range(obs_dims[1])]
+            term_cfg.scale = [1.0 for _ in range(obs_dim)]
         if term_cfg.clip is not None:
             term_cfg.clip = list(term_cfg.clip)
         if term_cfg.history_length == 0:
@@ -0,0 +1,127 @@
+"""Stand-ins for the Isaac Sim (Kit) modules, to import Isaac Lab without the simulator.
+
+Most of what the MDP terms and actuator models use from Isaac Lab is plain torch (``isaaclab.utils.math``, the
+actuator classes, the manager and term configs), but the packages defining them import ``omni``, ``carb``,
+``pxr`` and ``isaacsim`` at module level. :func:`install` registers an import hook providing permissive
+placeholders for these modules when Isaac Sim is not installed, so that CPU-only tools such as the benchmarks in
+``scripts/benchmark`` can import the task packages. Anything actually calling into the simulator through a
+placeholder gets another placeholder back, never a result, so nothing that needs the simulator can work with
+them: they only exist to get past the imports.
+
+Import this before Isaac Lab::
+
+    from unitree_rl_lab.utils import kit_shims
+
+    kit_shims.install()
+"""
+
+from __future__ import annotations
+
+import importlib.abc
+import importlib.machinery
+import importlib.util
+import sys
+import types
+
+KIT_MODULES = ("carb", "omni", "pxr", "isaacsim", "usdrt", "Semantics")
+
+
+class _PlaceholderType(type):
+    """Metaclass of the placeholders: any attribute is another placeholder, and they can be subclassed."""
+
+    def __getattr__(cls, name: str):
+        if name.startswith("__") and name.endswith("__"):
+            raise AttributeError(name)
+        return _placeholder(f"{cls.__qualname__}.{name}")
+
+    def __call__(cls, *args, **kwargs):
+        if len(args) == 1 and not kwargs and callable(args[0]) and cls.__module__ == __name__:
+            return args[0]  # used as a decorator
+        return super().__call__(*args, **kwargs)
+
+    def __getitem__(cls, item):
+        return cls
+
+    def __or__(cls, other):
+        return cls
+
+    def __ror__(cls, other):
+        return cls
+
+    def __iter__(cls):
+        return iter(())
+
+    def __len__(cls):
+        return 0
+
+
+class _Placeholder(metaclass=_PlaceholderType):
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def __getattr__(self, name: str):
+        if name.startswith("__") and name.endswith("__"):
+            raise AttributeError(name)
+        return _placeholder(f"{type(self).__qualname__}.{name}")()
+
+    def __call__(self, *args, **kwargs):
+        if len(args) == 1 and not kwargs and callable(args[0]):
+            return args[0]
+        return _Placeholder()
+
+    def __iter__(self):
+        return iter(())
+
+    def __bool__(self):
+        return False
+
+
+def _placeholder(qualname: str) -> type:
+    return _PlaceholderType(qualname.rsplit(".", 1)[-1], (_Placeholder,), {"__qualname__": qualname})
+
+
+class _KitModule(types.ModuleType):
+    def __getattr__(self, name: str):
+        if name.startswith("__") and name.endswith("__"):
+            raise AttributeError(name)
+        value = _placeholder(f"{self.__name__}.{name}")
+        setattr(self, name, value)
+        return value
+
+
+class _KitFinder(importlib.abc.MetaPathFinder, importlib.abc.Loader):
+    def find_spec(self, fullname, path, target=None):
+        if fullname.split(".")[0] not in KIT_MODULES:
+            return None
+        return importlib.machinery.ModuleSpec(fullname, self, is_package=True)
+
+    def create_module(self, spec):
+        module = _KitModule(spec.name)
+        module.__path__ = []
+        return module
+
+    def exec_module(self, module):
+        parent, _, name = module.__name__.rpartition(".")
+        if parent:
+            setattr(sys.modules[parent], name, module)
+
+
+def kit_available() -> bool:
+    """Whether the real Isaac Sim modules can be imported."""
+    if any(isinstance(finder, _KitFinder) for finder in sys.meta_path):
+        return False
+    return importlib.util.find_spec("omni") is not None and importlib.util.find_spec("isaacsim") is not None
+
+
+def install() -> bool:
+    """Provide placeholders for the Kit modules if Isaac Sim is not installed.
+
+    Returns:
+        Whether the placeholders are in use.
+    """
+    if any(isinstance(finder, _KitFinder) for finder in sys.meta_path):
+        return True
+    if kit_available():
+        return False
+    sys.meta_path.append(_KitFinder())
+    return True
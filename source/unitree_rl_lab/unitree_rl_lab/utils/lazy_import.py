@@ -0,0 +1,92 @@
+"""Lazy attributes for the ``mdp`` packages (PEP 562).
+
+An ``mdp`` package used to star-import its submodules and the Isaac Lab MDP packages, so importing any config
+imported all of them. With :func:`lazy_module` a name is resolved on first access instead: the submodule defining
+it is found from a static index of the submodules' sources, and names the package does not define fall through
+to the given fallback modules, in the same order of precedence as the star-imports they replace.
+"""
+
+from __future__ import annotations
+
+import ast
+import importlib
+import pathlib
+import sys
+
+
+def _public_names(path: pathlib.Path) -> list[str]:
+    """Names ``from <module> import *`` would bind, read from the source without importing it."""
+    tree = ast.parse(path.read_text(), filename=str(path))
+    names = []
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and any(isinstance(t, ast.Name) and t.id == "__all__" for t in node.targets):
+            return list(ast.literal_eval(node.value))
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+            names.append(node.name)
+        elif isinstance(node, ast.Assign):
+            names += [t.id for t in node.targets if isinstance(t, ast.Name)]
+        elif isinstance(node, ast.AnnAssign) and isinstance(node.target, ast.Name):
+            names.append(node.target.id)
+        elif isinstance(node, ast.Import):
+            names += [(alias.asname or alias.name).split(".")[0] for alias in node.names]
+        elif isinstance(node, ast.ImportFrom):
+            for alias in node.names:
+                if alias.name != "*":
+                    names.append(alias.asname or alias.name)
+                elif (
+                    node.level == 1 and node.module
+                ):  # relative star import of a sibling, e.g. in a commands/ subpackage
+                    names += _public_names(_source(path.parent, node.module))
+    return [n for n in names if not n.startswith("_")]
+
+
+def _source(package_dir: pathlib.Path, submodule: str) -> pathlib.Path:
+    path = package_dir / submodule
+    return path / "__init__.py" if path.is_dir() else path.with_suffix(".py")
+
+
+def lazy_module(module_name: str, submodules: list[str], fallbacks: list[str] = ()):
+    """Build the module-level ``__getattr__`` and ``__dir__`` of a lazily populated package.
+
+    Args:
+        module_name: ``__name__`` of the package.
+        submodules: Submodules whose public names the package exposes, later ones taking precedence.
+        fallbacks: Modules searched, in order, for names none of the submodules defines.
+
+    Returns:
+        The ``__getattr__`` and ``__dir__`` functions to assign in the package ``__init__``.
+    """
+    package = sys.modules[module_name]
+    package_dir = pathlib.Path(package.__file__).parent
+    index = {}
+
+    def _index() -> dict[str, str]:
+        if not index:
+            for submodule in submodules:
+                for name in _public_names(_source(package_dir, submodule)):
+                    index[name] = submodule
+        return index
+
+    def __getattr__(name: str):
+        if name.startswith("__"):
+            raise AttributeError(f"module {module_name!r} has no attribute {name!r}")
+        if name in submodules:
+            return importlib.import_module(f"{module_name}.{name}")
+        submodule = _index().get(name)
+        if submodule is not None:
+            value = getattr(importlib.import_module(f"{module_name}.{submodule}"), name)
+        else:
+            for fallback in fallbacks:
+                module = importlib.import_module(fallback)
+                if hasattr(module, name):
+                    value = getattr(module, name)
+                    break
+            else:
+                raise AttributeError(f"module {module_name!r} has no attribute {name!r}")
+        setattr(package, name, value)  # later accesses bypass __getattr__
+        return value
+
+    def __dir__():
+        return sorted(set(vars(package)) | set(_index()))
+
+    return __getattr__, __dir__
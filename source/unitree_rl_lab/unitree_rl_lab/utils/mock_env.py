@@ -0,0 +1,1008 @@
+"""CPU stand-in for the simulation behind a ``ManagerBasedRLEnv``.
+
+:class:`MockRLEnv` builds a task from its unmodified env config with the real managers of Isaac Lab (actions,
+observations, commands, rewards, terminations, events and curriculum) and the task's own terms, but replaces the
+scene by light-weight assets implementing the parts of the ``Articulation``, ``ContactSensor``, ``RayCaster`` and
+``TerrainImporter`` API the terms use:
+
+* joints are unit-less point masses driven by the torques of the robot's real actuator models, integrated with
+  semi-implicit Euler and clamped to their limits;
+* the root is kinematic: it keeps the velocity written by the reset and push events, decaying over a second, and
+  is accelerated by the external forces;
+* every body sits at a fixed random offset from the root, swinging with the angle of its joint, so that its pose
+  and velocity follow the joints;
+* a body is in contact when it is close to the ground, which is flat at the height of the environment origins;
+* ray casters hit that flat ground, which is also the height field of generated terrains.
+
+Nothing here is physically meaningful, the point is to run the Python hot paths of a task (its managers and terms)
+at thousands of environments on the CPU, without Isaac Sim or a GPU, e.g. to profile them or to catch shape and
+indexing errors. The Isaac Sim modules are replaced by the placeholders of :mod:`unitree_rl_lab.utils.kit_shims`
+when the simulator is not installed.
+
+The joint names come from ``joint_sdk_names`` of the robot config, or from its URDF when the file exists. USD
+assets cannot be read without Isaac Sim, so the body names are inferred from the joint names (``*_joint`` moves
+``*_link``) and completed with the body names the task config refers to.
+
+Example::
+
+    from unitree_rl_lab.utils.mock_env import MockRLEnv, load_env_cfg
+
+    env = MockRLEnv(load_env_cfg("Unitree-G1-29dof-Velocity", num_envs=4096))
+    obs, _ = env.reset()
+    obs, rew, terminated, truncated, extras = env.step(torch.zeros(env.num_envs, env.action_space.shape[1]))
+"""
+
+from __future__ import annotations
+
+import importlib
+import numpy as np
+import os
+import re
+import tempfile
+import torch
+import xml.etree.ElementTree as ET
+from collections.abc import Sequence
+from types import SimpleNamespace
+
+from unitree_rl_lab.utils import kit_shims, task_registry
+
+kit_shims.install()
+
+import isaaclab.utils.math as math_utils  # noqa: E402
+import isaaclab.utils.string as string_utils  # noqa: E402
+from isaaclab.assets import Articulation, ArticulationCfg, AssetBaseCfg  # noqa: E402
+from isaaclab.envs import ManagerBasedRLEnv, ManagerBasedRLEnvCfg  # noqa: E402
+from isaaclab.managers import EventManager  # noqa: E402
+from isaaclab.scene import InteractiveScene, InteractiveSceneCfg  # noqa: E402
+from isaaclab.sensors import (  # noqa: E402
+    ContactSensor,
+    ContactSensorCfg,
+    ContactSensorData,
+    RayCaster,
+    RayCasterCfg,
+    RayCasterData,
+    SensorBase,
+)
+from isaaclab.terrains import TerrainImporter, TerrainImporterCfg  # noqa: E402
+
+from unitree_rl_lab.utils.terrain_cache import HeightField, register_height_field  # noqa: E402
+
+JOINT_INERTIA = 0.1
+"""Inertia added to the armature of every joint (kg m^2)."""
+
+JOINT_LIMIT = 1.5
+"""Half range of the joint position limits around the default joint positions (rad)."""
+
+ROOT_VELOCITY_DECAY = 1.0
+"""Time constant of the decay of the root velocity (s)."""
+
+BODY_SWING = 0.05
+"""Vertical displacement of a body when its joint moves by one radian (m)."""
+
+CONTACT_HEIGHT = 0.02
+"""Height below which a body is in contact with the ground (m)."""
+
+
+def _init_sensor(sensor: SensorBase, cfg, num_envs: int, device: str, ground_z: torch.Tensor):
+    """The parts of ``SensorBase.__init__`` and ``_initialize_impl`` used by ``update`` and ``reset``."""
+    sensor.cfg = cfg
+    sensor._device = device
+    sensor._num_envs = num_envs
+    sensor._ground_z = ground_z
+    sensor._is_initialized = True
+    sensor._is_visualizing = False
+    sensor._debug_vis_handle = None
+    sensor._timestamp = torch.zeros(num_envs, device=device)
+    sensor._timestamp_last_update = torch.zeros_like(sensor._timestamp)
+    sensor._is_outdated = torch.ones(num_envs, dtype=torch.bool, device=device)
+
+
+class _MockPhysxView:
+    """The ``root_physx_view`` buffers read and written by the randomization events, as CPU tensors.
+
+    Every body has a single collision shape. The view also stands in for the physics simulation view, to create the
+    views of single bodies.
+    """
+
+    def __init__(self, num_envs: int, body_names: list[str], masses: torch.Tensor):
+        self.count = num_envs
+        self.max_shapes = len(body_names)
+        self.link_paths = [[f"/World/envs/env_0/Robot/{name}" for name in body_names]]
+        self._masses = masses.clone()
+        self._inertias = torch.zeros(num_envs, len(body_names), 9)
+        self._inertias[..., [0, 4, 8]] = 0.01 * masses[..., None]
+        self._coms = torch.zeros(num_envs, len(body_names), 7)
+        self._coms[..., 3] = 1.0
+        self._materials = torch.ones(num_envs, self.max_shapes, 3)
+        self._materials[..., 2] = 0.0
+
+    def create_rigid_body_view(self, link_path: str) -> SimpleNamespace:
+        return SimpleNamespace(count=self.count, max_shapes=1)
+
+    def get_masses(self) -> torch.Tensor:
+        return self._masses.clone()
+
+    def set_masses(self, masses: torch.Tensor, indices: torch.Tensor):
+        self._masses[indices] = masses[indices]
+
+    def get_inertias(self) -> torch.Tensor:
+        return self._inertias.clone()
+
+    def set_inertias(self, inertias: torch.Tensor, indices: torch.Tensor):
+        self._inertias[indices] = inertias[indices]
+
+    def get_coms(self) -> torch.Tensor:
+        return self._coms.clone()
+
+    def set_coms(self, coms: torch.Tensor, indices: torch.Tensor):
+        self._coms[indices] = coms[indices]
+
+    def get_material_properties(self) -> torch.Tensor:
+        return self._materials.clone()
+
+    def set_material_properties(self, materials: torch.Tensor, indices: torch.Tensor):
+        self._materials[indices] = materials[indices]
+
+
+class MockArticulationData:
+    """The buffers of ``ArticulationData``, as plain tensors refreshed after every simulation step."""
+
+    def __init__(self, num_envs: int, joint_names: list[str], body_names: list[str], device: str):
+        n, j, b = num_envs, len(joint_names), len(body_names)
+        self.joint_names = joint_names
+        self.body_names = body_names
+        self.GRAVITY_VEC_W = torch.tensor([0.0, 0.0, -1.0], device=device).repeat(n, 1)
+        self.FORWARD_VEC_B = torch.tensor([1.0, 0.0, 0.0], device=device).repeat(n, 1)
+
+        # joints
+        self.joint_pos = torch.zeros(n, j, device=device)
+        self.joint_vel = torch.zeros(n, j, device=device)
+        self.joint_acc = torch.zeros(n, j, device=device)
+        self.default_joint_pos = torch.zeros(n, j, device=device)
+        self.default_joint_vel = torch.zeros(n, j, device=device)
+        self.joint_pos_target = torch.zeros(n, j, device=device)
+        self.joint_vel_target = torch.zeros(n, j, device=device)
+        self.joint_effort_target = torch.zeros(n, j, device=device)
+        self.computed_torque = torch.zeros(n, j, device=device)
+        self.applied_torque = torch.zeros(n, j, device=device)
+        self.gear_ratio = torch.ones(n, j, device=device)
+        self.joint_pos_limits = torch.zeros(n, j, 2, device=device)
+        self.default_joint_pos_limits = torch.zeros(n, j, 2, device=device)
+        self.soft_joint_pos_limits = torch.zeros(n, j, 2, device=device)
+        self.joint_vel_limits = torch.zeros(n, j, device=device)
+        self.soft_joint_vel_limits = torch.zeros(n, j, device=device)
+        self.joint_effort_limits = torch.zeros(n, j, device=device)
+        self.default_joint_stiffness = torch.zeros(n, j, device=device)
+        self.default_joint_damping = torch.zeros(n, j, device=device)
+        self.default_joint_armature = torch.zeros(n, j, device=device)
+        self.default_joint_friction_coeff = torch.zeros(n, j, device=device)
+        self.default_joint_dynamic_friction_coeff = torch.zeros(n, j, device=device)
+        self.default_joint_viscous_friction_coeff = torch.zeros(n, j, device=device)
+
+        # root
+        self.default_root_state = torch.zeros(n, 13, device=device)
+        self.root_pos_w = torch.zeros(n, 3, device=device)
+        self.root_quat_w = torch.zeros(n, 4, device=device)
+        self.root_lin_vel_w = torch.zeros(n, 3, device=device)
+        self.root_ang_vel_w = torch.zeros(n, 3, device=device)
+        self.root_lin_vel_b = torch.zeros(n, 3, device=device)
+        self.root_ang_vel_b = torch.zeros(n, 3, device=device)
+        self.projected_gravity_b = torch.zeros(n, 3, device=device)
+        self.heading_w = torch.zeros(n, device=device)
+
+        # bodies
+        self.body_pos_w = torch.zeros(n, b, 3, device=device)
+        self.body_quat_w = torch.zeros(n, b, 4, device=device)
+        self.body_lin_vel_w = torch.zeros(n, b, 3, device=device)
+        self.body_ang_vel_w = torch.zeros(n, b, 3, device=device)
+        self.body_lin_acc_w = torch.zeros(n, b, 3, device=device)
+        self.body_ang_acc_w = torch.zeros(n, b, 3, device=device)
+        self.default_mass = torch.ones(n, b)
+        self.default_inertia = torch.zeros(n, b, 9)
+
+    @property
+    def root_pose_w(self) -> torch.Tensor:
+        return torch.cat([self.root_pos_w, self.root_quat_w], dim=-1)
+
+    @property
+    def root_vel_w(self) -> torch.Tensor:
+        return torch.cat([self.root_lin_vel_w, self.root_ang_vel_w], dim=-1)
+
+    @property
+    def root_state_w(self) -> torch.Tensor:
+        return torch.cat([self.root_pos_w, self.root_quat_w, self.root_lin_vel_w, self.root_ang_vel_w], dim=-1)
+
+    @property
+    def body_pose_w(self) -> torch.Tensor:
+        return torch.cat([self.body_pos_w, self.body_quat_w], dim=-1)
+
+    @property
+    def body_vel_w(self) -> torch.Tensor:
+        return torch.cat([self.body_lin_vel_w, self.body_ang_vel_w], dim=-1)
+
+    @property
+    def body_state_w(self) -> torch.Tensor:
+        return torch.cat([self.body_pos_w, self.body_quat_w, self.body_lin_vel_w, self.body_ang_vel_w], dim=-1)
+
+
+class MockArticulation(Articulation):
+    """Floating-base articulation with kinematic root and bodies, and joints driven by the actuator models.
+
+    Args:
+        cfg: The articulation config of the task.
+        num_envs: Number of environments.
+        device: Torch device of the buffers.
+        joint_names: Names of the joints, in order.
+        body_names: Names of the bodies, in order, the root first.
+        body_joint_ids: Index of the joint moving each body, -1 for the root and the bodies without joint.
+    """
+
+    def __init__(
+        self,
+        cfg: ArticulationCfg,
+        num_envs: int,
+        device: str,
+        joint_names: list[str],
+        body_names: list[str],
+        body_joint_ids: list[int],
+    ):
+        self.cfg = cfg
+        self._device = device
+        self._num_instances = num_envs
+        self._joint_names = joint_names
+        self._body_names = body_names
+        self._is_initialized = True
+        self._ALL_INDICES = torch.arange(num_envs, dtype=torch.long, device=device)
+
+        n, j, b = num_envs, len(joint_names), len(body_names)
+        self._data = MockArticulationData(n, joint_names, body_names, device)
+        self._data.default_mass[:] = 60.0 / b
+        self._root_physx_view = _MockPhysxView(n, body_names, self._data.default_mass)
+        self._physics_sim_view = self._root_physx_view
+        self._data.default_inertia[:] = self._root_physx_view.get_inertias()
+
+        self._external_force_b = torch.zeros(n, b, 3, device=device)
+        self._external_torque_b = torch.zeros(n, b, 3, device=device)
+        self._external_wrench_positions_b = torch.zeros(n, b, 3, device=device)
+        self._use_global_wrench_frame = False
+        self.has_external_wrench = False
+        self.uses_external_wrench_positions = False
+        self._joint_pos_target_sim = torch.zeros(n, j, device=device)
+        self._joint_vel_target_sim = torch.zeros(n, j, device=device)
+        self._joint_effort_target_sim = torch.zeros(n, j, device=device)
+
+        self._process_init_state()
+        self._process_actuators()
+
+        # body placement relative to the root, the same in all envs: the bodies are spread from the root down to
+        # the ground, each swinging about its own axis with the angle of its joint
+        depth = torch.randperm(b - 1, device=device).float() / max(b - 2, 1)
+        self._body_offset_b = torch.zeros(b, 3, device=device)
+        self._body_offset_b[1:, :2] = 0.1 * torch.randn(b - 1, 2, device=device)
+        self._body_offset_b[1:, 2] = -depth * self.cfg.init_state.pos[2]
+        self._body_axis_b = math_utils.normalize(torch.randn(b, 3, device=device))
+        self._body_joint_ids = torch.tensor(body_joint_ids, dtype=torch.long, device=device).clamp(min=0)
+        self._body_has_joint = torch.tensor([i >= 0 for i in body_joint_ids], device=device).float()
+
+        self.write_root_state_to_sim(self._data.default_root_state)
+        self.write_joint_state_to_sim(self._data.default_joint_pos, self._data.default_joint_vel)
+
+    def __del__(self):
+        pass
+
+    """
+    Properties
+    """
+
+    @property
+    def data(self) -> MockArticulationData:
+        return self._data
+
+    @property
+    def num_instances(self) -> int:
+        return self._num_instances
+
+    @property
+    def is_fixed_base(self) -> bool:
+        return False
+
+    @property
+    def num_joints(self) -> int:
+        return len(self._joint_names)
+
+    @property
+    def num_fixed_tendons(self) -> int:
+        return 0
+
+    @property
+    def num_spatial_tendons(self) -> int:
+        return 0
+
+    @property
+    def num_bodies(self) -> int:
+        return len(self._body_names)
+
+    @property
+    def joint_names(self) -> list[str]:
+        return self._joint_names
+
+    @property
+    def fixed_tendon_names(self) -> list[str]:
+        return []
+
+    @property
+    def spatial_tendon_names(self) -> list[str]:
+        return []
+
+    @property
+    def body_names(self) -> list[str]:
+        return self._body_names
+
+    @property
+    def root_physx_view(self) -> _MockPhysxView:
+        return self._root_physx_view
+
+    """
+    Operations
+    """
+
+    def write_data_to_sim(self):
+        self._apply_actuator_model()
+
+    def update(self, dt: float):
+        pass
+
+    def step(self, dt: float):
+        """Advance the joints and the root by ``dt``, then place the bodies."""
+        data = self._data
+        inertia = data.default_joint_armature + JOINT_INERTIA
+        previous_joint_vel = data.joint_vel.clone()
+        data.joint_vel += data.applied_torque / inertia * dt
+        data.joint_vel.clamp_(-data.joint_vel_limits, data.joint_vel_limits)
+        joint_pos = data.joint_pos + data.joint_vel * dt
+        data.joint_pos[:] = torch.clamp(joint_pos, data.joint_pos_limits[..., 0], data.joint_pos_limits[..., 1])
+        data.joint_vel[joint_pos != data.joint_pos] = 0.0
+        data.joint_acc[:] = (data.joint_vel - previous_joint_vel) / dt
+
+        if self.has_external_wrench:
+            force_b = self._external_force_b.sum(dim=1)
+            force_w = force_b if self._use_global_wrench_frame else math_utils.quat_apply(data.root_quat_w, force_b)
+            data.root_lin_vel_w += force_w / self._root_physx_view._masses.sum(dim=1, keepdim=True).to(self.device) * dt
+        decay = 1.0 - dt / ROOT_VELOCITY_DECAY
+        data.root_lin_vel_w *= decay
+        data.root_ang_vel_w *= decay
+        data.root_pos_w += data.root_lin_vel_w * dt
+        delta_quat = torch.cat([torch.ones_like(data.heading_w)[:, None], 0.5 * data.root_ang_vel_w * dt], dim=-1)
+        data.root_quat_w[:] = math_utils.normalize(math_utils.quat_mul(delta_quat, data.root_quat_w))
+        self._refresh()
+
+    """
+    Operations - Writers
+    """
+
+    def write_root_state_to_sim(self, root_state: torch.Tensor, env_ids: Sequence[int] | None = None):
+        self.write_root_pose_to_sim(root_state[:, :7], env_ids=env_ids)
+        self.write_root_velocity_to_sim(root_state[:, 7:], env_ids=env_ids)
+
+    def write_root_pose_to_sim(self, root_pose: torch.Tensor, env_ids: Sequence[int] | None = None):
+        env_ids = slice(None) if env_ids is None else env_ids
+        self._data.root_pos_w[env_ids] = root_pose[:, :3]
+        self._data.root_quat_w[env_ids] = root_pose[:, 3:7]
+        self._refresh()
+
+    def write_root_velocity_to_sim(self, root_velocity: torch.Tensor, env_ids: Sequence[int] | None = None):
+        env_ids = slice(None) if env_ids is None else env_ids
+        self._data.root_lin_vel_w[env_ids] = root_velocity[:, :3]
+        self._data.root_ang_vel_w[env_ids] = root_velocity[:, 3:]
+        self._refresh()
+
+    write_root_link_state_to_sim = write_root_com_state_to_sim = write_root_state_to_sim
+    write_root_link_pose_to_sim = write_root_com_pose_to_sim = write_root_pose_to_sim
+    write_root_link_velocity_to_sim = write_root_com_velocity_to_sim = write_root_velocity_to_sim
+
+    def write_joint_state_to_sim(
+        self,
+        position: torch.Tensor,
+        velocity: torch.Tensor,
+        joint_ids: Sequence[int] | slice | None = None,
+        env_ids: Sequence[int] | slice | None = None,
+    ):
+        self.write_joint_position_to_sim(position, joint_ids=joint_ids, env_ids=env_ids)
+        self.write_joint_velocity_to_sim(velocity, joint_ids=joint_ids, env_ids=env_ids)
+
+    def write_joint_position_to_sim(
+        self,
+        position: torch.Tensor,
+        joint_ids: Sequence[int] | slice | None = None,
+        env_ids: Sequence[int] | slice | None = None,
+    ):
+        env_ids, joint_ids = self._resolve_ids(env_ids, joint_ids)
+        self._data.joint_pos[env_ids, joint_ids] = position
+        self._refresh()
+
+    def write_joint_velocity_to_sim(
+        self,
+        velocity: torch.Tensor,
+        joint_ids: Sequence[int] | slice | None = None,
+        env_ids: Sequence[int] | slice | None = None,
+    ):
+        env_ids, joint_ids = self._resolve_ids(env_ids, joint_ids)
+        self._data.joint_vel[env_ids, joint_ids] = velocity
+        self._data.joint_acc[env_ids, joint_ids] = 0.0
+        self._refresh()
+
+    """
+    Internal helpers
+    """
+
+    @staticmethod
+    def _resolve_ids(env_ids, joint_ids):
+        env_ids = slice(None) if env_ids is None else env_ids
+        joint_ids = slice(None) if joint_ids is None else joint_ids
+        if env_ids != slice(None) and joint_ids != slice(None):
+            env_ids = env_ids[:, None]
+        return env_ids, joint_ids
+
+    def _process_init_state(self):
+        data, init_state = self._data, self.cfg.init_state
+        data.default_root_state[:] = torch.tensor(
+            [*init_state.pos, *init_state.rot, *init_state.lin_vel, *init_state.ang_vel], device=self.device
+        )
+        for values, buffer in (
+            (init_state.joint_pos, data.default_joint_pos),
+            (init_state.joint_vel, data.default_joint_vel),
+        ):
+            indices, _, values = string_utils.resolve_matching_names_values(values, self.joint_names)
+            buffer[:, indices] = torch.tensor(values, device=self.device)
+
+        data.joint_pos_limits[..., 0] = data.default_joint_pos - JOINT_LIMIT
+        data.joint_pos_limits[..., 1] = data.default_joint_pos + JOINT_LIMIT
+        data.default_joint_pos_limits[:] = data.joint_pos_limits
+        mean = data.joint_pos_limits.mean(dim=-1)
+        half_range = 0.5 * (data.joint_pos_limits[..., 1] - data.joint_pos_limits[..., 0])
+        factor = self.cfg.soft_joint_pos_limit_factor
+        data.soft_joint_pos_limits[..., 0] = mean - factor * half_range
+        data.soft_joint_pos_limits[..., 1] = mean + factor * half_range
+        data.joint_vel_limits[:] = 30.0
+        data.joint_effort_limits[:] = 400.0
+
+    def _process_actuators(self):
+        """``Articulation._process_actuators_cfg`` without the writes to the simulation."""
+        data = self._data
+        self.actuators = dict()
+        self._has_implicit_actuators = False
+        for actuator_name, actuator_cfg in self.cfg.actuators.items():
+            joint_ids, joint_names = self.find_joints(actuator_cfg.joint_names_expr)
+            if len(joint_names) == 0:
+                raise ValueError(
+                    f"No joints found for actuator group: {actuator_name} with joint name expression:"
+                    f" {actuator_cfg.joint_names_expr}."
+                )
+            if len(joint_names) == self.num_joints:
+                joint_ids = slice(None)
+            else:
+                joint_ids = torch.tensor(joint_ids, device=self.device)
+            actuator = actuator_cfg.class_type(
+                cfg=actuator_cfg,
+                joint_names=joint_names,
+                joint_ids=joint_ids,
+                num_envs=self.num_instances,
+                device=self.device,
+                stiffness=data.default_joint_stiffness[:, joint_ids],
+                damping=data.default_joint_damping[:, joint_ids],
+                armature=data.default_joint_armature[:, joint_ids],
+                friction=data.default_joint_friction_coeff[:, joint_ids],
+                dynamic_friction=data.default_joint_dynamic_friction_coeff[:, joint_ids],
+                viscous_friction=data.default_joint_viscous_friction_coeff[:, joint_ids],
+                effort_limit=data.joint_effort_limits[:, joint_ids],
+                velocity_limit=data.joint_vel_limits[:, joint_ids],
+            )
+            self.actuators[actuator_name] = actuator
+            self._has_implicit_actuators |= actuator.is_implicit_model
+            data.default_joint_stiffness[:, actuator.joint_indices] = actuator.stiffness
+            data.default_joint_damping[:, actuator.joint_indices] = actuator.damping
+            data.default_joint_armature[:, actuator.joint_indices] = actuator.armature
+            data.default_joint_friction_coeff[:, actuator.joint_indices] = actuator.friction
+            data.joint_vel_limits[:, actuator.joint_indices] = actuator.velocity_limit_sim
+            data.soft_joint_vel_limits[:, actuator.joint_indices] = actuator.velocity_limit
+
+    def _refresh(self):
+        """Recompute the root quantities in body frame and the body states from the root and joint states."""
+        data = self._data
+        data.root_lin_vel_b[:] = math_utils.quat_apply_inverse(data.root_quat_w, data.root_lin_vel_w)
+        data.root_ang_vel_b[:] = math_utils.quat_apply_inverse(data.root_quat_w, data.root_ang_vel_w)
+        data.projected_gravity_b[:] = math_utils.quat_apply_inverse(data.root_quat_w, data.GRAVITY_VEC_W)
+        forward_w = math_utils.quat_apply(data.root_quat_w, data.FORWARD_VEC_B)
+        data.heading_w[:] = torch.atan2(forward_w[:, 1], forward_w[:, 0])
+
+        offset_b, quat_b = self.body_pose_b(data.joint_pos)
+        rate = data.joint_vel[:, self._body_joint_ids] * self._body_has_joint
+        root_quat_w = data.root_quat_w[:, None, :].expand(-1, self.num_bodies, -1)
+        offset_w = math_utils.quat_apply(root_quat_w, offset_b)
+        data.body_pos_w[:] = data.root_pos_w[:, None, :] + offset_w
+        data.body_quat_w[:] = math_utils.quat_mul(root_quat_w, quat_b)
+        root_ang_vel_w = data.root_ang_vel_w[:, None, :]
+        data.body_lin_vel_w[:] = data.root_lin_vel_w[:, None, :] + torch.cross(
+            root_ang_vel_w.expand_as(offset_w), offset_w, dim=-1
+        )
+        data.body_ang_vel_w[:] = root_ang_vel_w + math_utils.quat_apply(
+            root_quat_w, self._body_axis_b * rate[..., None]
+        )
+
+    def body_pose_b(self, joint_pos: torch.Tensor) -> tuple[torch.Tensor, torch.Tensor]:
+        """Positions and orientations of the bodies in the root frame, for joint positions of shape (..., J)."""
+        angle = joint_pos[..., self._body_joint_ids] * self._body_has_joint
+        pos_b = self._body_offset_b.expand(*angle.shape, 3).clone()
+        pos_b[..., 2] += BODY_SWING * torch.sin(angle)
+        axis_b = self._body_axis_b.expand(*angle.shape, 3)
+        quat_b = math_utils.quat_from_angle_axis(angle.flatten(), axis_b.flatten(0, -2)).view(*angle.shape, 4)
+        return pos_b, quat_b
+
+
+class MockContactSensor(ContactSensor):
+    """Contact sensor on bodies of a :class:`MockArticulation`, in contact when close to the ground.
+
+    The bodies in contact of an environment share the weight of the robot as vertical contact force.
+    """
+
+    def __init__(
+        self,
+        cfg: ContactSensorCfg,
+        num_envs: int,
+        device: str,
+        articulation: MockArticulation,
+        body_expr: str,
+        ground_z: torch.Tensor,
+    ):
+        _init_sensor(self, cfg, num_envs, device, ground_z)
+        self._articulation = articulation
+        self._body_ids, self._body_names = articulation.find_bodies(body_expr)
+        self._num_bodies = len(self._body_ids)
+
+        n, b = num_envs, self._num_bodies
+        self._data = ContactSensorData()
+        self._data.net_forces_w = torch.zeros(n, b, 3, device=device)
+        self._data.net_forces_w_history = torch.zeros(n, max(cfg.history_length, 1), b, 3, device=device)
+        if cfg.track_air_time:
+            self._data.last_air_time = torch.zeros(n, b, device=device)
+            self._data.current_air_time = torch.zeros(n, b, device=device)
+            self._data.last_contact_time = torch.zeros(n, b, device=device)
+            self._data.current_contact_time = torch.zeros(n, b, device=device)
+
+    def __del__(self):
+        pass
+
+    @property
+    def num_instances(self) -> int:
+        return self._num_envs
+
+    @property
+    def num_bodies(self) -> int:
+        return self._num_bodies
+
+    @property
+    def body_names(self) -> list[str]:
+        return self._body_names
+
+    def _update_buffers_impl(self, env_ids: Sequence[int]):
+        data = self._data
+        robot = self._articulation.data
+        height = robot.body_pos_w[env_ids][:, self._body_ids, 2]
+        ground = self._ground_z[env_ids, None]
+        in_contact = height < ground + CONTACT_HEIGHT
+        weight = self._articulation.root_physx_view._masses[env_ids.cpu()].sum(dim=1).to(self.device) * 9.81
+        share = weight[:, None] / in_contact.sum(dim=1, keepdim=True).clamp(min=1)
+        data.net_forces_w[env_ids] = 0.0
+        data.net_forces_w[env_ids, :, 2] = share * in_contact
+        if self.cfg.history_length > 0:
+            data.net_forces_w_history[env_ids] = data.net_forces_w_history[env_ids].roll(1, dims=1)
+            data.net_forces_w_history[env_ids, 0] = data.net_forces_w[env_ids]
+        else:
+            data.net_forces_w_history[env_ids, 0] = data.net_forces_w[env_ids]
+
+        if self.cfg.track_air_time:
+            elapsed_time = (self._timestamp[env_ids] - self._timestamp_last_update[env_ids])[:, None]
+            is_contact = torch.norm(data.net_forces_w[env_ids], dim=-1) > self.cfg.force_threshold
+            is_first_contact = (data.current_air_time[env_ids] > 0) * is_contact
+            is_first_detached = (data.current_contact_time[env_ids] > 0) * ~is_contact
+            data.last_air_time[env_ids] = torch.where(
+                is_first_contact, data.current_air_time[env_ids] + elapsed_time, data.last_air_time[env_ids]
+            )
+            data.current_air_time[env_ids] = torch.where(
+                ~is_contact, data.current_air_time[env_ids] + elapsed_time, 0.0
+            )
+            data.last_contact_time[env_ids] = torch.where(
+                is_first_detached, data.current_contact_time[env_ids] + elapsed_time, data.last_contact_time[env_ids]
+            )
+            data.current_contact_time[env_ids] = torch.where(
+                is_contact, data.current_contact_time[env_ids] + elapsed_time, 0.0
+            )
+
+
+class MockRayCaster(RayCaster):
+    """Ray caster attached to a body of a :class:`MockArticulation`, hitting the flat ground."""
+
+    def __init__(
+        self,
+        cfg: RayCasterCfg,
+        num_envs: int,
+        device: str,
+        articulation: MockArticulation,
+        body_name: str,
+        ground_z: torch.Tensor,
+    ):
+        _init_sensor(self, cfg, num_envs, device, ground_z)
+        self._articulation = articulation
+        body_ids, _ = articulation.find_bodies(body_name)
+        self._body_id = body_ids[0]
+        self.ray_starts, self.ray_directions = cfg.pattern_cfg.func(cfg.pattern_cfg, device)
+        self.num_rays = len(self.ray_directions)
+        self.ray_starts = self.ray_starts.repeat(num_envs, 1, 1)
+        offset_pos = torch.tensor(list(cfg.offset.pos), device=device)
+        self.ray_starts += offset_pos
+        self._data = RayCasterData()
+        self._data.pos_w = torch.zeros(num_envs, 3, device=device)
+        self._data.quat_w = torch.zeros(num_envs, 4, device=device)
+        self._data.ray_hits_w = torch.zeros(num_envs, self.num_rays, 3, device=device)
+
+    def __del__(self):
+        pass
+
+    @property
+    def num_instances(self) -> int:
+        return self._num_envs
+
+    def reset(self, env_ids: Sequence[int] | None = None):
+        SensorBase.reset(self, env_ids)
+
+    def _update_buffers_impl(self, env_ids: Sequence[int]):
+        robot = self._articulation.data
+        pos_w = robot.body_pos_w[env_ids, self._body_id]
+        quat_w = robot.body_quat_w[env_ids, self._body_id]
+        self._data.pos_w[env_ids] = pos_w
+        self._data.quat_w[env_ids] = quat_w
+        if self.cfg.ray_alignment == "world":
+            ray_starts_w = self.ray_starts[env_ids]
+        else:
+            if self.cfg.ray_alignment == "yaw":
+                quat_w = math_utils.yaw_quat(quat_w)
+            ray_starts_w = math_utils.quat_apply(
+                quat_w[:, None, :].expand(-1, self.num_rays, -1), self.ray_starts[env_ids]
+            )
+        hits = pos_w[:, None, :] + ray_starts_w
+        hits[..., 2] = self._ground_z[env_ids, None]
+        self._data.ray_hits_w[env_ids] = hits
+
+
+class MockTerrain(TerrainImporter):
+    """Flat ground with the environment origins of the terrain importer, including the curriculum of sub-terrains."""
+
+    def __init__(self, cfg: TerrainImporterCfg, device: str):
+        self.cfg = cfg
+        self.device = device
+        self.terrain_prim_paths = list()
+        self.terrain_origins = None
+        self.env_origins = None
+        self._terrain_flat_patches = dict()
+        generator = cfg.terrain_generator if cfg.terrain_type == "generator" else None
+        if generator is not None:
+            rows, cols = torch.meshgrid(
+                torch.arange(generator.num_rows), torch.arange(generator.num_cols), indexing="ij"
+            )
+            origins = torch.zeros(generator.num_rows, generator.num_cols, 3)
+            origins[..., 0] = (rows + 0.5) * generator.size[0]
+            origins[..., 1] = (cols + 0.5 - generator.num_cols / 2) * generator.size[1]
+            self.configure_env_origins(origins)
+            # the ground is at the height of the origins, a single cell covers it
+            register_height_field(generator, HeightField(torch.zeros(2, 2, device=device), (-1.0e4, -1.0e4), 2.0e4))
+        else:
+            self.configure_env_origins()
+
+    def __del__(self):
+        pass
+
+
+class MockScene(InteractiveScene):
+    """``InteractiveScene`` of mock assets, built from the scene config of a task.
+
+    Articulations, contact sensors, ray casters and the terrain are replaced by their mock counterparts. Other
+    assets without physics (lights, ...) are skipped and any other entity raises ``NotImplementedError``.
+    """
+
+    def __init__(self, cfg: InteractiveSceneCfg, device: str, body_names: dict[str, list[str]] | None = None):
+        self.cfg = cfg
+        self._device = device
+        self._physics_dt = None
+        self._terrain = None
+        self._articulations = dict()
+        self._deformable_objects = dict()
+        self._rigid_objects = dict()
+        self._rigid_object_collections = dict()
+        self._sensors = dict()
+        self._surface_grippers = dict()
+        self._extras = dict()
+        self._ALL_INDICES = torch.arange(cfg.num_envs, dtype=torch.long, device=device)
+        self._default_env_origins = torch.zeros(cfg.num_envs, 3, device=device)
+
+        self.env_prim_paths = [f"{self.env_ns}/env_{i}" for i in range(cfg.num_envs)]
+        self._global_prim_paths = list()
+
+        entities = {
+            name: asset_cfg
+            for name, asset_cfg in cfg.__dict__.items()
+            if name not in InteractiveSceneCfg.__dataclass_fields__ and asset_cfg is not None
+        }
+        articulations_by_path = {}
+        for name, asset_cfg in entities.items():
+            if isinstance(asset_cfg, TerrainImporterCfg):
+                asset_cfg.num_envs = cfg.num_envs
+                asset_cfg.env_spacing = cfg.env_spacing
+                self._terrain = MockTerrain(asset_cfg, device)
+            elif isinstance(asset_cfg, ArticulationCfg):
+                joint_names, bodies, body_joint_ids = robot_structure(asset_cfg, (body_names or {}).get(name, []))
+                self._articulations[name] = MockArticulation(
+                    asset_cfg, cfg.num_envs, device, joint_names, bodies, body_joint_ids
+                )
+                articulations_by_path[asset_cfg.prim_path] = self._articulations[name]
+            elif not isinstance(asset_cfg, (ContactSensorCfg, RayCasterCfg)) and type(asset_cfg) is not AssetBaseCfg:
+                # sensors are created once the articulations exist, lights and other assets without physics are left out
+                raise NotImplementedError(f"No mock for scene entity '{name}' of type {type(asset_cfg).__name__}.")
+
+        for name, sensor_cfg in entities.items():
+            if not isinstance(sensor_cfg, (ContactSensorCfg, RayCasterCfg)):
+                continue
+            prim_path, _, body_expr = sensor_cfg.prim_path.rpartition("/")
+            if prim_path not in articulations_by_path:
+                raise NotImplementedError(f"Sensor '{name}' is not attached to a body of an articulation.")
+            sensor_type = MockContactSensor if isinstance(sensor_cfg, ContactSensorCfg) else MockRayCaster
+            self._sensors[name] = sensor_type(
+                sensor_cfg, cfg.num_envs, device, articulations_by_path[prim_path], body_expr, self.env_origins[:, 2]
+            )
+
+    @property
+    def physics_dt(self) -> float:
+        return self._physics_dt
+
+    @property
+    def device(self) -> str:
+        return self._device
+
+
+class MockSimulationContext:
+    """The parts of ``SimulationContext`` used by the environment and the managers: a playing, headless sim."""
+
+    def __init__(self, cfg):
+        self.cfg = cfg
+        self.device = cfg.device
+        self.render_mode = 0
+        self.scene: MockScene | None = None
+
+    def is_playing(self) -> bool:
+        return True
+
+    def is_stopped(self) -> bool:
+        return False
+
+    def has_gui(self) -> bool:
+        return False
+
+    def has_rtx_sensors(self) -> bool:
+        return False
+
+    def get_physics_dt(self) -> float:
+        return self.cfg.dt
+
+    def get_version(self) -> tuple[int, int, int]:
+        return (5, 0, 0)
+
+    def step(self, render: bool = True):
+        for articulation in self.scene.articulations.values():
+            articulation.step(self.cfg.dt)
+
+    def forward(self):
+        pass
+
+    def render(self, mode=None):
+        pass
+
+    def clear_all_callbacks(self):
+        pass
+
+    def clear_instance(self):
+        pass
+
+
+class MockRLEnv(ManagerBasedRLEnv):
+    """``ManagerBasedRLEnv`` on a :class:`MockScene`, with the real managers and terms of the task.
+
+    The environment steps, resets and logs like the original one, so it can be wrapped (``RslRlVecEnvWrapper``)
+    and trained on. Debug visualization is turned off, and the motion files of the command terms that do not exist
+    are replaced by a synthetic motion of the mock robot.
+
+    Args:
+        cfg: The env config of the task, see :func:`load_env_cfg`.
+        render_mode: Only kept for the gymnasium API, nothing is rendered.
+        body_names: Additional body names of the articulations, by scene entity name, for the bodies that cannot be
+            inferred from the joints or the config.
+    """
+
+    def __init__(
+        self, cfg: ManagerBasedRLEnvCfg, render_mode: str | None = None, body_names: dict[str, list[str]] | None = None
+    ):
+        # ManagerBasedRLEnv.__init__
+        self.common_step_counter = 0
+        self.episode_length_buf = torch.zeros(cfg.scene.num_envs, device=cfg.sim.device, dtype=torch.long)
+
+        # ManagerBasedEnv.__init__, without the stage
+        for term_cfg in cfg.commands.__dict__.values():
+            if term_cfg is not None and hasattr(term_cfg, "debug_vis"):
+                term_cfg.debug_vis = False
+        cfg.validate()
+        self.cfg = cfg
+        self._is_closed = False
+        if self.cfg.seed is not None:
+            self.cfg.seed = self.seed(self.cfg.seed)
+        self.sim = MockSimulationContext(self.cfg.sim)
+        if "cuda" in self.device:
+            torch.cuda.set_device(self.device)
+        print("[INFO]: Mock environment:")
+        print(f"\tEnvironment device    : {self.device}")
+        print(f"\tEnvironment seed      : {self.cfg.seed}")
+        print(f"\tPhysics step-size     : {self.physics_dt}")
+        print(f"\tEnvironment step-size : {self.step_dt}")
+        self._sim_step_counter = 0
+        self.extras = {}
+        body_names = {name: list(names) for name, names in (body_names or {}).items()}
+        for name, asset_cfg in self.cfg.scene.__dict__.items():
+            if isinstance(asset_cfg, ArticulationCfg):
+                joint_names, bodies, _ = robot_structure(asset_cfg)
+                body_names[name] = referenced_body_names(self.cfg, joint_names, bodies) + body_names.get(name, [])
+        self.scene = MockScene(self.cfg.scene, self.device, body_names)
+        self.scene._physics_dt = self.physics_dt
+        self.sim.scene = self.scene
+        self._synthesize_motions()
+        print("[INFO]: Scene manager: ", self.scene)
+        self.viewport_camera_controller = None
+        self.event_manager = EventManager(self.cfg.events, self)
+        if "prestartup" in self.event_manager.available_modes:
+            self.event_manager.apply(mode="prestartup")
+        self.scene.update(dt=self.physics_dt)
+        self.load_managers()
+        self._window = None
+        self.obs_buf = {}
+
+        self.render_mode = render_mode
+        self.metadata["render_fps"] = 1 / self.step_dt
+        print("[INFO]: Completed setting up the mock environment...")
+
+    def close(self):
+        self._is_closed = True
+
+    def _synthesize_motions(self):
+        """Point the commands reading a missing motion file to a random motion of the mock robot."""
+        for name, term_cfg in self.cfg.commands.__dict__.items():
+            motion_file = getattr(term_cfg, "motion_file", None)
+            if motion_file is None or os.path.isfile(motion_file):
+                continue
+            term_cfg.motion_file = os.path.join(tempfile.gettempdir(), f"unitree_rl_lab_mock_motion_{os.getpid()}.npz")
+            write_motion(term_cfg.motion_file, self.scene[term_cfg.asset_name])
+            print(f"[WARNING]: Motion file '{motion_file}' of command '{name}' not found, using a synthetic motion.")
+
+
+def load_env_cfg(task: str, num_envs: int | None = None, device: str = "cpu", play: bool = False):
+    """Instantiate the env config of a registered task from the task manifest, without importing the other tasks.
+
+    Args:
+        task: Task id, e.g. ``"Unitree-G1-29dof-Velocity"``.
+        num_envs: Number of environments, the config's by default.
+        device: Torch device of the simulation buffers.
+        play: Whether to load the play config.
+    """
+    specs = {spec["id"]: spec for spec in task_registry.load_manifest()}
+    if task not in specs:
+        raise ValueError(f"Task '{task}' not found. Available tasks: {sorted(specs)}.")
+    entry_point = specs[task]["kwargs"]["play_env_cfg_entry_point" if play else "env_cfg_entry_point"]
+    module_name, class_name = entry_point.split(":")
+    cfg = getattr(importlib.import_module(module_name), class_name)()
+    if num_envs is not None:
+        cfg.scene.num_envs = num_envs
+    cfg.sim.device = device
+    return cfg
+
+
+def robot_structure(cfg: ArticulationCfg, body_names: list[str] = ()) -> tuple[list[str], list[str], list[int]]:
+    """Joint names, body names and the index of the joint moving each body of an articulation config.
+
+    The structure is read from the URDF of the config when the file exists. Otherwise the joints are its
+    ``joint_sdk_names`` and every joint ``<name>_joint`` moves a body ``<name>_link`` (or ``<name>`` when it is one
+    of ``body_names``), after a root body (``pelvis``
+    for humanoids, ``base`` otherwise). ``body_names`` are appended when missing, as bodies without joint.
+    """
+    asset_path = getattr(cfg.spawn, "asset_path", None)
+    if asset_path is not None and asset_path.endswith(".urdf") and os.path.isfile(asset_path):
+        root = ET.parse(asset_path).getroot()
+        links = [link.get("name") for link in root.iter("link")]
+        joints = [j for j in root.iter("joint") if j.get("type") not in ("fixed", "floating", "planar")]
+        joint_names = [j.get("name") for j in joints]
+        parent_joint = {j.find("child").get("link"): i for i, j in enumerate(joints)}
+        bodies = sorted(links, key=lambda link: link in parent_joint)  # the root (no parent joint) first
+    elif getattr(cfg, "joint_sdk_names", None):
+        joint_names = [name for name in cfg.joint_sdk_names if name]
+        stems = [re.sub(r"_joint$", "", name) for name in joint_names]
+        links = [stem if stem in body_names else f"{stem}_link" for stem in stems]
+        parent_joint = {link: i for i, link in enumerate(links)}
+        root = "pelvis" if any(name.startswith("left_") for name in joint_names) else "base"
+        bodies = [root] + links
+    else:
+        raise ValueError("The mock articulation needs a URDF or 'joint_sdk_names' to know the joints.")
+
+    bodies += [name for name in body_names if name not in bodies]
+    return joint_names, bodies, [parent_joint.get(name, -1) for name in bodies]
+
+
+def referenced_body_names(cfg, joint_names: list[str], body_names: list[str]) -> list[str]:
+    """Body names the terms of an env config refer to and that are not in ``body_names``.
+
+    Literal names are returned as they are. The ``.*`` of the patterns matching none of the bodies are replaced by
+    the prefixes of the joint names (``FL``, ``left``, ...), e.g. ``.*_foot`` gives ``FL_foot``, ``FR_foot``, ...
+    """
+    names, seen = [], set()
+
+    def _collect(value):
+        if isinstance(value, str):
+            names.append(value)
+        elif isinstance(value, (list, tuple)):
+            for v in value:
+                _collect(v)
+
+    def _walk(obj):
+        if id(obj) in seen or isinstance(obj, (str, int, float, bool, torch.Tensor, np.ndarray)) or callable(obj):
+            return
+        seen.add(id(obj))
+        if isinstance(obj, (list, tuple)):
+            items = enumerate(obj)
+        else:
+            items = obj.items() if isinstance(obj, dict) else getattr(obj, "__dict__", {}).items()
+        for key, value in items:
+            if isinstance(key, str) and (key == "body_names" or key.endswith("body_name")):
+                _collect(value)
+            else:
+                _walk(value)
+
+    _walk(cfg)
+    literals = [name for name in dict.fromkeys(names) if re.escape(name) == name]
+    known = list(body_names) + literals
+    prefixes = sorted({name.split("_")[0] for name in joint_names})
+    missing = [name for name in literals if name not in body_names]
+    for pattern in dict.fromkeys(names):
+        if pattern in literals or any(re.fullmatch(pattern, name) for name in known):
+            continue
+        candidates = [pattern.replace(".*", prefix, 1).replace(".*", "") for prefix in prefixes]
+        missing += [c for c in candidates if re.escape(c) == c and re.fullmatch(pattern, c)]
+    return list(dict.fromkeys(missing))
+
+
+def write_motion(path: str, robot: MockArticulation, num_frames: int = 500, fps: int = 50):
+    """Write a motion of ``robot`` in the format read by ``MotionLoader``: its joints oscillate around their default
+    positions while the root stays at its initial pose."""
+    t = torch.arange(num_frames, device=robot.device)[:, None] / fps
+    phase = torch.linspace(0.0, 2.0 * torch.pi, robot.num_joints, device=robot.device)
+    joint_pos = robot.data.default_joint_pos[:1] + 0.3 * torch.sin(2.0 * torch.pi * 0.5 * t + phase)
+    joint_vel = torch.gradient(joint_pos, spacing=1.0 / fps, dim=0)[0]
+    pos_b, quat_b = robot.body_pose_b(joint_pos)
+    root_pos = torch.tensor(robot.cfg.init_state.pos, device=robot.device)
+    root_quat = torch.tensor(robot.cfg.init_state.rot, device=robot.device).expand_as(quat_b)
+    body_pos_w = root_pos + math_utils.quat_apply(root_quat, pos_b)
+    body_quat_w = math_utils.quat_mul(root_quat, quat_b)
+    body_lin_vel_w = torch.gradient(body_pos_w, spacing=1.0 / fps, dim=0)[0]
+    body_ang_vel_w = torch.zeros_like(body_lin_vel_w)
+    np.savez(
+        path,
+        fps=np.array([fps]),
+        joint_pos=joint_pos.cpu().numpy(),
+        joint_vel=joint_vel.cpu().numpy(),
+        body_pos_w=body_pos_w.cpu().numpy(),
+        body_quat_w=body_quat_w.cpu().numpy(),
+        body_lin_vel_w=body_lin_vel_w.cpu().numpy(),
+        body_ang_vel_w=body_ang_vel_w.cpu().numpy(),
+    )
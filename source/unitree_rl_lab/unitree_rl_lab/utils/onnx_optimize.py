@@ -0,0 +1,307 @@
+"""Offline optimization of exported policies for the robot CPU.
+
+Starting from ``exported/policy.onnx`` this writes, next to it::
+
+    policy_opt.onnx   observation normalizer folded into the first layer, then optimized offline by onnxruntime
+    policy_int8.onnx  dynamic INT8 quantization of the weights (optional)
+    policy_fp16.onnx  FP16 weights with FP32 inputs and outputs (optional)
+    optimize_report.yaml
+
+and reports latency and action error of every variant against the original graph on recorded observations.
+The deploy ``OrtRunner`` loads any of them, rename the chosen one to ``policy.onnx`` (or rebuild the policy bundle).
+
+Graph optimizations may emit onnxruntime-specific fused operators, so run this with the onnxruntime version used
+on the robot. Latencies measured on the workstation only rank the variants, measure on the robot before relying on
+absolute numbers::
+
+    python -m unitree_rl_lab.utils.onnx_optimize <policy_dir> --obs obs.csv --int8 --fp16
+"""
+
+from __future__ import annotations
+
+import argparse
+import numpy as np
+import os
+import time
+import yaml
+
+try:
+    import onnx
+    import onnxruntime as ort
+    from onnx import numpy_helper
+except ImportError:  # only needed to optimize, not to import the module
+    onnx = ort = numpy_helper = None
+
+
+def _require_onnxruntime():
+    if onnx is None or ort is None:
+        raise ImportError(
+            "Optimizing the exported policy requires 'onnx' and 'onnxruntime': pip install onnx onnxruntime"
+        )
+
+
+def _constant(graph, name: str) -> np.ndarray | None:
+    for init in graph.initializer:
+        if init.name == name:
+            return numpy_helper.to_array(init)
+    for node in graph.node:
+        if node.op_type == "Constant" and node.output[0] == name:
+            return numpy_helper.to_array(node.attribute[0].t)
+    return None
+
+
+def fold_normalizer(model: onnx.ModelProto) -> bool:
+    """Fold ``(obs - mean) / std`` in front of the first ``Gemm`` into its weights and bias.
+
+    ``export_policy_as_onnx`` exports the empirical normalizer as a ``Sub`` followed by a ``Div`` (or ``Mul``)
+    with constant operands. Since ``((x - m) / s) W^T + b = x (W / s)^T + (b - (W / s) m)``, both nodes can be
+    removed, saving two full passes over the observation every step.
+
+    Returns:
+        Whether a normalizer was found and folded.
+    """
+    graph = model.graph
+    consumers = {}
+    for node in graph.node:
+        for name in node.input:
+            consumers.setdefault(name, []).append(node)
+
+    def single_consumer(name):
+        nodes = consumers.get(name, [])
+        return nodes[0] if len(nodes) == 1 else None
+
+    sub = single_consumer(graph.input[0].name)
+    if sub is None or sub.op_type != "Sub":
+        return False
+    scale = single_consumer(sub.output[0])
+    if scale is None or scale.op_type not in ("Div", "Mul"):
+        return False
+    gemm = single_consumer(scale.output[0])
+    if gemm is None or gemm.op_type != "Gemm" or gemm.input[0] != scale.output[0]:
+        return False
+    attrs = {a.name: onnx.helper.get_attribute_value(a) for a in gemm.attribute}
+    if attrs.get("transA", 0) or attrs.get("alpha", 1.0) != 1.0 or attrs.get("beta", 1.0) != 1.0:
+        return False
+
+    mean = _constant(graph, sub.input[1])
+    factor = _constant(graph, scale.input[1])
+    weight = _constant(graph, gemm.input[1])
+    bias = _constant(graph, gemm.input[2]) if len(gemm.input) > 2 else None
+    if mean is None or factor is None or weight is None:
+        return False
+
+    transposed = attrs.get("transB", 0)
+    weight_t = weight.astype(np.float64) if transposed else weight.astype(np.float64).T  # (out, in)
+    mean = np.broadcast_to(mean.astype(np.float64).reshape(-1), weight_t.shape[1:])
+    factor = np.broadcast_to(factor.astype(np.float64).reshape(-1), weight_t.shape[1:])
+    factor = 1.0 / factor if scale.op_type == "Div" else factor
+    weight_t = weight_t * factor[None, :]
+    bias = np.zeros(weight_t.shape[0]) if bias is None else bias.astype(np.float64).reshape(-1)
+    bias = bias - weight_t @ mean
+
+    folded_weight = (weight_t if transposed else weight_t.T).astype(np.float32)
+    name_w, name_b = gemm.input[1] + "_folded", gemm.output[0] + "_bias_folded"
+    graph.initializer.extend(
+        [
+            numpy_helper.from_array(folded_weight, name_w),
+            numpy_helper.from_array(bias.astype(np.float32), name_b),
+        ]
+    )
+    gemm.input[:] = [graph.input[0].name, name_w, name_b]
+    graph.node.remove(sub)
+    graph.node.remove(scale)
+    _remove_unused_initializers(model)
+    return True
+
+
+def _remove_unused_initializers(model: onnx.ModelProto):
+    graph = model.graph
+    used = {name for node in graph.node for name in node.input}
+    for init in list(graph.initializer):
+        if init.name not in used:
+            graph.initializer.remove(init)
+    for node in list(graph.node):
+        if node.op_type == "Constant" and node.output[0] not in used:
+            graph.node.remove(node)
+
+
+def convert_fp16(model: onnx.ModelProto) -> onnx.ModelProto:
+    """Store all float tensors as FP16, keeping FP32 inputs and outputs for the deploy runtime."""
+    model = onnx.ModelProto.FromString(model.SerializeToString())
+    graph = model.graph
+    for init in graph.initializer:
+        if init.data_type == onnx.TensorProto.FLOAT:
+            init.CopyFrom(numpy_helper.from_array(numpy_helper.to_array(init).astype(np.float16), init.name))
+    for node in graph.node:
+        for attr in node.attribute:
+            if attr.type == onnx.AttributeProto.TENSOR and attr.t.data_type == onnx.TensorProto.FLOAT:
+                attr.t.CopyFrom(numpy_helper.from_array(numpy_helper.to_array(attr.t).astype(np.float16)))
+
+    casts = []
+    for value in graph.input:
+        renamed = value.name + "_fp16"
+        for node in graph.node:
+            node.input[:] = [renamed if name == value.name else name for name in node.input]
+        casts.append(onnx.helper.make_node("Cast", [value.name], [renamed], to=onnx.TensorProto.FLOAT16))
+    for value in graph.output:
+        renamed = value.name + "_fp16"
+        for node in graph.node:
+            node.output[:] = [renamed if name == value.name else name for name in node.output]
+        graph.node.append(onnx.helper.make_node("Cast", [renamed], [value.name], to=onnx.TensorProto.FLOAT))
+    for i, cast in enumerate(casts):
+        graph.node.insert(i, cast)
+    del graph.value_info[:]
+    return model
+
+
+def optimize_offline(src: str, dst: str):
+    """Apply the onnxruntime graph optimizations once and save the result, so the robot skips them at startup."""
+    options = ort.SessionOptions()
+    # extended fusions are hardware independent, ORT_ENABLE_ALL would bake in the layout of this machine
+    options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_EXTENDED
+    options.optimized_model_filepath = dst
+    ort.InferenceSession(src, options, providers=["CPUExecutionProvider"])
+
+
+def load_observations(path: str) -> np.ndarray:
+    """Observations as written by ``deploy/tools/replay --obs`` (csv) or saved with numpy (npy/npz)."""
+    if path.endswith(".npy"):
+        obs = np.load(path)
+    elif path.endswith(".npz"):
+        data = np.load(path)
+        obs = data[data.files[0]]
+    else:
+        obs = np.loadtxt(path, delimiter=",", ndmin=2)
+    return np.asarray(obs, dtype=np.float32).reshape(len(obs), -1)
+
+
+def _session(path: str, num_threads: int):
+    options = ort.SessionOptions()
+    options.intra_op_num_threads = num_threads
+    options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_EXTENDED
+    return ort.InferenceSession(path, options, providers=["CPUExecutionProvider"])
+
+
+def _run_all(session, obs: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Run every observation one at a time, as on the robot, returning outputs and latencies in us."""
+    input_name = session.get_inputs()[0].name
+    for row in obs[:10]:  # warm up
+        session.run(None, {input_name: row[None]})
+    outputs, latency = [], np.empty(len(obs))
+    for i, row in enumerate(obs):
+        start = time.perf_counter_ns()
+        outputs.append(session.run(None, {input_name: row[None]})[0][0])
+        latency[i] = (time.perf_counter_ns() - start) * 1e-3
+    return np.stack(outputs), latency
+
+
+def optimize_policy(
+    export_dir: str,
+    obs: np.ndarray,
+    int8: bool = False,
+    fp16: bool = False,
+    tolerance: float = 1e-3,
+    num_threads: int = 1,
+    max_samples: int = 2000,
+) -> dict:
+    """Write the optimized variants of ``<export_dir>/policy.onnx`` and compare them on ``obs``.
+
+    Args:
+        export_dir: Directory of the exported ``policy.onnx``.
+        obs: Recorded policy observations, shape (num_samples, obs_dim).
+        int8: Also write a dynamically quantized INT8 variant.
+        fp16: Also write an FP16 variant.
+        tolerance: Max abs action error for a variant to be recommended.
+        num_threads: Intra-op threads for the latency measurement.
+        max_samples: Number of observations used, evenly subsampled.
+
+    Returns:
+        The report, also written to ``<export_dir>/optimize_report.yaml``.
+    """
+    _require_onnxruntime()
+    src = os.path.join(export_dir, "policy.onnx")
+    if len(obs) > max_samples:
+        obs = obs[np.linspace(0, len(obs) - 1, max_samples).astype(int)]
+
+    variants = {"policy.onnx": src}
+    model = onnx.load(src)
+    folded = fold_normalizer(model)
+    folded_path = os.path.join(export_dir, "policy_folded.onnx")
+    onnx.save(model, folded_path)
+    variants["policy_opt.onnx"] = os.path.join(export_dir, "policy_opt.onnx")
+    optimize_offline(folded_path, variants["policy_opt.onnx"])
+    if int8:
+        from onnxruntime.quantization import QuantType, quantize_dynamic
+
+        variants["policy_int8.onnx"] = os.path.join(export_dir, "policy_int8.onnx")
+        quantize_dynamic(folded_path, variants["policy_int8.onnx"], weight_type=QuantType.QInt8)
+    if fp16:
+        variants["policy_fp16.onnx"] = os.path.join(export_dir, "policy_fp16.onnx")
+        onnx.save(convert_fp16(model), variants["policy_fp16.onnx"])
+    os.remove(folded_path)
+
+    reference = None
+    report = {"num_samples": len(obs), "num_threads": num_threads, "normalizer_folded": folded, "variants": {}}
+    for name, path in variants.items():
+        entry = {"size_kb": round(os.path.getsize(path) / 1024, 1)}
+        try:
+            outputs, latency = _run_all(_session(path, num_threads), obs)
+        except Exception as e:  # e.g. no FP16 kernels for this CPU
+            entry["error"] = str(e).splitlines()[0]
+            report["variants"][name] = entry
+            continue
+        if reference is None:
+            reference = outputs.astype(np.float64)
+        error = np.abs(outputs - reference)
+        entry.update(
+            {
+                "latency_us": {q: float(f"{np.percentile(latency, p):.1f}") for q, p in (("p50", 50), ("p99", 99))},
+                "max_abs_error": float(f"{error.max():.3g}"),
+                "mean_abs_error": float(f"{error.mean():.3g}"),
+            }
+        )
+        report["variants"][name] = entry
+
+    valid = {k: v for k, v in report["variants"].items() if "error" not in v and v["max_abs_error"] <= tolerance}
+    report["recommended"] = min(valid, key=lambda k: valid[k]["latency_us"]["p50"]) if valid else "policy.onnx"
+
+    print(f"[INFO]: Optimized policy variants ({len(obs)} observations, {num_threads} thread(s)):")
+    print(f"  {'variant':<18}{'size [KiB]':>12}{'p50 [us]':>10}{'p99 [us]':>10}{'max err':>11}{'mean err':>11}")
+    for name, entry in report["variants"].items():
+        if "error" in entry:
+            print(f"  {name:<18}{entry['size_kb']:>12}  unsupported: {entry['error']}")
+            continue
+        latency = entry["latency_us"]
+        print(
+            f"  {name:<18}{entry['size_kb']:>12}{latency['p50']:>10}{latency['p99']:>10}"
+            f"{entry['max_abs_error']:>11.2e}{entry['mean_abs_error']:>11.2e}"
+        )
+    print(f"[INFO]: Fastest variant within {tolerance:g} action tolerance: {report['recommended']}")
+
+    with open(os.path.join(export_dir, "optimize_report.yaml"), "w") as f:
+        yaml.dump(report, f, sort_keys=False)
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Optimize an exported policy and compare the variants.")
+    parser.add_argument("policy_dir", type=str, help="Directory with exported/policy.onnx.")
+    parser.add_argument("--obs", type=str, required=True, help="Recorded observations (csv, npy or npz).")
+    parser.add_argument("--int8", action="store_true", default=False, help="Write a dynamic INT8 variant.")
+    parser.add_argument("--fp16", action="store_true", default=False, help="Write an FP16 variant.")
+    parser.add_argument("--tolerance", type=float, default=1e-3, help="Max abs action error of a variant.")
+    parser.add_argument("--threads", type=int, default=1, help="Intra-op threads for the latency measurement.")
+    args = parser.parse_args()
+
+    optimize_policy(
+        os.path.join(args.policy_dir, "exported"),
+        load_observations(args.obs),
+        int8=args.int8,
+        fp16=args.fp16,
+        tolerance=args.tolerance,
+        num_threads=args.threads,
+    )
+
+
+if __name__ == "__main__":
+    main()
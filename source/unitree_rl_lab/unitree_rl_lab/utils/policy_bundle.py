@@ -0,0 +1,212 @@
+"""Single-file policy bundle for the deploy runtime.
+
+A bundle packs everything the robot needs to run a policy into one versioned file::
+
+    policy.onnx      exported graph (normalizer included)
+    deploy.yaml      deploy config written by ``export_deploy_cfg``
+    obs_layout.yaml  name, dim, history length and offset of every policy observation term
+    normalizer       optional, uint32 dim, float32 eps, float32 mean[dim], float32 std[dim]
+    motion           optional, uint32 num_frames, uint32 num_dofs, float32 fps, uint32 reserved,
+                     float32 frames[num_frames][7 + num_dofs] laid out as the deploy motion csv:
+                     root pos (3), root quat xyzw (4), dof pos in sdk order
+
+File layout (little endian)::
+
+    header   64 bytes: char[8] "URLBNDL", uint32 version, uint32 num_sections, uint64 file_size,
+                       uint32 crc32 of the section table, zero padding
+    table    num_sections x 64 bytes: char[40] name, uint64 offset, uint64 size, uint32 crc32, uint32 reserved
+    sections each aligned to 64 bytes
+
+It is read by ``deploy/include/isaaclab/utils/policy_bundle.h`` with a single mmap. This module only
+depends on numpy and yaml, so bundles can also be rebuilt from an existing log directory::
+
+    python -m unitree_rl_lab.utils.policy_bundle logs/rsl_rl/<experiment>/<run>
+    python -m unitree_rl_lab.utils.policy_bundle <policy_dir> --motion-csv motion.csv --fps 60
+"""
+
+from __future__ import annotations
+
+import argparse
+import numpy as np
+import os
+import struct
+import yaml
+import zlib
+
+MAGIC = b"URLBNDL\0"
+VERSION = 1
+HEADER_SIZE = 64
+ENTRY_SIZE = 64
+NAME_SIZE = 40
+ALIGNMENT = 64
+
+_HEADER = struct.Struct("<8sIIQI")
+_ENTRY = struct.Struct(f"<{NAME_SIZE}sQQII")
+_MOTION_HEADER = struct.Struct("<IIfI")
+
+
+def _align(offset: int) -> int:
+    return (offset + ALIGNMENT - 1) // ALIGNMENT * ALIGNMENT
+
+
+def write_bundle(path: str, sections: dict[str, bytes]):
+    """Write raw sections to a bundle file, replacing it atomically."""
+    table = bytearray()
+    offset = _align(HEADER_SIZE + ENTRY_SIZE * len(sections))
+    layout = []
+    for name, data in sections.items():
+        encoded = name.encode()
+        if len(encoded) >= NAME_SIZE:
+            raise ValueError(f"Section name '{name}' is longer than {NAME_SIZE - 1} bytes.")
+        table += _ENTRY.pack(encoded, offset, len(data), zlib.crc32(data), 0)
+        layout.append((offset, data))
+        offset = _align(offset + len(data))
+    file_size = layout[-1][0] + len(layout[-1][1]) if layout else len(table) + HEADER_SIZE
+
+    header = _HEADER.pack(MAGIC, VERSION, len(sections), file_size, zlib.crc32(table))
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(header.ljust(HEADER_SIZE, b"\0"))
+        f.write(table)
+        for offset, data in layout:
+            f.write(b"\0" * (offset - f.tell()))
+            f.write(data)
+    os.replace(tmp_path, path)
+
+
+def read_bundle(path: str) -> dict[str, bytes]:
+    """Read and verify all sections of a bundle file."""
+    with open(path, "rb") as f:
+        buffer = f.read()
+    magic, version, num_sections, file_size, table_crc = _HEADER.unpack_from(buffer)
+    if magic != MAGIC:
+        raise ValueError(f"{path} is not a policy bundle.")
+    if version != VERSION:
+        raise ValueError(f"Unsupported policy bundle version {version} in {path}.")
+    if file_size != len(buffer):
+        raise ValueError(f"{path} is truncated: expected {file_size} bytes, got {len(buffer)}.")
+    table = buffer[HEADER_SIZE : HEADER_SIZE + ENTRY_SIZE * num_sections]
+    if zlib.crc32(table) != table_crc:
+        raise ValueError(f"Corrupted section table in {path}.")
+
+    sections = {}
+    for i in range(num_sections):
+        name, offset, size, crc, _ = _ENTRY.unpack_from(table, i * ENTRY_SIZE)
+        name = name.rstrip(b"\0").decode()
+        data = buffer[offset : offset + size]
+        if len(data) != size or zlib.crc32(data) != crc:
+            raise ValueError(f"Checksum mismatch in section '{name}' of {path}.")
+        sections[name] = data
+    return sections
+
+
+def obs_layout(deploy_cfg: dict) -> list[dict]:
+    """Position of every policy observation term in the flattened observation vector."""
+    layout = []
+    offset = 0
+    for name, term in deploy_cfg["observations"].items():
+        dim = len(term["scale"])
+        history_length = term.get("history_length", 1)
+        layout.append({"name": name, "dim": dim, "history_length": history_length, "offset": offset})
+        offset += dim * history_length
+    return layout
+
+
+def normalizer_section(mean, std, eps: float = 1e-2) -> bytes:
+    mean = np.asarray(mean, dtype=np.float32).reshape(-1)
+    std = np.asarray(std, dtype=np.float32).reshape(-1)
+    if mean.shape != std.shape:
+        raise ValueError(f"Normalizer mean {mean.shape} and std {std.shape} do not match.")
+    return struct.pack("<If", mean.size, eps) + mean.tobytes() + std.tobytes()
+
+
+def motion_section(frames: np.ndarray, fps: float) -> bytes:
+    """Motion track with one row per frame, laid out as the deploy motion csv."""
+    frames = np.ascontiguousarray(frames, dtype=np.float32)
+    if frames.ndim != 2 or frames.shape[1] <= 7:
+        raise ValueError(f"Expected motion frames of shape (num_frames, 7 + num_dofs), got {frames.shape}.")
+    return _MOTION_HEADER.pack(frames.shape[0], frames.shape[1] - 7, fps, 0) + frames.tobytes()
+
+
+def motion_from_csv(motion_file: str) -> np.ndarray:
+    return np.loadtxt(motion_file, delimiter=",", dtype=np.float32, ndmin=2)
+
+
+def motion_from_npz(motion_file: str, joint_ids_map: list[int]) -> tuple[np.ndarray, float]:
+    """Convert a training motion (see ``scripts/mimic/csv_to_npz.py``) to deploy frames.
+
+    The npz stores joint positions in simulation order and body poses with wxyz quaternions,
+    the deploy loader expects the root body pose with an xyzw quaternion and joints in sdk order.
+    """
+    data = np.load(motion_file)
+    joint_pos = data["joint_pos"]
+    dof_pos = np.zeros_like(joint_pos)
+    dof_pos[:, joint_ids_map] = joint_pos
+    root_pos = data["body_pos_w"][:, 0]
+    root_quat = data["body_quat_w"][:, 0][:, [1, 2, 3, 0]]
+    frames = np.concatenate([root_pos, root_quat, dof_pos], axis=1)
+    return frames, float(np.asarray(data["fps"]).reshape(-1)[0])
+
+
+def build_policy_bundle(
+    policy_dir: str,
+    filename: str = "policy.bundle",
+    normalizer: tuple | None = None,
+    motion: tuple[np.ndarray, float] | None = None,
+) -> str:
+    """Bundle ``params/deploy.yaml`` and ``exported/policy.onnx`` of a policy directory.
+
+    Args:
+        policy_dir: Log directory of the run, containing ``params`` and ``exported``.
+        filename: Name of the bundle, written to ``<policy_dir>/exported``.
+        normalizer: Optional ``(mean, std, eps)`` of the observation normalizer, for reference only
+            since the exported graph already applies it.
+        motion: Optional ``(frames, fps)`` motion track for mimic policies.
+
+    Returns:
+        Path of the written bundle.
+    """
+    with open(os.path.join(policy_dir, "params", "deploy.yaml"), "rb") as f:
+        deploy_cfg_data = f.read()
+    with open(os.path.join(policy_dir, "exported", "policy.onnx"), "rb") as f:
+        onnx_data = f.read()
+    deploy_cfg = yaml.safe_load(deploy_cfg_data)
+
+    sections = {
+        "policy.onnx": onnx_data,
+        "deploy.yaml": deploy_cfg_data,
+        "obs_layout.yaml": yaml.dump(obs_layout(deploy_cfg), sort_keys=False).encode(),
+    }
+    if normalizer is not None:
+        sections["normalizer"] = normalizer_section(*normalizer)
+    if motion is not None:
+        sections["motion"] = motion_section(*motion)
+
+    path = os.path.join(policy_dir, "exported", filename)
+    write_bundle(path, sections)
+    print(f"[INFO]: Policy bundle with {', '.join(sections)} saved to {path}")
+    return path
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Bundle an exported policy for the deploy runtime.")
+    parser.add_argument("policy_dir", type=str, help="Directory with params/deploy.yaml and exported/policy.onnx.")
+    parser.add_argument("--filename", type=str, default="policy.bundle", help="Bundle name in <policy_dir>/exported.")
+    parser.add_argument("--motion-csv", type=str, default=None, help="Deploy motion csv to include.")
+    parser.add_argument("--motion-npz", type=str, default=None, help="Training motion npz to include.")
+    parser.add_argument("--fps", type=float, default=60.0, help="Frame rate of --motion-csv.")
+    args = parser.parse_args()
+
+    motion = None
+    if args.motion_csv is not None:
+        motion = (motion_from_csv(args.motion_csv), args.fps)
+    elif args.motion_npz is not None:
+        with open(os.path.join(args.policy_dir, "params", "deploy.yaml")) as f:
+            joint_ids_map = yaml.safe_load(f)["joint_ids_map"]
+        motion = motion_from_npz(args.motion_npz, joint_ids_map)
+    build_policy_bundle(args.policy_dir, filename=args.filename, motion=motion)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""Sensors limited to what the terms of a task read.
+
+A contact sensor on ``{ENV_REGEX_NS}/Robot/.*`` reports the net forces, their history and the air and contact times
+of every body of the robot at every physics step, while the terms only read the feet and a few bodies that must not
+touch the ground. :func:`narrow_contact_sensor` collects the body names of the ``SceneEntityCfg`` of the sensor in
+the parameters of the observation, event, reward, termination and curriculum terms, and replaces the last token of
+the prim path of the sensor by their union::
+
+    contact_forces = ContactSensorCfg(prim_path="{ENV_REGEX_NS}/Robot/.*", history_length=3, track_air_time=True)
+    ...
+    narrow_contact_sensor(self)  # prim_path="{ENV_REGEX_NS}/Robot/(.*_foot|Head_.*|.*_hip|.*_thigh|.*_calf|base)"
+
+The managers resolve the ``body_ids`` of every ``SceneEntityCfg`` against the bodies of the sensor once the scene is
+created, so each term indexes the narrowed sensor with its own body ids, unchanged. Terms added after the call
+must only use bodies the sensor already covers.
+
+:func:`remove_unread_sensors` removes the sensors no term reads from the scene, such as a height scanner whose
+observation is disabled. With the default ``lazy_sensor_update`` an unread sensor is not updated anyway, so this
+saves its creation (the warp meshes and buffers of a ray caster) rather than step time.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from typing import TYPE_CHECKING
+
+from isaaclab.managers import ManagerTermBaseCfg, SceneEntityCfg
+from isaaclab.sensors import SensorBaseCfg
+
+if TYPE_CHECKING:
+    from isaaclab.envs import ManagerBasedRLEnvCfg
+
+MANAGERS = ("observations", "events", "rewards", "terminations", "curriculum")
+"""Attributes of the environment configuration holding terms that can read a sensor."""
+
+
+def _term_cfgs(cfg) -> Iterator[ManagerTermBaseCfg]:
+    """Terms of a manager configuration, including those of the observation groups."""
+    for value in cfg.__dict__.values():
+        if isinstance(value, ManagerTermBaseCfg):
+            yield value
+        elif hasattr(value, "__dataclass_fields__"):
+            yield from _term_cfgs(value)
+
+
+def _sensor_entities(env_cfg: ManagerBasedRLEnvCfg, sensor_name: str) -> Iterator[SceneEntityCfg]:
+    """``SceneEntityCfg`` of the sensor ``sensor_name`` in the parameters of the terms."""
+    for manager_name in MANAGERS:
+        manager_cfg = getattr(env_cfg, manager_name, None)
+        if manager_cfg is None:
+            continue
+        for term_cfg in _term_cfgs(manager_cfg):
+            for param in term_cfg.params.values():
+                if isinstance(param, SceneEntityCfg) and param.name == sensor_name:
+                    yield param
+
+
+def sensed_body_names(env_cfg: ManagerBasedRLEnvCfg, sensor_name: str = "contact_forces") -> list[str] | None:
+    """Body name expressions of the terms reading the sensor ``sensor_name``, in order of first use.
+
+    Returns None when no term reads the sensor, or when one of them reads all its bodies or selects them by ids.
+    """
+    names = []
+    for entity_cfg in _sensor_entities(env_cfg, sensor_name):
+        if entity_cfg.body_names is None:
+            return None
+        for name in [entity_cfg.body_names] if isinstance(entity_cfg.body_names, str) else entity_cfg.body_names:
+            if name not in names:
+                names.append(name)
+    return names or None
+
+
+def narrow_contact_sensor(env_cfg: ManagerBasedRLEnvCfg, sensor_name: str = "contact_forces"):
+    """Limit the bodies of the contact sensor ``sensor_name`` to those its terms read.
+
+    Call it at the end of ``__post_init__``, once the terms of the task are final.
+    """
+    names = sensed_body_names(env_cfg, sensor_name)
+    if names is None:
+        return
+    sensor_cfg = getattr(env_cfg.scene, sensor_name)
+    # a single token of the prim path, matched against the body names by the sensor
+    body_expr = names[0] if len(names) == 1 else "(" + "|".join(names) + ")"
+    sensor_cfg.prim_path = f"{sensor_cfg.prim_path.rpartition('/')[0]}/{body_expr}"
+
+
+def remove_unread_sensors(env_cfg: ManagerBasedRLEnvCfg):
+    """Remove the sensors of the scene that no term reads.
+
+    Call it at the end of ``__post_init__``, once the terms of the task are final.
+    """
+    for name, value in list(env_cfg.scene.__dict__.items()):
+        if isinstance(value, SensorBaseCfg) and next(_sensor_entities(env_cfg, name), None) is None:
+            setattr(env_cfg.scene, name, None)
@@ -0,0 +1,144 @@
+"""Static manifest of the tasks registered by ``unitree_rl_lab.tasks``.
+
+Registering the tasks the usual way imports every robot package, and with it Isaac Lab, which takes seconds.
+Listing tasks and completing ``--task`` on the command line only need the ids and entry points, so this module
+reads them from the ``register`` calls in the task packages' ``__init__.py`` with :mod:`ast`, without
+importing anything. The result is cached in ``$XDG_CACHE_HOME/unitree_rl_lab/task_manifest.json`` and rebuilt
+whenever one of the scanned files changes.
+
+This file has no dependency outside the standard library and can be run directly::
+
+    python source/unitree_rl_lab/unitree_rl_lab/utils/task_registry.py           # task ids, one per line
+    python source/unitree_rl_lab/unitree_rl_lab/utils/task_registry.py --json    # full manifest
+"""
+
+from __future__ import annotations
+
+import argparse
+import ast
+import json
+import os
+import pathlib
+
+TASKS_DIR = pathlib.Path(__file__).resolve().parents[1] / "tasks"
+TASKS_PACKAGE = "unitree_rl_lab.tasks"
+MANIFEST_VERSION = 1
+
+
+def _default_cache_path() -> pathlib.Path:
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return pathlib.Path(cache_home) / "unitree_rl_lab" / "task_manifest.json"
+
+
+def _module_name(init_file: pathlib.Path, tasks_dir: pathlib.Path) -> str:
+    parts = init_file.parent.relative_to(tasks_dir).parts
+    return ".".join((TASKS_PACKAGE,) + parts)
+
+
+def _literal(node: ast.AST, module_name: str):
+    """Evaluate constants, containers and f-strings using ``__name__``, the only forms used by ``gym.register``."""
+    if isinstance(node, ast.JoinedStr):
+        parts = []
+        for value in node.values:
+            if isinstance(value, ast.FormattedValue):
+                if not (isinstance(value.value, ast.Name) and value.value.id == "__name__"):
+                    raise ValueError(f"Unsupported f-string expression: {ast.unparse(value)}")
+                parts.append(module_name)
+            else:
+                parts.append(value.value)
+        return "".join(parts)
+    if isinstance(node, ast.Name) and node.id == "__name__":
+        return module_name
+    if isinstance(node, ast.Dict):
+        return {_literal(k, module_name): _literal(v, module_name) for k, v in zip(node.keys, node.values)}
+    if isinstance(node, (ast.List, ast.Tuple)):
+        return [_literal(e, module_name) for e in node.elts]
+    return ast.literal_eval(node)
+
+
+def _is_register_call(node: ast.AST) -> bool:
+    if not isinstance(node, ast.Call):
+        return False
+    func = node.func
+    if isinstance(func, ast.Attribute):
+        return func.attr == "register" and isinstance(func.value, ast.Name) and func.value.id in ("gym", "gymnasium")
+    return isinstance(func, ast.Name) and func.id == "register"
+
+
+def scan_tasks(tasks_dir: pathlib.Path = TASKS_DIR) -> list[dict]:
+    """Collect the keyword arguments of every ``gym.register`` call below ``tasks_dir``."""
+    tasks = []
+    for init_file in sorted(tasks_dir.rglob("__init__.py")):
+        module_name = _module_name(init_file, tasks_dir)
+        tree = ast.parse(init_file.read_text(), filename=str(init_file))
+        for node in ast.walk(tree):
+            if not _is_register_call(node):
+                continue
+            try:
+                spec = {kw.arg: _literal(kw.value, module_name) for kw in node.keywords if kw.arg is not None}
+            except ValueError as e:
+                raise ValueError(f"Cannot read the task registered at {init_file}:{node.lineno} statically: {e}")
+            spec["module"] = module_name
+            tasks.append(spec)
+    return tasks
+
+
+def _source_stamps(tasks_dir: pathlib.Path) -> dict[str, int]:
+    return {str(f): f.stat().st_mtime_ns for f in sorted(tasks_dir.rglob("__init__.py"))}
+
+
+def load_manifest(tasks_dir: pathlib.Path = TASKS_DIR, cache_path: pathlib.Path | None = None) -> list[dict]:
+    """Tasks of ``tasks_dir``, from the cache if none of the task packages changed since it was written."""
+    cache_path = cache_path or _default_cache_path()
+    stamps = _source_stamps(tasks_dir)
+    try:
+        with open(cache_path) as f:
+            cache = json.load(f)
+        if cache.get("version") == MANIFEST_VERSION and cache.get("sources") == stamps:
+            return cache["tasks"]
+    except (OSError, ValueError):
+        pass
+
+    tasks = scan_tasks(tasks_dir)
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_path, "w") as f:
+            json.dump({"version": MANIFEST_VERSION, "sources": stamps, "tasks": tasks}, f, indent=1)
+        os.replace(tmp_path, cache_path)
+    except OSError:  # read-only home, the manifest is just rebuilt next time
+        pass
+    return tasks
+
+
+def task_ids(tasks_dir: pathlib.Path = TASKS_DIR) -> list[str]:
+    """Ids of all Unitree tasks, as offered by ``train.py --task``."""
+    return [t["id"] for t in load_manifest(tasks_dir) if "Unitree" in t["id"] and "Isaac" not in t["id"]]
+
+
+def register(**spec):
+    """``gym.register`` for task packages, keeping the spec already registered from the manifest."""
+    import gymnasium as gym
+
+    if spec["id"] not in gym.registry:
+        gym.register(**spec)
+
+
+def register_tasks(tasks_dir: pathlib.Path = TASKS_DIR):
+    """Register every task of the manifest with gymnasium, without importing the task packages."""
+    for spec in load_manifest(tasks_dir):
+        register(**{k: v for k, v in spec.items() if k != "module"})
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Print the tasks registered by unitree_rl_lab.")
+    parser.add_argument("--json", action="store_true", default=False, help="Print the full manifest as json.")
+    args = parser.parse_args()
+    if args.json:
+        print(json.dumps(load_manifest(), indent=2))
+    else:
+        print("\n".join(task_ids()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+"""Per-term step-time breakdown of a training run.
+
+:class:`TermProfiler` wraps every term of the managers of a ``ManagerBasedRLEnv`` (rewards, observations,
+commands, events, curriculum, terminations and actions), the simulation stages of ``env.step`` and the PPO
+rollout and update with timers. The time spent in each of them is summed over a learning iteration and written
+to TensorBoard next to the reward curves, under ``Perf/<group>/<term>`` in milliseconds per iteration.
+
+On CUDA the timers are pairs of CUDA events on the current stream, so they measure the time between the start and
+the end of a term on the GPU timeline without synchronizing during the rollout. They are only read when the
+iteration is logged.
+"""
+
+from __future__ import annotations
+
+import time
+import torch
+
+
+class _Timer:
+    """Accumulate the duration of many calls, read once per iteration."""
+
+    def __init__(self, device: str):
+        self.cuda = torch.device(device).type == "cuda"
+        self._pending: list[tuple[torch.cuda.Event, torch.cuda.Event]] = []
+        self._pool: list[tuple[torch.cuda.Event, torch.cuda.Event]] = []
+        self._elapsed = 0.0
+
+    def start(self):
+        if not self.cuda:
+            return time.perf_counter()
+        events = self._pool.pop() if self._pool else (torch.cuda.Event(True), torch.cuda.Event(True))
+        events[0].record()
+        return events
+
+    def stop(self, token):
+        if not self.cuda:
+            self._elapsed += (time.perf_counter() - token) * 1e3
+            return
+        token[1].record()
+        self._pending.append(token)
+
+    def collect(self) -> float:
+        """Milliseconds spent since the last call. The events must have completed."""
+        elapsed = self._elapsed + sum(start.elapsed_time(end) for start, end in self._pending)
+        self._pool += self._pending
+        self._pending.clear()
+        self._elapsed = 0.0
+        return elapsed
+
+
+class _TimedCall:
+    """Callable timing ``func``, forwarding attribute access so that class-based terms keep their ``reset``."""
+
+    def __init__(self, func, timer: _Timer):
+        self._func = func
+        self._timer = timer
+
+    def __call__(self, *args, **kwargs):
+        token = self._timer.start()
+        try:
+            return self._func(*args, **kwargs)
+        finally:
+            self._timer.stop(token)
+
+    def __getattr__(self, name):
+        if name == "_func":  # not yet set, e.g. while copied
+            raise AttributeError(name)
+        return getattr(self._func, name)
+
+
+class TermProfiler:
+    """Time the terms of ``env`` and the learning steps of ``runner``, logging them with the runner.
+
+    Args:
+        env: The unwrapped ``ManagerBasedRLEnv``.
+        runner: The RSL-RL ``OnPolicyRunner`` training on ``env``. Its ``log`` is extended to write the timings.
+    """
+
+    def __init__(self, env, runner):
+        self.env = env
+        self.runner = runner
+        self._timers: dict[str, _Timer] = {}
+        if runner.disable_logs:  # other ranks of a distributed run never log
+            return
+
+        for name, term_cfg in zip(env.reward_manager._term_names, env.reward_manager._term_cfgs):
+            self._wrap_cfg(f"Reward/{name}", term_cfg)
+        for group, names in env.observation_manager._group_obs_term_names.items():
+            for name, term_cfg in zip(names, env.observation_manager._group_obs_term_cfgs[group]):
+                self._wrap_cfg(f"Observation/{group}/{name}", term_cfg)
+        for name, term_cfg in zip(env.termination_manager._term_names, env.termination_manager._term_cfgs):
+            self._wrap_cfg(f"Termination/{name}", term_cfg)
+        for name, term_cfg in zip(env.curriculum_manager._term_names, env.curriculum_manager._term_cfgs):
+            self._wrap_cfg(f"Curriculum/{name}", term_cfg)
+        for mode, names in env.event_manager._mode_term_names.items():
+            for name, term_cfg in zip(names, env.event_manager._mode_term_cfgs[mode]):
+                self._wrap_cfg(f"Event/{mode}/{name}", term_cfg)
+        for name, term in env.command_manager._terms.items():
+            self._wrap_method(f"Command/{name}", term, "compute")
+        for name, term in env.action_manager._terms.items():
+            self._wrap_method(f"Action/{name}", term, "process_actions")
+            self._wrap_method(f"Action/{name}", term, "apply_actions")
+
+        # actuator models run when the joint commands are written to the simulation
+        self._wrap_method("Sim/write_data", env.scene, "write_data_to_sim")
+        self._wrap_method("Sim/physics", env.sim, "step")
+        self._wrap_method("Sim/scene_update", env.scene, "update")
+        self._wrap_method("Env/step", runner.env, "step")
+        self._wrap_method("Learn/act", runner.alg, "act")
+        self._wrap_method("Learn/update", runner.alg, "update")
+
+        self._runner_log = runner.log
+        runner.log = self._log
+
+    def _timer(self, key: str) -> _Timer:
+        if key not in self._timers:
+            self._timers[key] = _Timer(self.env.device)
+        return self._timers[key]
+
+    def _wrap_cfg(self, key: str, term_cfg):
+        term_cfg.func = _TimedCall(term_cfg.func, self._timer(key))
+
+    def _wrap_method(self, key: str, obj, name: str):
+        setattr(obj, name, _TimedCall(getattr(obj, name), self._timer(key)))
+
+    def _log(self, locs: dict, *args, **kwargs):
+        """``OnPolicyRunner.log``, followed by the timings of the iteration."""
+        result = self._runner_log(locs, *args, **kwargs)
+        if torch.device(self.env.device).type == "cuda":
+            torch.cuda.synchronize(self.env.device)
+        for key, timer in self._timers.items():
+            self.runner.writer.add_scalar(f"Perf/{key}", timer.collect(), locs["it"])
+        return result
@@ -0,0 +1,202 @@
+"""Terrain generator reusing the terrain of a previous launch with the same configuration.
+
+``TerrainGenerator`` builds the meshes of all the sub-terrains, concatenates them and searches the flat patches at
+every launch. Its own cache (``use_cache``) only saves the meshes of the sub-terrains as ``.obj`` files, which are
+slow to parse and still have to be concatenated. :class:`CachedTerrainGenerator` instead stores what the terrain
+importer reads from the generator (the combined mesh, the origins of the sub-terrains and the flat patches) in a
+single ``.npz`` file of raw arrays, keyed by the md5 hash of the whole generator configuration and its seed.
+
+The heights of the terrain are also sampled on a regular grid of ``cfg.horizontal_scale`` when the terrain is
+generated, and kept in the same file. :func:`height_field` returns them as a :class:`HeightField`, for the terms that
+look the terrain height up below points instead of casting rays against the mesh at every step.
+
+With several processes on a machine (multi-GPU training), only the local rank 0 generates a missing terrain, the
+other ranks wait for its file and all of them train on the same terrain (see :func:`terrain_seed`). Files are
+written to a temporary name and renamed, so a terrain file is never read partially written.
+
+Select it in a terrain generator configuration::
+
+    COBBLESTONE_ROAD_CFG = terrain_gen.TerrainGeneratorCfg(..., class_type=CachedTerrainGenerator)
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import os
+import time
+import torch
+import trimesh
+
+from isaaclab.terrains import TerrainGenerator, TerrainGeneratorCfg
+from isaaclab.utils.dict import dict_to_md5_hash
+from isaaclab.utils.warp import convert_to_warp_mesh, raycast_mesh
+
+CACHE_VERSION = 2
+"""Version of the content of the cache files, part of their key."""
+
+WAIT_TIMEOUT = 600.0
+"""Seconds the ranks other than 0 wait for the terrain generated by rank 0 before generating it themselves."""
+
+
+class HeightField:
+    """Heights of a terrain on a regular grid of the xy-plane, interpolated bilinearly in between.
+
+    Steps and box edges are smoothed over one cell, and points outside the grid get the height of its border.
+    """
+
+    def __init__(self, heights: torch.Tensor, origin: tuple[float, float], resolution: float):
+        self.heights = heights
+        """Heights at the grid points (m). Shape is (num_x, num_y)."""
+        self.origin = origin
+        """Position of the grid point ``heights[0, 0]`` in the xy-plane (m)."""
+        self.resolution = resolution
+        """Distance between two grid points (m)."""
+
+    @classmethod
+    def from_mesh(cls, mesh: trimesh.Trimesh, resolution: float, device: str) -> HeightField:
+        """Sample the heights of ``mesh`` by casting vertical rays onto it."""
+        (x_min, y_min, _), (x_max, y_max, z_max) = mesh.bounds.tolist()
+        x = torch.arange(int((x_max - x_min) / resolution) + 1, device=device) * resolution + x_min
+        y = torch.arange(int((y_max - y_min) / resolution) + 1, device=device) * resolution + y_min
+        ray_starts = torch.stack(
+            [*torch.meshgrid(x, y, indexing="ij"), torch.full((len(x), len(y)), z_max + 1.0, device=device)], dim=-1
+        ).view(-1, 3)
+        ray_directions = torch.zeros_like(ray_starts)
+        ray_directions[:, 2] = -1.0
+        wp_mesh = convert_to_warp_mesh(mesh.vertices, mesh.faces, device=device)
+        heights = raycast_mesh(ray_starts, ray_directions, wp_mesh)[0][:, 2].view(len(x), len(y))
+        # rays missing the mesh (holes of the terrain) get its lowest height
+        heights = torch.where(heights.isinf(), heights[~heights.isinf()].min(), heights)
+        return cls(heights, (x_min, y_min), resolution)
+
+    def sample(self, points: torch.Tensor) -> torch.Tensor:
+        """Heights of the terrain below ``points``. Shape is (..., 2) or (..., 3), returns (...)."""
+        num_x, num_y = self.heights.shape
+        u = ((points[..., 0] - self.origin[0]) / self.resolution).clamp(0, num_x - 1)
+        v = ((points[..., 1] - self.origin[1]) / self.resolution).clamp(0, num_y - 1)
+        i = u.long().clamp(max=num_x - 2)
+        j = v.long().clamp(max=num_y - 2)
+        du = u - i
+        dv = v - j
+        heights = self.heights.view(-1)
+        index = i * num_y + j
+        return torch.lerp(
+            torch.lerp(heights[index], heights[index + num_y], du),
+            torch.lerp(heights[index + 1], heights[index + num_y + 1], du),
+            dv,
+        )
+
+
+_HEIGHT_FIELDS: dict[int, tuple[TerrainGeneratorCfg, HeightField]] = {}
+"""Height fields of the terrains generated in this process, by id of their configuration."""
+
+
+def height_field(cfg: TerrainGeneratorCfg) -> HeightField | None:
+    """Height field of the terrain generated from ``cfg`` in this process, None when it has none."""
+    cfg_and_field = _HEIGHT_FIELDS.get(id(cfg))
+    return cfg_and_field[1] if cfg_and_field is not None and cfg_and_field[0] is cfg else None
+
+
+def register_height_field(cfg: TerrainGeneratorCfg, field: HeightField):
+    """Make ``field`` the height field of the terrain generated from ``cfg``."""
+    _HEIGHT_FIELDS[id(cfg)] = (cfg, field)
+
+
+def _local_rank() -> int:
+    return int(os.environ.get("LOCAL_RANK", 0))
+
+
+def terrain_seed(cfg: TerrainGeneratorCfg) -> int:
+    """Seed of the terrain generated from ``cfg``, the same on all the ranks of a multi-GPU training.
+
+    Without a seed in the configuration, ``TerrainGenerator`` uses the global numpy seed, which
+    ``scripts/rsl_rl/train.py`` sets to the seed of the run plus the local rank in distributed training. The local
+    rank is subtracted back, so that every rank computes the key of the terrain of rank 0.
+    """
+    if cfg.seed is not None:
+        return cfg.seed
+    return (int(np.random.get_state()[1][0]) - _local_rank()) % 2**32
+
+
+def terrain_cache_key(cfg: TerrainGeneratorCfg, seed: int) -> str:
+    """Key of the terrain generated by ``cfg`` with ``seed``."""
+    return dict_to_md5_hash({"cfg": cfg.to_dict(), "seed": int(seed), "version": CACHE_VERSION})
+
+
+class CachedTerrainGenerator(TerrainGenerator):
+    """``TerrainGenerator`` loading the terrain from ``cfg.cache_dir`` when it was generated before.
+
+    The per-sub-terrain cache of the base class (``cfg.use_cache``) is still used when enabled, when the terrain is
+    generated, but it is redundant with this one.
+    """
+
+    def __init__(self, cfg: TerrainGeneratorCfg, device: str = "cpu"):
+        seed = terrain_seed(cfg)
+        self.cache_file = os.path.join(cfg.cache_dir, f"terrain_{terrain_cache_key(cfg, seed)}.npz")
+
+        if not os.path.isfile(self.cache_file) and _local_rank() != 0:
+            self._wait_for_cache()
+        if os.path.isfile(self.cache_file):
+            start = time.perf_counter()
+            self._load(cfg, device, seed)
+            print(f"[INFO]: Loaded the terrain from {self.cache_file} in {time.perf_counter() - start:.2f}s.")
+        else:
+            # generate with the seed of the key, which is not the global one on the ranks other than 0
+            cfg_seed, cfg.seed = cfg.seed, seed
+            try:
+                super().__init__(cfg, device)
+            finally:
+                cfg.seed = cfg_seed
+            self.height_field = HeightField.from_mesh(self.terrain_mesh, cfg.horizontal_scale, device)
+            self._save()
+        register_height_field(cfg, self.height_field)
+
+    def _wait_for_cache(self):
+        deadline = time.monotonic() + WAIT_TIMEOUT
+        while not os.path.isfile(self.cache_file) and time.monotonic() < deadline:
+            time.sleep(0.5)
+        if not os.path.isfile(self.cache_file):
+            print(f"[WARNING]: Terrain {self.cache_file} not written by rank 0, generating it.")
+
+    def _load(self, cfg: TerrainGeneratorCfg, device: str, seed: int):
+        self.cfg = cfg
+        self.device = device
+        self.np_rng = np.random.default_rng(seed)
+        with np.load(self.cache_file) as data:
+            self.terrain_mesh = trimesh.Trimesh(vertices=data["vertices"], faces=data["faces"], process=False)
+            if "vertex_colors" in data:
+                self.terrain_mesh.visual.vertex_colors = data["vertex_colors"]
+            self.terrain_origins = data["terrain_origins"]
+            self.flat_patches = {
+                key.removeprefix("flat_patches/"): torch.tensor(data[key], device=device)
+                for key in data.files
+                if key.startswith("flat_patches/")
+            }
+            self.height_field = HeightField(
+                torch.tensor(data["height_field"], device=device),
+                tuple(data["height_field_origin"].tolist()),
+                float(data["height_field_resolution"]),
+            )
+        # the sub-terrain meshes are not stored, the combined one stands for all of them
+        self.terrain_meshes = [self.terrain_mesh]
+
+    def _save(self):
+        arrays = {
+            "vertices": np.asarray(self.terrain_mesh.vertices, dtype=np.float32),
+            "faces": np.asarray(self.terrain_mesh.faces, dtype=np.int32),
+            "terrain_origins": self.terrain_origins,
+            "height_field": self.height_field.heights.cpu().numpy(),
+            "height_field_origin": np.asarray(self.height_field.origin),
+            "height_field_resolution": np.asarray(self.height_field.resolution),
+        }
+        if self.terrain_mesh.visual.kind == "vertex":
+            arrays["vertex_colors"] = np.asarray(self.terrain_mesh.visual.vertex_colors)
+        for name, patches in self.flat_patches.items():
+            arrays[f"flat_patches/{name}"] = patches.cpu().numpy()
+
+        os.makedirs(self.cfg.cache_dir, exist_ok=True)
+        tmp_file = f"{self.cache_file}.{os.getpid()}.tmp"
+        with open(tmp_file, "wb") as f:
+            np.savez(f, **arrays)
+        os.replace(tmp_file, self.cache_file)
+        print(f"[INFO]: Saved the terrain to {self.cache_file}.")
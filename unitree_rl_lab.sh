@@ -26,7 +26,22 @@ _ut_rl_lab_python_argcomplete_wrapper() {
                     _ARGCOMPLETE_SUPPRESS_SPACE=$SUPPRESS_SPACE \
                     ${python_exe} ${UNITREE_RL_LAB_PATH}/scripts/rsl_rl/train.py 8>&1 9>&2 1>/dev/null 2>/dev/null) )
 }
-complete -o nospace -F _ut_rl_lab_python_argcomplete_wrapper "./unitree_rl_lab.sh"
+
+# task names come from the cached task manifest (milliseconds), other arguments from argcomplete
+_ut_rl_lab_complete() {
+    local cur="${COMP_WORDS[COMP_CWORD]}"
+    local prev="${COMP_WORDS[COMP_CWORD-1]}"
+    if [[ "${prev}" == "=" && "${COMP_WORDS[COMP_CWORD-2]}" == "--task" ]]; then
+        prev="--task"
+    fi
+    if [[ "${prev}" == "--task" ]]; then
+        local tasks=$(${python_exe} ${UNITREE_RL_LAB_PATH}/source/unitree_rl_lab/unitree_rl_lab/utils/task_registry.py 2>/dev/null)
+        COMPREPLY=( $(compgen -W "${tasks}" -- "${cur}") )
+    else
+        _ut_rl_lab_python_argcomplete_wrapper
+    fi
+}
+complete -o nospace -F _ut_rl_lab_complete "./unitree_rl_lab.sh"
 
 
 _ut_setup_conda_env() {
@@ -74,6 +89,10 @@ case "$1" in
         shift
         ${python_exe} ${UNITREE_RL_LAB_PATH}/scripts/rsl_rl/play.py "$@"
         ;;
+    -e|--export)
+        shift
+        ${python_exe} ${UNITREE_RL_LAB_PATH}/scripts/rsl_rl/export.py "$@"
+        ;;
     -t|--train)
         shift
         ${python_exe} ${UNITREE_RL_LAB_PATH}/scripts/rsl_rl/train.py --headless "$@"